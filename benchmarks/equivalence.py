@@ -0,0 +1,218 @@
+import argparse
+import random
+import sys
+from typing import Callable, Dict, List, Optional
+from src.dispatcher import NonPreemptiveDispatcher
+from src.online import OnlineScheduler, CompletionEvent
+from src.process import Process, SchedulingResult
+from src.scheduling_algorithms import SchedulingAlgorithm, ALGORITHMS
+from src.smp import MulticoreScheduler, PLACEMENTS
+from src.vectorized_fcfs import HAS_NUMPY, VectorizedFCFS, schedule_fcfs_batch
+
+CONTEXT_SWITCH_TIMES = (0, 0.001, 0.5, 1)
+
+def random_workload(rng: random.Random, max_size: int = 30) -> List[Process]:
+    # Kesirli varış ve patlama süreleri kayan nokta birikimindeki sapmaları ortaya çıkarır
+    processes = []
+    arrival_time = 0.0
+    for i in range(rng.randint(1, max_size)):
+        arrival_time = round(arrival_time + rng.choice([0, 0, 0.25, 1, rng.uniform(0, 4)]), 2)
+        burst_time = rng.choice([1, 2.5, round(rng.uniform(0.1, 9), 2)])
+        processes.append(Process(f"P{i:03d}", arrival_time, burst_time, rng.choice(["high", "normal", "low"])))
+    return processes
+
+def reference_preemptive(algorithm_name: str, processes: List[Process], context_switch_time,
+                         order_key: Callable[[Process], object]) -> SchedulingResult:
+    # İlk sürümdeki birim birim döngü: her birimde hazır süreçler yeniden sıralanır
+    for process in processes:
+        process.reset()
+    
+    time_slots = []
+    current_time = 0
+    context_switches = 0
+    completed_count = 0
+    current_process = None
+    
+    while completed_count < len(processes):
+        ready_processes = [p for p in processes if p.arrival_time <= current_time and p.remaining_time > 0]
+        if ready_processes:
+            next_process = min(ready_processes, key=order_key)
+            if current_process is not next_process:
+                if current_process is not None and current_process.remaining_time > 0:
+                    context_switches += 1
+                    current_time += context_switch_time
+                if next_process.start_time is None:
+                    next_process.start_time = current_time
+                current_process = next_process
+            
+            execution_time = min(1, current_process.remaining_time)
+            start_time = current_time
+            current_time += execution_time
+            current_process.remaining_time -= execution_time
+            time_slots.append((current_process.process_id, start_time, current_time))
+            
+            if current_process.remaining_time == 0:
+                current_process.completion_time = current_time
+                completed_count += 1
+                current_process = None
+        else:
+            next_arrival = min(p.arrival_time for p in processes if p.remaining_time > 0)
+            time_slots.append(("IDLE", current_time, next_arrival))
+            current_time = next_arrival
+    
+    return SchedulingResult(algorithm_name, time_slots, processes, context_switches, current_time)
+
+def merge_slots(time_slots) -> List[tuple]:
+    merged = []
+    for slot in time_slots:
+        process_id, start_time, end_time = slot if isinstance(slot, tuple) else (
+            slot.process_id, slot.start_time, slot.end_time)
+        if merged and merged[-1][0] == process_id != "IDLE" and merged[-1][2] == start_time:
+            merged[-1] = (process_id, merged[-1][1], end_time)
+        else:
+            merged.append((process_id, start_time, end_time))
+    return merged
+
+def snapshot(result: SchedulingResult) -> tuple:
+    # Bitişik dilimler birleştirilir; karşılaştırma zaman değerleri üzerinde tam eşitliktir
+    return (merge_slots(result.time_slots), result.context_switches, result.total_time,
+            [(p.process_id, p.start_time, p.completion_time) for p in result.processes])
+
+def _copy(processes: List[Process]) -> List[Process]:
+    return [Process(p.process_id, p.arrival_time, p.cpu_burst_time, p.priority) for p in processes]
+
+def check_preemptive_sjf(processes: List[Process], context_switch_time) -> bool:
+    reference = reference_preemptive("Preemptive SJF", _copy(processes), context_switch_time,
+                                     lambda p: p.remaining_time)
+    result = SchedulingAlgorithm(context_switch_time).schedule_preemptive_sjf(_copy(processes))
+    return snapshot(result) == snapshot(reference)
+
+def check_preemptive_priority(processes: List[Process], context_switch_time) -> bool:
+    reference = reference_preemptive("Preemptive Priority", _copy(processes), context_switch_time,
+                                     lambda p: (-p.priority.value, p.arrival_time))
+    result = SchedulingAlgorithm(context_switch_time).schedule_preemptive_priority(_copy(processes))
+    return snapshot(result) == snapshot(reference)
+
+def check_vectorized_fcfs(processes: List[Process], context_switch_time) -> bool:
+    # Kapalı form motor eşik altındaki iş yüklerinde de döngülü dağıtıcıyla bit düzeyinde aynı olmalıdır
+    dispatcher = NonPreemptiveDispatcher("FCFS", key=lambda w, i: w.arrival_times[i],
+                                         context_switch_time=context_switch_time)
+    expected = snapshot(dispatcher.run(_copy(processes)))
+    batch = schedule_fcfs_batch([_copy(processes), _copy(processes)], context_switch_time)
+    return (snapshot(VectorizedFCFS(context_switch_time).run(_copy(processes))) == expected
+            and snapshot(batch.result(1)) == expected)
+
+def online_check(algorithm_name: str, method_name: str, kwargs: dict) -> Callable[[List[Process], float], bool]:
+    # Akış halinde beslenen çevrimiçi zamanlayıcı, toplu motorla aynı zaman çizelgesini üretmelidir
+    def check(processes: List[Process], context_switch_time) -> bool:
+        expected = snapshot(getattr(SchedulingAlgorithm(context_switch_time), method_name)(_copy(processes), **kwargs))
+        scheduler = OnlineScheduler(algorithm_name, context_switch_time)
+        time_slots = []
+        times = {}
+        for event in scheduler.stream(sorted(_copy(processes), key=lambda p: p.arrival_time)):
+            if isinstance(event, CompletionEvent):
+                times[event.process_id] = (event.start_time, event.completion_time)
+            else:
+                time_slots.append(event)
+        summary = scheduler.summary()
+        return (merge_slots(time_slots), summary['context_switches'], summary['total_time'],
+                [(p.process_id, *times[p.process_id]) for p in processes]) == expected
+    return check
+
+def online_advance_check(algorithm_name: str, method_name: str, kwargs: dict) -> Callable[[List[Process], float], bool]:
+    # finish() çağrılmadan advance() ile ilerlenir; su seviyesinden önceki tamamlanmalar hemen üretilmelidir
+    def check(processes: List[Process], context_switch_time) -> bool:
+        expected = getattr(SchedulingAlgorithm(context_switch_time), method_name)(_copy(processes), **kwargs)
+        completion_times = {p.process_id: p.completion_time for p in expected.processes}
+        scheduler = OnlineScheduler(algorithm_name, context_switch_time)
+        time_slots = []
+        times = {}
+        
+        def consume(events):
+            for event in events:
+                if isinstance(event, CompletionEvent):
+                    times[event.process_id] = (event.start_time, event.completion_time)
+                else:
+                    time_slots.append(event)
+        
+        for process in sorted(_copy(processes), key=lambda p: p.arrival_time):
+            scheduler.submit(process)
+            consume(scheduler.advance(process.arrival_time))
+            if any(t < process.arrival_time and i not in times for i, t in completion_times.items()):
+                return False
+        consume(scheduler.advance(expected.total_time + 1))
+        if len(times) != len(processes):
+            return False
+        consume(scheduler.finish())
+        summary = scheduler.summary()
+        return (merge_slots(time_slots), summary['context_switches'], summary['total_time'],
+                [(p.process_id, *times[p.process_id]) for p in processes]) == snapshot(expected)
+    return check
+
+def multicore_check(method_name: str, kwargs: dict) -> Callable[[List[Process], float], bool]:
+    # Tek CPU'lu çok çekirdekli benzetim, her yerleştirmede tek çekirdekli motorla aynı sonucu vermelidir
+    def check(processes: List[Process], context_switch_time) -> bool:
+        expected = snapshot(getattr(SchedulingAlgorithm(context_switch_time), method_name)(_copy(processes), **kwargs))
+        return all(snapshot(getattr(MulticoreScheduler(1, placement, context_switch_time), method_name)(
+            _copy(processes), **kwargs)) == expected for placement in PLACEMENTS)
+    return check
+
+# (ad, denetim) — her denetim aynı rastgele iş yükünde motoru başvuru döngüsüyle karşılaştırır
+CHECKS = [
+    ("Preemptive SJF", check_preemptive_sjf),
+    ("Preemptive Priority", check_preemptive_priority)
+] + [(f"SMP (1 CPU) {name}", multicore_check(method_name, kwargs))
+     for name, method_name, kwargs in ALGORITHMS if hasattr(MulticoreScheduler, method_name)]
+CHECKS += [(f"Çevrimiçi {name}", online_check(name, method_name, kwargs))
+           for name, method_name, kwargs in ALGORITHMS if name not in ("CFS", "MLFQ")]
+CHECKS += [(f"Çevrimiçi advance {name}", online_advance_check(name, method_name, kwargs))
+           for name, method_name, kwargs in ALGORITHMS if name not in ("CFS", "MLFQ")]
+# Vektörleştirilmiş FCFS numpy gerektirir; numpy yoksa denetim listeye eklenmez
+if HAS_NUMPY:
+    CHECKS.append(("Vektörleştirilmiş FCFS", check_vectorized_fcfs))
+
+def run_checks(count: int, seed: int, checks=None, progress=None) -> Dict[str, List[int]]:
+    checks = checks or CHECKS
+    failures = {name: [] for name, _ in checks}
+    rng = random.Random(seed)
+    for case in range(count):
+        processes = random_workload(rng)
+        context_switch_time = rng.choice(CONTEXT_SWITCH_TIMES)
+        for name, check in checks:
+            if not check(processes, context_switch_time):
+                failures[name].append(case)
+                if progress is not None:
+                    progress(name, case, processes, context_switch_time)
+    return failures
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Motorların başvuru döngüleriyle eşdeğerlik denetimi")
+    parser.add_argument("--count", type=int, default=2000, help="Rastgele iş yükü sayısı")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--algorithms", type=str, default=None,
+                        help="Virgülle ayrılmış denetim adları (varsayılan: hepsi)")
+    args = parser.parse_args(argv)
+    
+    checks = CHECKS
+    if args.algorithms:
+        selected = {name.strip().lower() for name in args.algorithms.split(',')}
+        checks = [entry for entry in CHECKS if entry[0].lower() in selected]
+        if not checks:
+            parser.error(f"Bilinen denetimler: {', '.join(entry[0] for entry in CHECKS)}")
+    
+    def report(name, case, processes, context_switch_time):
+        print(f"  {name}: #{case} ({len(processes)} süreç, bağlam değiştirme={context_switch_time}) farklı")
+    
+    print(f"Eşdeğerlik denetimi: {args.count} iş yükü x {len(checks)} denetim (tohum={args.seed})")
+    if not HAS_NUMPY:
+        print("  numpy bulunamadı; vektörleştirilmiş FCFS denetimi atlandı")
+    failures = run_checks(args.count, args.seed, checks, report)
+    failed = {name: cases for name, cases in failures.items() if cases}
+    width = max(len(name) for name in failures)
+    for name, cases in failures.items():
+        print(f"  {name:<{width}} {args.count - len(cases)}/{args.count} eşdeğer")
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Dict, List, Optional
+from src.scheduling_algorithms import SchedulingAlgorithm, ALGORITHMS
+from src.workload_generator import WorkloadGenerator, BURST_DISTRIBUTIONS, PRIORITY_MIXES
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000, 1000000]
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+# Bu kadarlık süre farkları ölçüm gürültüsü sayılır
+MIN_TIME_DELTA = 0.005
+
+def run_case(scheduler: SchedulingAlgorithm, method_name: str, kwargs: dict, workload,
+             measure_memory: bool = True, repeat: int = 1) -> Dict[str, float]:
+    wall_time = None
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        start_time = time.perf_counter()
+        result = getattr(scheduler, method_name)(workload, **kwargs)
+        elapsed = time.perf_counter() - start_time
+        wall_time = elapsed if wall_time is None else min(wall_time, elapsed)
+    slot_count = len(result.time_slots)
+    context_switches = result.context_switches
+    del result
+    
+    peak_memory = None
+    if measure_memory:
+        # Bellek ölçümü ayrı bir çalıştırmada yapılır; tracemalloc süre ölçümünü bozmasın
+        gc.collect()
+        tracemalloc.start()
+        result = getattr(scheduler, method_name)(workload, **kwargs)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del result
+    
+    return {
+        "wall_time": wall_time,
+        "peak_memory": peak_memory,
+        "slots": slot_count,
+        "context_switches": context_switches
+    }
+
+def run_suite(sizes: List[int], generator: WorkloadGenerator, algorithms=None, context_switch_time=0.001,
+              measure_memory: bool = True, repeat: int = 1, progress=None) -> dict:
+    algorithms = algorithms or ALGORITHMS
+    scheduler = SchedulingAlgorithm(context_switch_time)
+    measurements = []
+    
+    for size in sizes:
+        workload = generator.generate(size)
+        for algorithm_name, method_name, kwargs in algorithms:
+            measurement = run_case(scheduler, method_name, kwargs, workload, measure_memory,
+                                   repeat if size < 100000 else 1)
+            measurement.update({"size": size, "algorithm": algorithm_name})
+            measurements.append(measurement)
+            if progress is not None:
+                progress(measurement)
+    
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "context_switch_time": context_switch_time,
+        "repeat": repeat,
+        "workload": generator.describe(),
+        "measurements": measurements
+    }
+
+def compare(current: dict, baseline: dict, time_tolerance: float = 0.25,
+            memory_tolerance: float = 0.10) -> List[str]:
+    previous = {(m["size"], m["algorithm"]): m for m in baseline["measurements"]}
+    regressions = []
+    
+    for measurement in current["measurements"]:
+        key = (measurement["size"], measurement["algorithm"])
+        reference = previous.get(key)
+        if reference is None:
+            continue
+        label = f"{measurement['algorithm']} (n={measurement['size']})"
+        
+        if measurement["slots"] != reference["slots"]:
+            regressions.append(f"{label}: dilim sayısı değişti {reference['slots']} -> {measurement['slots']}")
+        if (measurement["wall_time"] > reference["wall_time"] * (1 + time_tolerance)
+                and measurement["wall_time"] - reference["wall_time"] > MIN_TIME_DELTA):
+            regressions.append(f"{label}: süre {reference['wall_time']:.3f}s -> {measurement['wall_time']:.3f}s")
+        if (measurement["peak_memory"] is not None and reference.get("peak_memory") is not None
+                and measurement["peak_memory"] > reference["peak_memory"] * (1 + memory_tolerance)):
+            regressions.append(f"{label}: tepe bellek {reference['peak_memory'] / 1e6:.1f}MB -> "
+                               f"{measurement['peak_memory'] / 1e6:.1f}MB")
+    
+    return regressions
+
+def print_measurement(measurement: dict):
+    memory = (f"{measurement['peak_memory'] / 1e6:9.1f}MB" if measurement["peak_memory"] is not None
+              else f"{'-':>11}")
+    print(f"  {measurement['algorithm']:<25} n={measurement['size']:<8} {measurement['wall_time']:9.3f}s "
+          f"{memory} {measurement['slots']:>10} dilim")
+
+def _baseline_path(name: str) -> str:
+    if name.endswith(".json") or os.sep in name:
+        return name
+    return os.path.join(BASELINE_DIR, f"{name}.json")
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Zamanlama algoritmaları ölçeklenme kıyaslaması")
+    parser.add_argument("--sizes", type=str, default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Virgülle ayrılmış süreç sayıları (varsayılan: 100..1000000)")
+    parser.add_argument("--algorithms", type=str, default=None,
+                        help="Virgülle ayrılmış algoritma adları (varsayılan: hepsi)")
+    parser.add_argument("--seed", type=int, default=341)
+    parser.add_argument("--arrival-rate", type=float, default=0.2, help="Birim zamandaki ortalama varış sayısı")
+    parser.add_argument("--burst", choices=BURST_DISTRIBUTIONS, default="exponential")
+    parser.add_argument("--mean-burst", type=float, default=5.0)
+    parser.add_argument("--priority-mix", choices=sorted(PRIORITY_MIXES), default="uniform")
+    parser.add_argument("--context-switch", type=float, default=0.001)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Küçük boyutlarda süre ölçümünün tekrar sayısı; en iyi süre alınır")
+    parser.add_argument("--no-memory", action="store_true", help="Tepe bellek ölçümünü atla")
+    parser.add_argument("--save", type=str, default=None, help="Sonuçları temel ölçüm olarak kaydet (ad veya yol)")
+    parser.add_argument("--compare", type=str, default=None, help="Kayıtlı temel ölçümle karşılaştır (ad veya yol)")
+    parser.add_argument("--time-tolerance", type=float, default=0.25)
+    parser.add_argument("--memory-tolerance", type=float, default=0.10)
+    args = parser.parse_args(argv)
+    
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    algorithms = ALGORITHMS
+    if args.algorithms:
+        selected = {name.strip().lower() for name in args.algorithms.split(',')}
+        algorithms = [entry for entry in ALGORITHMS if entry[0].lower() in selected]
+        if not algorithms:
+            parser.error(f"Bilinen algoritmalar: {', '.join(entry[0] for entry in ALGORITHMS)}")
+    
+    generator = WorkloadGenerator(args.seed, arrival_rate=args.arrival_rate, burst_distribution=args.burst,
+                                  mean_burst=args.mean_burst, priority_mix=args.priority_mix)
+    print(f"Kıyaslama: {len(sizes)} boyut x {len(algorithms)} algoritma (tohum={args.seed})")
+    report = run_suite(sizes, generator, algorithms, args.context_switch, not args.no_memory,
+                       args.repeat, print_measurement)
+    
+    if args.save:
+        path = _baseline_path(args.save)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Temel ölçüm kaydedildi: {path}")
+    
+    if args.compare:
+        with open(_baseline_path(args.compare), 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get("workload") != report["workload"]:
+            print("Uyarı: temel ölçüm farklı iş yükü parametreleriyle alınmış")
+        regressions = compare(report, baseline, args.time_tolerance, args.memory_tolerance)
+        if regressions:
+            print(f"{len(regressions)} gerileme bulundu:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("Gerileme bulunmadı")
+
+if __name__ == "__main__":
+    main()
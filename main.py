@@ -2,77 +2,194 @@ import os
 import sys
 import argparse
 import time
-from typing import Dict, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from src.csv_parser import parse_csv_file, validate_csv_structure
-from src.scheduling_algorithms import SchedulingAlgorithm
+from typing import Dict, List, Optional
+from src.csv_parser import CsvStreamReader
+from src.binary_workload import load_csv_cached
+from src.scheduling_algorithms import SchedulingAlgorithm, ALGORITHMS
+from src.parallel_runner import ParallelRunner
 from src.result_generator import ResultGenerator
+from src.result_export import EXPORT_FORMATS
+from src.sweep import SweepRunner, parse_values, select_algorithms
+from src.replication import ReplicationRunner
+from src.metrics_accumulator import MetricsAccumulator
+from src.online import OnlineScheduler
+from src.process import Process
+from src.result_cache import ResultCache, DEFAULT_CACHE_DIR
+from src.profiling import Profiler
+from src.smp import MulticoreScheduler, PLACEMENTS
+from src.ticks import TickScale, TickScheduler
+from src.workload import as_workload
 
 class CPUSchedulingSimulator:
-    def __init__(self, context_switch_time=0.001):
-        self.scheduler = SchedulingAlgorithm(context_switch_time)
-        self.result_generator = ResultGenerator()    
+    def __init__(self, context_switch_time=0.001, throughput_horizons=None, use_cache=True, max_workers=None,
+                 stream_timeline=False, timeline_mode="full", timeline_limit=1000, background_write=False,
+                 export_formats=(), use_result_cache=True, result_cache_dir=DEFAULT_CACHE_DIR,
+                 result_cache_size_mb=256, profile=False, cpu_count=1, placement="global", balance_interval=4,
+                 mlfq_levels=3, mlfq_boost_interval=50, time_resolution=None):
+        if cpu_count > 1:
+            self.scheduler = MulticoreScheduler(cpu_count, placement, context_switch_time, balance_interval)
+        elif time_resolution is not None:
+            self.scheduler = TickScheduler(time_resolution, context_switch_time)
+        else:
+            self.scheduler = SchedulingAlgorithm(context_switch_time)
+        # Çok çekirdekli zamanlayıcının desteklemediği algoritmalar (CFS, MLFQ) atlanır
+        self.algorithm_options = {"schedule_mlfq": {"levels": mlfq_levels, "boost_interval": mlfq_boost_interval}}
+        self.algorithms = [entry for entry in self._configure(ALGORITHMS) if hasattr(self.scheduler, entry[1])]
+        self.use_cache = use_cache
+        self.max_workers = max_workers
+        self.profile = profile
+        self.result_cache = None
+        # Profil modunda ölçüm için algoritmalar her seferinde gerçekten çalıştırılır;
+        # önbellek anahtarı tek CPU'yu varsaydığından çok çekirdekli çalıştırmalar da önbelleğe alınmaz
+        if use_result_cache and not stream_timeline and not profile and cpu_count == 1:
+            self.result_cache = ResultCache(result_cache_dir, int(result_cache_size_mb * 1024 * 1024))
+        self.result_generator = ResultGenerator(throughput_horizons=throughput_horizons,
+                                                stream_timeline=stream_timeline,
+                                                timeline_mode=timeline_mode,
+                                                timeline_limit=timeline_limit,
+                                                background=background_write,
+                                                export_formats=export_formats,
+                                                time_decimals=TickScale(time_resolution).decimals
+                                                if time_resolution is not None else 0)    
     def run_all_algorithms(self, processes: List, case_name: str) -> Dict[str, object]:
         print(f"\n{case_name} için tüm zamanlama algoritmaları çalıştırılıyor..")        
-        results = {}        
-        algorithms = [
-            ("FCFS", lambda p: self.scheduler.schedule_fcfs(p)),
-            ("Preemptive SJF", lambda p: self.scheduler.schedule_preemptive_sjf(p)),
-            ("Non-Preemptive SJF", lambda p: self.scheduler.schedule_non_preemptive_sjf(p)),
-            ("Round Robin", lambda p: self.scheduler.schedule_round_robin(p, time_quantum=2)),
-            ("Preemptive Priority", lambda p: self.scheduler.schedule_preemptive_priority(p)),
-            ("Non-Preemptive Priority", lambda p: self.scheduler.schedule_non_preemptive_priority(p))
-        ]    
-        for algorithm_name, algorithm_func in algorithms:
+        results = {}
+        pending_files = []
+        # İş yükü salt okunurdur ve tüm algoritmalarca paylaşılır; her çalıştırma kendi durum
+        # dizilerine (RunState) yazar, süreç nesneleri kopyalanmaz
+        workload = as_workload(processes)        
+        for algorithm_name, method_name, kwargs in self.algorithms:
             print(f"  {algorithm_name} çalıştırılıyor..", end=" ", flush=True)
-            start_time = time.time()    
-            fresh_processes = [self._deep_copy_process(p) for p in processes]
-            result = algorithm_func(fresh_processes)        
-            execution_time = time.time() - start_time
-            print(f"Tamamlandı ({execution_time:.3f}s)")            
+            start_time = time.time()
+            cache_key = None
+            result = None
+            if self.result_cache is not None:
+                cache_key = self.result_cache.key(workload, algorithm_name, kwargs, self.scheduler.context_switch_time,
+                                                  getattr(self.scheduler, "time_resolution", None))
+                result = self.result_cache.get(cache_key, workload)
+            if result is not None:
+                print("Önbellekten alındı")
+            else:
+                sink = self.result_generator.create_timeline_sink(algorithm_name, case_name)
+                profiler = Profiler(track_memory=True) if self.profile else None
+                result = getattr(self.scheduler, method_name)(workload, sink=sink, profiler=profiler, **kwargs)        
+                execution_time = time.time() - start_time
+                print(f"Tamamlandı ({execution_time:.3f}s)")
+                if cache_key is not None:
+                    self.result_cache.put(cache_key, result)            
             results[algorithm_name] = result
-           result_file = self.result_generator.generate_result_file(result, case_name)
-            print(f"    Sonuçlar kaydedildi: {result_file}")
+            result_file = self.result_generator.submit_result_file(result, case_name)
+            if result_file.done():
+                print(f"    Sonuçlar kaydedildi: {result_file.result()}")
+            else:
+                pending_files.append(result_file)
+        
+        for result_file in pending_files:
+            print(f"    Sonuçlar kaydedildi: {result_file.result()}")
         
         comparison_file = self.result_generator.generate_comparison_report(results, case_name)
         print(f"  Karşılaştırma raporu kaydedildi: {comparison_file}")     
         return results
+    
+    def run_parallel(self, file_paths: List[str]) -> Dict[str, Dict[str, object]]:
+        runner = ParallelRunner(self.scheduler.context_switch_time, self.result_generator, self.max_workers,
+                                self.result_cache, self.profile, self.scheduler)
+        print(f"Paralel çalıştırılıyor ({min(runner.max_workers, len(file_paths) * len(self.algorithms))} işçi süreç)...")
+        cases = {}
+        for file_path in file_paths:
+            case_name = self._extract_case_name(file_path)
+            cases[case_name] = self._load_processes(file_path)
+            print(f"{case_name} senaryosundan {len(cases[case_name])} süreç yüklendi")
         
-    def _deep_copy_process(self, process):
-        from src.process import Process, Priority      
-        return Process(
-            process_id=process.process_id,
-            arrival_time=process.arrival_time,
-            cpu_burst_time=process.cpu_burst_time,
-            priority=process.priority
-        ) 
-    def run_with_threading(self, file_paths: List[str]) -> Dict[str, Dict[str, object]]:
-        print("Multi-threading ile çalıştırılıyor...")      
-        results = {}     
-        with ThreadPoolExecutor(max_workers=len(file_paths)) as executor:
-            future_to_case = {
-                executor.submit(self._process_case, file_path): self._extract_case_name(file_path)
-                for file_path in file_paths
-            }       
-            for future in as_completed(future_to_case):
-                case_name = future_to_case[future]
-                try:
-                    case_results = future.result()
-                    results[case_name] = case_results
-                    print(f"{case_name} tamamlandı")
-                except Exception as exc:
-                    print(f"{case_name} senaryosu istisna oluşturdu: {exc}")
+        def report_progress(case_name, algorithm_name, execution_time, result_file):
+            if execution_time is None:
+                print(f"  {case_name} / {algorithm_name} önbellekten alındı")
+            else:
+                print(f"  {case_name} / {algorithm_name} tamamlandı ({execution_time:.3f}s)")
         
+        results = runner.run(cases, self.algorithms, progress=report_progress)
+        for case_name, case_results in results.items():
+            comparison_file = self.result_generator.generate_comparison_report(case_results, case_name)
+            print(f"{case_name} karşılaştırma raporu kaydedildi: {comparison_file}")
         return results
     
+    def _configure(self, algorithms):
+        return [(name, method_name, dict(kwargs, **self.algorithm_options.get(method_name, {})))
+                for name, method_name, kwargs in algorithms]
+    
+    def run_replications(self, replications: int, seed: int = 0, process_count: Optional[int] = None,
+                         source_file: Optional[str] = None, algorithm_names: List[str] = None,
+                         confidence: float = 0.95) -> str:
+        # Replikasyonlar parametre taraması gibi tek çekirdekli zamanlayıcıyla çalıştırılır
+        runner = ReplicationRunner(replications, process_count, seed, self._configure(select_algorithms(algorithm_names)),
+                                   self.scheduler.context_switch_time, self.max_workers,
+                                   self.result_generator.throughput_horizons, confidence)
+        source = self._load_processes(source_file) if source_file else None
+        kind = f"{self._extract_case_name(source_file)} senaryosundan önyükleme" if source_file else "sentetik iş yükü"
+        print(f"Monte Carlo replikasyonu: {replications} {kind}, {len(runner.algorithms)} algoritma, "
+              f"{runner.max_workers} işçi süreç")
+        
+        reported = [0]
+        def report_progress(completed, total):
+            # İlerleme her %10'da bir yazılır
+            decile = completed * 10 // total
+            if decile > reported[0]:
+                reported[0] = decile
+                print(f"  {completed}/{total} replikasyon tamamlandı")
+        
+        summary = runner.run(source, progress=report_progress)
+        report_file = self.result_generator.generate_replication_report(summary)
+        print(f"Replikasyon raporu kaydedildi: {report_file} ({summary.execution_time:.2f}s)")
+        return report_file
+    
+    def run_sweep(self, file_paths: List[str], quanta: List[float], context_switch_times: List[float],
+                  algorithm_names: List[str] = None) -> Dict[str, List[object]]:
+        runner = SweepRunner(quanta, context_switch_times, self._configure(select_algorithms(algorithm_names)),
+                             self.max_workers, self.result_generator.throughput_horizons)
+        grid_size = len(runner.grid())
+        print(f"Parametre taraması: {grid_size} yapılandırma, {runner.max_workers} işçi süreç")
+        
+        sweeps = {}
+        for file_path in file_paths:
+            case_name = self._extract_case_name(file_path)
+            processes = self._load_processes(file_path)
+            print(f"\n{case_name} senaryosundan {len(processes)} süreç yüklendi")
+            
+            def report_progress(point):
+                quantum = "" if point.time_quantum is None else f" kuantum={point.time_quantum:g}"
+                print(f"  {point.algorithm_name}{quantum} bağlam değiştirme={point.context_switch_time:g} "
+                      f"tamamlandı ({point.execution_time:.3f}s)")
+            
+            sweeps[case_name] = runner.run(processes, progress=report_progress)
+            report_file = self.result_generator.generate_sweep_report(sweeps[case_name], case_name)
+            print(f"{case_name} tarama raporu kaydedildi: {report_file}")
+        return sweeps
+    
+    def run_with_threading(self, file_paths: List[str]) -> Dict[str, Dict[str, object]]:
+        return self.run_parallel(file_paths)
+    
     def _process_case(self, file_path: str) -> Dict[str, object]:
         case_name = self._extract_case_name(file_path)
         
-        if not validate_csv_structure(file_path):
+        try:
+            processes = self._load_processes(file_path)
+        except KeyError:
             raise ValueError(f"{file_path} içinde geçersiz CSV yapısı")        
-        processes = parse_csv_file(file_path)
         print(f"\n{case_name} senaryosundan {len(processes)} süreç yüklendi")    
         return self.run_all_algorithms(processes, case_name)    
+    def _load_processes(self, file_path: str):
+        if self.use_cache:
+            processes, errors = load_csv_cached(file_path)
+        else:
+            reader = CsvStreamReader(file_path)
+            processes = reader.read_processes()
+            errors = reader.errors
+        if errors:
+            print(f"Uyarı: {file_path} içinde {len(errors)} geçersiz satır atlandı")
+            for error in errors[:5]:
+                print(f"  {error.line_number}. satır ({error.column or '-'}): {error.message}")
+        return processes
+    
     def _extract_case_name(self, file_path: str) -> str:
         filename = os.path.basename(file_path)
         case_name = filename.replace('.csv', '').replace('.txt', '')
@@ -84,17 +201,66 @@ class CPUSchedulingSimulator:
         print(f"CPU Zamanlama Simülatörü")
         print(f"Dosya işleniyor: {file_path}")
         
-        if not validate_csv_structure(file_path):
+        try:
+            processes = self._load_processes(file_path)
+        except KeyError:
             print(f"Hata: {file_path} içinde geçersiz CSV yapısı")
             return
         
-        processes = parse_csv_file(file_path)
         print(f"{len(processes)} süreç yüklendi")        
         self.run_all_algorithms(processes, case_name)        
         print(f"\n{case_name} için tüm sonuçlar oluşturuldu")
         print(f"Detaylı raporlar için 'results' klasörünü kontrol edin.")
     
-    def run_both_cases(self, use_threading=False):
+    def run_streaming_metrics(self, file_path: str) -> str:
+        # Süreçler CSV'den akış halinde okunur; metrikler tamamlandıkça toplanır, dilimler tutulmaz
+        case_name = self._extract_case_name(file_path)
+        horizons = self.result_generator.throughput_horizons
+        print(f"\n{case_name} için akışlı metrikler hesaplanıyor (sabit bellek)..")
+        
+        entries = []
+        batch_algorithms = []
+        workload = None
+        for algorithm_name, method_name, kwargs in self.algorithms:
+            accumulator = MetricsAccumulator(horizons)
+            try:
+                scheduler = OnlineScheduler(method_name, self.scheduler.context_switch_time,
+                                            kwargs.get("time_quantum"), accumulator=accumulator)
+            except ValueError:
+                scheduler = None
+            
+            print(f"  {algorithm_name} çalıştırılıyor..", end=" ", flush=True)
+            start_time = time.time()
+            if scheduler is None:
+                # Çevrimiçi motoru olmayan algoritmalar (CFS, MLFQ) toplu motorla çalıştırılır; dilimler yine
+                # tutulmaz, ancak iş yükü ve süreç durumu bellekte kalır
+                if workload is None:
+                    workload = as_workload(self._load_processes(file_path))
+                engine = SchedulingAlgorithm(self.scheduler.context_switch_time)
+                result = getattr(engine, method_name)(workload, sink=accumulator, **kwargs)
+                accumulator.add_result(result)
+                print(f"Tamamlandı ({time.time() - start_time:.3f}s, {accumulator.completed_count} süreç, toplu motor)")
+                entries.append((algorithm_name, accumulator.metrics(result.context_switches, result.total_time)))
+                batch_algorithms.append(algorithm_name)
+                continue
+            
+            reader = CsvStreamReader(file_path)
+            rows = (Process(*row) for row in reader.iter_rows())
+            try:
+                for _ in scheduler.stream(rows):
+                    pass
+            except ValueError as e:
+                print(f"\nHata: {e}; akışlı metrikler için CSV varış zamanına göre sıralı olmalıdır")
+                return None
+            summary = scheduler.summary()
+            print(f"Tamamlandı ({time.time() - start_time:.3f}s, {summary['completed']} süreç)")
+            entries.append((algorithm_name, summary['metrics']))
+        
+        report_file = self.result_generator.generate_streaming_report(entries, case_name, batch_algorithms)
+        print(f"Akışlı metrik raporu kaydedildi: {report_file}")
+        return report_file
+    
+    def run_both_cases(self, use_parallel=False):
         data_dir = "data"
         case1_path = os.path.join(data_dir, "case1.csv")
         case2_path = os.path.join(data_dir, "case2.csv")
@@ -106,8 +272,8 @@ class CPUSchedulingSimulator:
         print("CPU Zamanlama Simülatörü")
         print("Her iki test senaryosu işleniyor...")
         
-        if use_threading:
-            results = self.run_with_threading([case1_path, case2_path])
+        if use_parallel:
+            results = self.run_parallel([case1_path, case2_path])
         else:
             results = {}
             
@@ -157,37 +323,155 @@ def main():
     parser = argparse.ArgumentParser(description="CPU Zamanlama Algoritmaları Simülatörü")
     parser.add_argument("--file", "-f", type=str, help="Süreç verilerini içeren CSV dosyasının yolu")
     parser.add_argument("--both", "-b", action="store_true", help="Her iki test senaryosunu çalıştır (case1.csv ve case2.csv)")
-    parser.add_argument("--threading", "-t", action="store_true", help="Paralel çalıştırma için multi-threading kullan")
+    parser.add_argument("--parallel", "-p", "--threading", "-t", dest="parallel", action="store_true",
+                       help="Tüm (senaryo, algoritma) çiftlerini süreç havuzunda paralel çalıştır")
+    parser.add_argument("--workers", "-w", type=int, default=None,
+                       help="Paralel modda işçi süreç sayısı (varsayılan: CPU çekirdek sayısı)")
     parser.add_argument("--context-switch", "-c", type=float, default=0.001, 
-                       help="Zaman birimi cinsinden bağlam değiştirme süresi (varsayılan: 0.001)")    
+                       help="Zaman birimi cinsinden bağlam değiştirme süresi (varsayılan: 0.001)")
+    parser.add_argument("--tick-resolution", type=int, default=None,
+                       help="Zaman birimi başına tik sayısı (örn. 1000); verildiğinde tüm zamanlar tam sayı tiklerle "
+                            "kesin olarak hesaplanır")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="CSV dosyalarının ikili ayrıştırma önbelleğini (.cpuw) kullanma")
+    parser.add_argument("--cpus", type=int, default=1,
+                       help="Benzetilecek CPU sayısı (varsayılan: 1)")
+    parser.add_argument("--placement", choices=PLACEMENTS, default="global",
+                       help="Çok çekirdekte süreç yerleştirme: ortak kuyruk, CPU başına kuyruk ve periyodik "
+                            "dengeleme ya da iş çalma")
+    parser.add_argument("--balance-interval", type=float, default=4,
+                       help="per_cpu yerleştirmede yük dengeleme aralığı (zaman birimi)")
+    parser.add_argument("--mlfq-levels", type=int, default=3,
+                       help="MLFQ kuyruk seviyesi sayısı; her seviyenin kuantumu bir öncekinin iki katıdır (varsayılan: 3)")
+    parser.add_argument("--mlfq-boost", type=float, default=50,
+                       help="MLFQ'da tüm süreçlerin en üst seviyeye taşındığı aralık (varsayılan: 50)")
+    parser.add_argument("--profile", action="store_true",
+                       help="Aşama süreleri, dağıtım sayıları, hazır kuyruk dağılımı ve bellek kullanımını "
+                            "karşılaştırma raporuna ekle")
+    parser.add_argument("--no-result-cache", action="store_true",
+                       help="Sonuç önbelleğini kullanma; tüm (senaryo, algoritma) çiftlerini yeniden hesapla")
+    parser.add_argument("--result-cache-size", type=float, default=256,
+                       help="Sonuç önbelleğinin MB cinsinden üst sınırı; aşıldığında en eski kullanılanlar silinir")
+    parser.add_argument("--streaming-metrics", action="store_true",
+                       help="--file ile: süreçleri CSV'den akış halinde zamanla ve metrikleri sabit bellekte topla "
+                            "(zaman çizelgesi ve süreç tablosu yazılmaz)")
+    parser.add_argument("--stream-timeline", action="store_true",
+                       help="Zaman dilimlerini bellekte tutmadan doğrudan dosyaya akıt (büyük izler için)")
+    parser.add_argument("--throughput-horizons", type=str, default=None,
+                       help="Throughput eğrisi için virgülle ayrılmış ek zaman ufukları (örn. 25,50,100,400)")
+    parser.add_argument("--timeline-mode", choices=["full", "truncate", "sample", "skip"], default="full",
+                       help="Raporlardaki zaman çizelgesi: tamamı, ilk N dilim, N dilimlik örnek ya da hiç")
+    parser.add_argument("--timeline-limit", type=int, default=1000,
+                       help="truncate/sample modlarında rapora yazılacak dilim sayısı (varsayılan: 1000)")
+    parser.add_argument("--background-write", action="store_true",
+                       help="Raporları arka planda yaz; bir sonraki algoritma bu sırada başlar")
+    parser.add_argument("--sweep", action="store_true",
+                       help="Kuantum ve bağlam değiştirme süresi ızgarasını tara; tek bir toplu tablo yaz")
+    parser.add_argument("--quanta", type=str, default="2",
+                       help="Tarama için Round Robin ve MLFQ kuantumları: liste (1,2,4) veya aralık (1:8, 0.5:4:0.5)")
+    parser.add_argument("--context-switches", type=str, default=None,
+                       help="Tarama için bağlam değiştirme süreleri: liste veya aralık (varsayılan: --context-switch)")
+    parser.add_argument("--replications", type=int, default=None,
+                       help="Monte Carlo modu: bu kadar rastgele iş yükü üret (ya da --file verildiyse yeniden "
+                            "örnekle) ve metriklerin dağılımını tek bir özet raporda topla")
+    parser.add_argument("--replication-size", type=int, default=None,
+                       help="Replikasyon başına süreç sayısı (varsayılan: 100 ya da --file'daki süreç sayısı)")
+    parser.add_argument("--seed", type=int, default=0,
+                       help="Replikasyon iş yüklerinin türetildiği ana tohum (varsayılan: 0)")
+    parser.add_argument("--confidence", type=float, default=0.95,
+                       help="Replikasyon raporundaki güven aralıklarının düzeyi (varsayılan: 0.95)")
+    parser.add_argument("--algorithms", type=str, default=None,
+                       help="Taranacak ya da replike edilecek algoritmalar, virgülle ayrılmış (örn. \"Round Robin,FCFS\")")
+    parser.add_argument("--export", type=str, default=None,
+                       help="Virgülle ayrılmış makine-okunur çıktı biçimleri: jsonl, csv, columnar")    
     args = parser.parse_args()   
-    simulator = CPUSchedulingSimulator(args.context_switch)    
+    export_formats = [f.strip() for f in args.export.split(',') if f.strip()] if args.export else []
+    for export_format in export_formats:
+        if export_format not in EXPORT_FORMATS:
+            parser.error(f"geçersiz dışa aktarma biçimi: {export_format} (jsonl, csv, columnar)")
+    if args.cpus < 1:
+        parser.error("--cpus en az 1 olmalıdır")
+    if args.replications is not None and args.replications < 1:
+        parser.error("--replications en az 1 olmalıdır")
+    if not 0 < args.confidence < 1:
+        parser.error("--confidence 0 ile 1 arasında olmalıdır")
+    if args.mlfq_levels < 1:
+        parser.error("--mlfq-levels en az 1 olmalıdır")
+    if args.mlfq_boost <= 0:
+        parser.error("--mlfq-boost pozitif olmalıdır")
+    if args.tick_resolution is not None:
+        if args.tick_resolution < 1:
+            parser.error("--tick-resolution en az 1 olmalıdır")
+        if args.cpus > 1 or args.sweep or args.replications is not None or args.streaming_metrics:
+            parser.error("--tick-resolution yalnızca tek CPU'lu normal çalıştırmalarda kullanılabilir")
+        try:
+            scale = TickScale(args.tick_resolution)
+            scale.to_ticks(args.context_switch, "bağlam değiştirme süresi")
+            scale.to_ticks(args.mlfq_boost, "MLFQ yükseltme aralığı")
+        except ValueError as e:
+            parser.error(str(e))
+    throughput_horizons = None
+    if args.throughput_horizons:
+        throughput_horizons = [float(h) for h in args.throughput_horizons.split(',') if h.strip()]
+    simulator = CPUSchedulingSimulator(args.context_switch, throughput_horizons, use_cache=not args.no_cache,
+                                       max_workers=args.workers, stream_timeline=args.stream_timeline,
+                                       timeline_mode=args.timeline_mode, timeline_limit=args.timeline_limit,
+                                       background_write=args.background_write, export_formats=export_formats,
+                                       use_result_cache=not args.no_result_cache,
+                                       result_cache_size_mb=args.result_cache_size,
+                                       profile=args.profile, cpu_count=args.cpus, placement=args.placement,
+                                       balance_interval=args.balance_interval,
+                                       mlfq_levels=args.mlfq_levels, mlfq_boost_interval=args.mlfq_boost,
+                                       time_resolution=args.tick_resolution)    
     try:
-        if args.both:
-            simulator.run_both_cases(use_threading=args.threading)
+        if args.replications is not None:
+            if args.file and not os.path.exists(args.file):
+                print(f"Hata: Dosya '{args.file}' bulunamadı")
+                sys.exit(1)
+            algorithm_names = args.algorithms.split(',') if args.algorithms else None
+            simulator.run_replications(args.replications, args.seed, args.replication_size, args.file,
+                                       algorithm_names, args.confidence)
+        elif args.sweep:
+            file_paths = [args.file] if args.file else [os.path.join("data", "case1.csv"), os.path.join("data", "case2.csv")]
+            for file_path in file_paths:
+                if not os.path.exists(file_path):
+                    print(f"Hata: Dosya '{file_path}' bulunamadı")
+                    sys.exit(1)
+            quanta = parse_values(args.quanta)
+            context_switch_times = parse_values(args.context_switches) if args.context_switches else [args.context_switch]
+            algorithm_names = args.algorithms.split(',') if args.algorithms else None
+            simulator.run_sweep(file_paths, quanta, context_switch_times, algorithm_names)
+        elif args.both:
+            simulator.run_both_cases(use_parallel=args.parallel)
         elif args.file:
             if not os.path.exists(args.file):
                 print(f"Hata: Dosya '{args.file}' bulunamadı")
                 sys.exit(1)
-            simulator.run_single_case(args.file)
+            if args.streaming_metrics:
+                simulator.run_streaming_metrics(args.file)
+            else:
+                simulator.run_single_case(args.file)
         else:
             print("CPU Zamanlama Simülatörü")
             print("Kullanım örnekleri:")
             print("  python main.py --both                    # Her iki test senaryosunu çalıştır")
-            print("  python main.py --both --threading        # Threading ile her iki senaryoyu çalıştır")
+            print("  python main.py --both --parallel         # Süreç havuzu ile her iki senaryoyu paralel çalıştır")
             print("  python main.py --file data/case1.csv     # Özel dosya çalıştır")
             print("  python main.py --file benim_sureclerim.csv   # Özel süreç dosyası çalıştır")
+            print("  python main.py --replications 1000       # Monte Carlo replikasyon özeti")
             print("\nDaha fazla seçenek için --help kullanın")        
             choice = input("\nHer iki test senaryosunu çalıştırmak ister misiniz? (e/h): ").lower().strip()
             if choice in ['e', 'evet']:
-                threading_choice = input("Daha hızlı çalıştırma için multi-threading kullanılsın mı? (e/h): ").lower().strip()
-                use_threading = threading_choice in ['e', 'evet']
-                simulator.run_both_cases(use_threading=use_threading)  
+                parallel_choice = input("Daha hızlı çalıştırma için paralel çalıştırma kullanılsın mı? (e/h): ").lower().strip()
+                use_parallel = parallel_choice in ['e', 'evet']
+                simulator.run_both_cases(use_parallel=use_parallel)  
     except KeyboardInterrupt:
         print("\n\nSimülasyon kullanıcı tarafından durduruldu")
         sys.exit(1)
     except Exception as e:
         print(f"\nSimülasyon sırasında hata: {e}")
         sys.exit(1)
+    finally:
+        simulator.result_generator.close()
 if __name__ == "__main__":
     main()
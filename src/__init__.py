@@ -7,9 +7,24 @@ __description__ = "CPU Zamanlama Algoritmaları Simülatörü"
 
 # Ana modülleri import et
 from .process import Process, Priority, TimeSlot, SchedulingResult
-from .csv_parser import parse_csv_file, validate_csv_structure
+from .workload import Workload, RunState
+from .timeline import Timeline
+from .slot_sinks import SlotSink, ListSlotSink, NullSlotSink, CoalescingSlotSink, MetricsSlotSink, FileSlotSink
+from .csv_parser import parse_csv_file, validate_csv_structure, CsvStreamReader, CsvRowError
+from .binary_workload import (MappedWorkload, load_workload, write_workload, convert_csv_to_binary, load_csv_cached,
+                              read_row_errors)
+from .workload_generator import WorkloadGenerator, generate_workload
 from .scheduling_algorithms import SchedulingAlgorithm
+from .smp import MulticoreScheduler, MulticoreStats
+from .ticks import TickScheduler, TickScale
+from .dispatcher import NonPreemptiveDispatcher
+from .vectorized_fcfs import VectorizedFCFS, FCFSBatch, schedule_fcfs_batch
+from .online import OnlineScheduler, CompletionEvent
 from .result_generator import ResultGenerator
+from .result_cache import ResultCache
+from .replication import ReplicationRunner, ReplicationStats, ReplicationSummary
+from .profiling import Profiler
+from .metrics_accumulator import MetricsAccumulator, QuantileSketch, RunningMoments
 
 # Paket seviyesinde kullanılabilecek fonksiyonlar
 __all__ = [
@@ -17,8 +32,45 @@ __all__ = [
     'Priority', 
     'TimeSlot',
     'SchedulingResult',
+    'Workload',
+    'RunState',
+    'SlotSink',
+    'Timeline',
+    'ListSlotSink',
+    'NullSlotSink',
+    'CoalescingSlotSink',
+    'MetricsSlotSink',
+    'FileSlotSink',
     'parse_csv_file',
     'validate_csv_structure',
+    'CsvStreamReader',
+    'CsvRowError',
+    'MappedWorkload',
+    'load_workload',
+    'write_workload',
+    'convert_csv_to_binary',
+    'load_csv_cached',
+    'read_row_errors',
+    'WorkloadGenerator',
+    'generate_workload',
     'SchedulingAlgorithm',
-    'ResultGenerator'
+    'MulticoreScheduler',
+    'MulticoreStats',
+    'TickScheduler',
+    'TickScale',
+    'NonPreemptiveDispatcher',
+    'VectorizedFCFS',
+    'FCFSBatch',
+    'schedule_fcfs_batch',
+    'OnlineScheduler',
+    'CompletionEvent',
+    'ResultGenerator',
+    'ResultCache',
+    'ReplicationRunner',
+    'ReplicationStats',
+    'ReplicationSummary',
+    'Profiler',
+    'MetricsAccumulator',
+    'QuantileSketch',
+    'RunningMoments'
 ]
@@ -0,0 +1,264 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import List, Optional, Tuple
+from .csv_parser import CsvStreamReader, CsvRowError
+from .workload import Workload
+
+MAGIC = b'CPUW'
+FORMAT_VERSION = 2
+CACHE_SUFFIX = '.cpuw'
+
+FLAG_BIG_ENDIAN = 0x1
+FLAG_ARRIVAL_SORTED = 0x2
+
+# magic, sürüm, bayraklar, süreç sayısı, kimlik sayısı, metin tablosu boyutu,
+# kaynak boyutu, kaynak mtime_ns, kaynak sha256, satır hataları boyutu, varış ve patlama tip kodları
+_HEADER = struct.Struct('<4sHHQQQQQ32sQ2s')
+_HEADER_SIZE = 96
+
+# Zaman sütunları kayan nokta ('d') ya da tik modunda tam sayı ('q') olabilir
+TIME_TYPECODES = ('d', 'q')
+
+class StringTable(Sequence):
+    def __init__(self, blob, count: int):
+        self._blob = blob
+        self._count = count
+        self._strings = None
+    
+    def __len__(self):
+        return self._count
+    
+    def __getitem__(self, index):
+        if self._strings is None:
+            self._strings = [sys.intern(s) for s in bytes(self._blob).decode('utf-8').split('\x00')] if self._count else []
+        return self._strings[index]
+
+class MappedWorkload(Workload):
+    # Sütunlar dosya eşlemesine işaret eder; close() ya da with bloğu eşlemeyi ve dosya tanıtıcısını
+    # serbest bırakır. Kapatıldıktan sonra iş yükü ve ondan alınan dilimler kullanılamaz
+    def __init__(self, mapping: mmap.mmap, views: List[memoryview], *columns):
+        super().__init__(*columns)
+        self._mapping = mapping
+        self._views = views
+    
+    def __enter__(self) -> 'MappedWorkload':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @property
+    def closed(self) -> bool:
+        return self._mapping is None
+    
+    def close(self):
+        if self._mapping is None:
+            return
+        for view in (self.id_index, self.arrival_times, self.burst_times, self.priorities, *self._views):
+            view.release()
+        try:
+            self._mapping.close()
+        except BufferError:
+            raise BufferError("Eşleme kapatılamadı: iş yükünden alınan dilimler hâlâ kullanımda") from None
+        self._mapping = None
+    
+    def copy(self) -> Workload:
+        # Sütunlar belleğe kopyalanır; dönen iş yükü eşleme kapatıldıktan sonra da kullanılabilir
+        workload = Workload(list(self.id_table), _copy_column(self.id_index), _copy_column(self.arrival_times),
+                            _copy_column(self.burst_times), _copy_column(self.priorities))
+        if isinstance(self._arrival_order, range):
+            workload._arrival_order = self._arrival_order
+        return workload
+
+def write_workload(workload: Workload, path: str, source: Optional[Tuple[int, int, bytes]] = None,
+                   errors: List[CsvRowError] = ()):
+    process_count = len(workload)
+    id_table = list(workload.id_table)
+    if any('\x00' in process_id for process_id in id_table):
+        raise ValueError("Process_ID değerleri NUL karakteri içeremez")
+    
+    blob = '\x00'.join(id_table).encode('utf-8')
+    flags = FLAG_BIG_ENDIAN if sys.byteorder == 'big' else 0
+    if isinstance(workload.arrival_order(), range):
+        flags |= FLAG_ARRIVAL_SORTED
+    source_size, source_mtime_ns, source_hash = source or (0, 0, b'\x00' * 32)
+    
+    arrival_times = _time_column(workload.arrival_times)
+    burst_times = _time_column(workload.burst_times)
+    id_index = workload.id_index if workload.id_index.format == 'q' else array('q', workload.id_index)
+    priorities = workload.priorities if workload.priorities.format == 'b' else array('b', workload.priorities)
+    error_blob = json.dumps([[e.line_number, e.column, e.value, e.message] for e in errors],
+                            ensure_ascii=False).encode('utf-8') if errors else b''
+    typecodes = (_typecode(arrival_times) + _typecode(burst_times)).encode('ascii')
+    
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, flags, process_count, len(id_table), len(blob),
+                          source_size, source_mtime_ns, source_hash, len(error_blob), typecodes)
+    
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(header.ljust(_HEADER_SIZE, b'\x00'))
+        f.write(arrival_times)
+        f.write(burst_times)
+        f.write(id_index)
+        f.write(priorities)
+        f.write(b'\x00' * (-process_count % 8))
+        f.write(blob)
+        f.write(error_blob)
+    os.replace(temp_path, path)
+
+def read_header(path: str) -> Optional[dict]:
+    try:
+        with open(path, 'rb') as f:
+            data = f.read(_HEADER.size)
+    except OSError:
+        return None
+    if len(data) < _HEADER.size:
+        return None
+    
+    (magic, version, flags, process_count, id_count, blob_size,
+     source_size, source_mtime_ns, source_hash, errors_size, typecodes) = _HEADER.unpack(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    arrival_typecode, burst_typecode = typecodes.decode('ascii', 'replace')
+    if arrival_typecode not in TIME_TYPECODES or burst_typecode not in TIME_TYPECODES:
+        return None
+    
+    return {
+        'flags': flags,
+        'process_count': process_count,
+        'id_count': id_count,
+        'blob_size': blob_size,
+        'source_size': source_size,
+        'source_mtime_ns': source_mtime_ns,
+        'source_hash': source_hash,
+        'errors_size': errors_size,
+        'arrival_typecode': arrival_typecode,
+        'burst_typecode': burst_typecode
+    }
+
+def load_workload(path: str) -> MappedWorkload:
+    header = read_header(path)
+    if header is None:
+        raise ValueError(f"Geçersiz ikili iş yükü dosyası: {path}")
+    
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    process_count = header['process_count']
+    view = memoryview(mapped)
+    offset = _HEADER_SIZE
+    
+    def section(size: int, fmt: str):
+        nonlocal offset
+        data = view[offset:offset + size]
+        offset += size
+        return data.cast(fmt)
+    
+    arrival_times = section(8 * process_count, header['arrival_typecode'])
+    burst_times = section(8 * process_count, header['burst_typecode'])
+    id_index = section(8 * process_count, 'q')
+    priorities = section(process_count, 'b')
+    offset += -process_count % 8
+    blob = view[offset:offset + header['blob_size']]
+    views = [view, arrival_times, burst_times, id_index, priorities, blob]
+    
+    # Farklı bayt sıralı makinede yazılan dosyalar kopyalanıp çevrilir
+    if bool(header['flags'] & FLAG_BIG_ENDIAN) != (sys.byteorder == 'big'):
+        swapped = []
+        for column in (arrival_times, burst_times, id_index):
+            values = _copy_column(column)
+            values.byteswap()
+            swapped.append(values)
+        arrival_times, burst_times, id_index = swapped
+    
+    workload = MappedWorkload(mapped, views, StringTable(blob, header['id_count']), id_index, arrival_times,
+                              burst_times, priorities)
+    if header['flags'] & FLAG_ARRIVAL_SORTED:
+        workload._arrival_order = range(process_count)
+    return workload
+
+def convert_csv_to_binary(csv_path: str, binary_path: Optional[str] = None) -> Tuple[str, List[CsvRowError]]:
+    binary_path = binary_path or csv_path + CACHE_SUFFIX
+    reader = CsvStreamReader(csv_path)
+    workload = reader.read_workload()
+    write_workload(workload, binary_path, _source_signature(csv_path), reader.errors)
+    return binary_path, reader.errors
+
+def load_csv_cached(csv_path: str, cache_path: Optional[str] = None) -> Tuple[Workload, List[CsvRowError]]:
+    cache_path = cache_path or csv_path + CACHE_SUFFIX
+    header = read_header(cache_path)
+    
+    if header is not None:
+        stat = os.stat(csv_path)
+        if header['source_size'] == stat.st_size and header['source_mtime_ns'] == stat.st_mtime_ns:
+            return _load_cached(cache_path, header)
+        if header['source_size'] == stat.st_size and header['source_hash'] == _file_hash(csv_path):
+            _update_source_mtime(cache_path, stat.st_mtime_ns)
+            return _load_cached(cache_path, header)
+    
+    reader = CsvStreamReader(csv_path)
+    workload = reader.read_workload()
+    try:
+        write_workload(workload, cache_path, _source_signature(csv_path), reader.errors)
+    except OSError:
+        # Önbellek yazılamıyorsa (salt okunur dizin vb.) ayrıştırılmış veri yine kullanılır
+        pass
+    return workload, reader.errors
+
+def read_row_errors(path: str, header: Optional[dict] = None) -> List[CsvRowError]:
+    # Dönüştürme sırasında atlanan CSV satırları metin tablosundan sonra JSON olarak saklanır
+    header = header or read_header(path)
+    if header is None or not header['errors_size']:
+        return []
+    process_count = header['process_count']
+    with open(path, 'rb') as f:
+        f.seek(_HEADER_SIZE + 25 * process_count + (-process_count % 8) + header['blob_size'])
+        data = f.read(header['errors_size'])
+    return [CsvRowError(*fields) for fields in json.loads(data.decode('utf-8'))]
+
+def _load_cached(cache_path: str, header: dict) -> Tuple[Workload, List[CsvRowError]]:
+    # Sütunlar kopyalanıp eşleme hemen kapatılır; dosya tanıtıcısı çalıştırma boyunca açık kalmaz
+    with load_workload(cache_path) as mapped:
+        workload = mapped.copy()
+    return workload, read_row_errors(cache_path, header)
+
+def _typecode(column) -> str:
+    return column.format if isinstance(column, memoryview) else column.typecode
+
+def _time_column(column):
+    if column.format in TIME_TYPECODES:
+        return column
+    return array('q' if column.format in 'bBhHiIlLqQ' else 'd', column)
+
+def _copy_column(column: memoryview) -> array:
+    values = array(column.format)
+    values.frombytes(column.cast('B'))
+    return values
+
+def _update_source_mtime(cache_path: str, mtime_ns: int):
+    try:
+        with open(cache_path, 'r+b') as f:
+            data = bytearray(f.read(_HEADER.size))
+            fields = list(_HEADER.unpack(data))
+            fields[7] = mtime_ns
+            f.seek(0)
+            f.write(_HEADER.pack(*fields))
+    except OSError:
+        pass
+
+def _source_signature(csv_path: str) -> Tuple[int, int, bytes]:
+    stat = os.stat(csv_path)
+    return stat.st_size, stat.st_mtime_ns, _file_hash(csv_path)
+
+def _file_hash(path: str) -> bytes:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.digest()
@@ -1,31 +1,144 @@
 import csv
-from typing import List
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Union
 from .process import Process, Priority
+from .workload import Workload
 
-def parse_csv_file(file_path: str) -> List[Process]:
-    processes = []
+REQUIRED_COLUMNS = ['Process_ID', 'Arrival_Time', 'CPU_Burst_Time', 'Priority']
+
+@dataclass
+class CsvRowError:
+    line_number: int
+    column: Optional[str]
+    value: str
+    message: str
+
+class CsvStreamReader:
+    def __init__(self, file_path: str, chunk_size: int = 10000, strict: bool = False):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.strict = strict
+        self.errors: List[CsvRowError] = []
+        self.row_count = 0
+        self.is_sorted = True
     
-    try:
-        with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
+    def iter_rows(self) -> Iterator[tuple]:
+        self.errors = []
+        self.row_count = 0
+        self.is_sorted = True
+        last_arrival = None
+        
+        try:
+            csvfile = open(self.file_path, 'r', newline='', encoding='utf-8')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"CSV dosyası bulunamadı: {self.file_path}")
+        
+        with csvfile:
+            reader = csv.reader(csvfile)
+            header = [column.strip() for column in next(reader, [])]
+            missing = [column for column in REQUIRED_COLUMNS if column not in header]
+            if missing:
+                raise KeyError(f"CSV'de eksik required sütun: {', '.join(missing)}")
+            
+            id_column, arrival_column, burst_column, priority_column = (
+                header.index(column) for column in REQUIRED_COLUMNS)
             
             for row in reader:
-                process = Process(
-                    process_id=row['Process_ID'].strip(),
-                    arrival_time=float(row['Arrival_Time']),
-                    cpu_burst_time=float(row['CPU_Burst_Time']),
-                    priority=row['Priority'].strip()
-                )
-                processes.append(process)
-                
-    except FileNotFoundError:
-        raise FileNotFoundError(f"CSV dosyası bulunamadı: {file_path}")
-    except KeyError as e:
-        raise KeyError(f"CSV'de eksik required sütun: {e}")
-    except ValueError as e:
-        raise ValueError(f"CSV'de geçersiz veri formatı: {e}")
+                if not row:
+                    continue
+                
+                try:
+                    process_id = row[id_column].strip()
+                    arrival_text = row[arrival_column]
+                    burst_text = row[burst_column]
+                    priority_text = row[priority_column].strip().upper()
+                except IndexError:
+                    self._reject(reader.line_num, None, ','.join(row), "eksik sütun")
+                    continue
+                
+                if not process_id:
+                    self._reject(reader.line_num, 'Process_ID', '', "boş Process_ID")
+                    continue
+                
+                try:
+                    arrival_time = float(arrival_text)
+                except ValueError:
+                    self._reject(reader.line_num, 'Arrival_Time', arrival_text, "geçersiz sayı formatı")
+                    continue
+                
+                try:
+                    burst_time = float(burst_text)
+                except ValueError:
+                    self._reject(reader.line_num, 'CPU_Burst_Time', burst_text, "geçersiz sayı formatı")
+                    continue
+                
+                priority = Priority.__members__.get(priority_text)
+                if priority is None:
+                    self._reject(reader.line_num, 'Priority', priority_text, f"geçersiz öncelik '{priority_text}'")
+                    continue
+                
+                if last_arrival is not None and arrival_time < last_arrival:
+                    self.is_sorted = False
+                last_arrival = arrival_time
+                self.row_count += 1
+                
+                yield process_id, arrival_time, burst_time, priority
     
-    return sorted(processes, key=lambda p: p.arrival_time)
+    def iter_chunks(self) -> Iterator[List[Process]]:
+        chunk = []
+        for process_id, arrival_time, burst_time, priority in self.iter_rows():
+            chunk.append(Process(process_id, arrival_time, burst_time, priority))
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    
+    def iter_workload_chunks(self) -> Iterator[Workload]:
+        columns = ([], [], [], [])
+        for row in self.iter_rows():
+            for column, value in zip(columns, row):
+                column.append(value)
+            if len(columns[0]) >= self.chunk_size:
+                yield Workload.from_columns(*columns)
+                columns = ([], [], [], [])
+        if columns[0]:
+            yield Workload.from_columns(*columns)
+    
+    def read_processes(self) -> List[Process]:
+        processes = [process for chunk in self.iter_chunks() for process in chunk]
+        if not self.is_sorted:
+            processes.sort(key=lambda p: p.arrival_time)
+        return processes
+    
+    def read_workload(self) -> Workload:
+        process_ids, arrival_times, burst_times, priorities = [], [], [], []
+        for process_id, arrival_time, burst_time, priority in self.iter_rows():
+            process_ids.append(process_id)
+            arrival_times.append(arrival_time)
+            burst_times.append(burst_time)
+            priorities.append(priority)
+        
+        if not self.is_sorted:
+            order = sorted(range(len(arrival_times)), key=arrival_times.__getitem__)
+            process_ids = [process_ids[i] for i in order]
+            arrival_times = [arrival_times[i] for i in order]
+            burst_times = [burst_times[i] for i in order]
+            priorities = [priorities[i] for i in order]
+        
+        return Workload.from_columns(process_ids, arrival_times, burst_times, priorities)
+    
+    def _reject(self, line_number: int, column: Optional[str], value: str, message: str):
+        error = CsvRowError(line_number, column, value, message)
+        if self.strict:
+            raise ValueError(f"CSV'de geçersiz veri formatı: {line_number}. satır: {message}")
+        self.errors.append(error)
+
+def parse_csv_file(file_path: str, as_workload: bool = False) -> Union[List[Process], Workload]:
+    reader = CsvStreamReader(file_path, strict=True)
+    if as_workload:
+        return reader.read_workload()
+    return reader.read_processes()
 
 def validate_csv_structure(file_path: str) -> bool:
     try:
@@ -0,0 +1,69 @@
+import heapq
+from typing import Any, Callable, List, Optional, Union
+from .process import Process, SchedulingResult
+from .profiling import Profiler
+from .slot_sinks import SlotSink
+from .workload import Workload, RunState, run_engine
+
+class NonPreemptiveDispatcher:
+    def __init__(self, algorithm_name: str, key: Callable[[Workload, int], Any], context_switch_time=0.001):
+        self.algorithm_name = algorithm_name
+        self.key = key
+        self.context_switch_time = context_switch_time
+    
+    def run(self, processes: Union[List[Process], Workload], sink: Optional[SlotSink] = None,
+            profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return run_engine(self.algorithm_name, processes, self.dispatch, sink, profiler)
+    
+    def dispatch(self, workload: Workload, state: RunState, sink: SlotSink, profiler: Optional[Profiler] = None):
+        arrival_times = workload.arrival_times
+        burst_times = workload.burst_times
+        start_times = state.start_times
+        completion_times = state.completion_times
+        remaining_times = state.remaining_times
+        arrival_order = workload.arrival_order()
+        process_count = len(workload)
+        
+        emit = sink.emit
+        current_time = 0
+        context_switches = 0
+        completed_count = 0
+        arrival_index = 0
+        ready_heap = []
+        queue_lengths = profiler.histogram("ready_queue") if profiler is not None else None
+        
+        while completed_count < process_count:
+            while (arrival_index < process_count
+                   and arrival_times[arrival_order[arrival_index]] <= current_time):
+                index = arrival_order[arrival_index]
+                # Eşit anahtarlarda girdi sırası korunur
+                heapq.heappush(ready_heap, (self.key(workload, index), index))
+                arrival_index += 1
+            
+            if ready_heap:
+                if queue_lengths is not None:
+                    queue_lengths[len(ready_heap)] += 1
+                index = heapq.heappop(ready_heap)[1]
+                
+                start_times[index] = current_time
+                
+                start_time = current_time
+                end_time = current_time + burst_times[index]
+                
+                emit(workload.process_id(index), start_time, end_time)
+                
+                current_time = end_time
+                completion_times[index] = current_time
+                remaining_times[index] = 0
+                completed_count += 1
+                
+                if completed_count < process_count:
+                    current_time += self.context_switch_time
+                    context_switches += 1
+            else:
+                next_arrival = arrival_times[arrival_order[arrival_index]]
+                
+                emit("IDLE", current_time, next_arrival)
+                current_time = next_arrival
+        
+        return context_switches, current_time
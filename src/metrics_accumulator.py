@@ -0,0 +1,221 @@
+import bisect
+import math
+from typing import Iterable, Optional
+from .process import DEFAULT_THROUGHPUT_HORIZONS, TimeSlot, _horizon_label
+from .slot_sinks import SlotSink
+
+# Akışlı metriklerde raporlanan yüzdelikler
+STREAMING_PERCENTILES = (50, 90, 99)
+
+class RunningMoments:
+    __slots__ = ('count', 'mean', '_m2', 'minimum', 'maximum')
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+    
+    def add(self, value: float):
+        # Welford: ortalama ve varyans tek geçişte, sayısal olarak kararlı güncellenir
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+    
+    def merge(self, other: 'RunningMoments'):
+        # Chan vd.: iki kısmi özetin birleşimi
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+    
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+    
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+class QuantileSketch:
+    # Logaritmik kovalı özet (DDSketch): her yüzdelik, bağıl hata sınırı içinde döndürülür.
+    # Kova sayısı max_buckets ile sınırlıdır; aşıldığında en küçük kovalar birleştirilir
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Bağıl doğruluk 0 ile 1 arasında olmalıdır")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets = {}
+        self.zero_count = 0
+        self.count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+    
+    def add(self, value: float):
+        self.count += 1
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        if value <= 0:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        buckets = self._buckets
+        buckets[key] = buckets.get(key, 0) + 1
+        if len(buckets) > self.max_buckets:
+            self._collapse()
+    
+    def _collapse(self):
+        keys = sorted(self._buckets)
+        excess = len(keys) - self.max_buckets
+        merged = sum(self._buckets.pop(key) for key in keys[:excess])
+        self._buckets[keys[excess]] += merged
+    
+    def merge(self, other: 'QuantileSketch'):
+        if other._gamma != self._gamma:
+            raise ValueError("Farklı doğruluktaki özetler birleştirilemez")
+        for key, count in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+    
+    def percentile(self, q: float) -> float:
+        if self.count == 0:
+            return math.nan
+        rank = (self.count - 1) * q / 100
+        cumulative = self.zero_count
+        value = 0.0 if rank < cumulative else self.maximum
+        if rank >= cumulative:
+            for key in sorted(self._buckets):
+                cumulative += self._buckets[key]
+                if cumulative > rank:
+                    # Kova sınırlarının ortası; bağıl hata relative_accuracy ile sınırlıdır
+                    value = 2 * self._gamma ** key / (self._gamma + 1)
+                    break
+        return min(max(value, self.minimum), self.maximum)
+
+class MetricsAccumulator(SlotSink):
+    # Süreç tamamlandıkça güncellenen sabit bellekli metrikler; dilimler de akış halinde sayılır
+    def __init__(self, throughput_horizons: Optional[Iterable[float]] = None,
+                 percentiles: Iterable[float] = STREAMING_PERCENTILES, relative_accuracy: float = 0.01,
+                 downstream: Optional[SlotSink] = None):
+        horizons = set(DEFAULT_THROUGHPUT_HORIZONS)
+        if throughput_horizons is not None:
+            horizons.update(throughput_horizons)
+        self.horizons = sorted(horizons)
+        self.percentiles = tuple(percentiles)
+        self.downstream = downstream
+        
+        # Kova i, horizons[i-1] < tamamlanma <= horizons[i] aralığını sayar
+        self._horizon_counts = [0] * (len(self.horizons) + 1)
+        self.waiting_times = RunningMoments()
+        self.turnaround_times = RunningMoments()
+        self.waiting_sketch = QuantileSketch(relative_accuracy)
+        self.turnaround_sketch = QuantileSketch(relative_accuracy)
+        self.busy_time = 0
+        self.idle_time = 0
+        self.slot_count = 0
+        self.end_time = 0
+    
+    @property
+    def completed_count(self) -> int:
+        return self.turnaround_times.count
+    
+    def emit(self, process_id: str, start_time: float, end_time: float):
+        if process_id == "IDLE":
+            self.idle_time += end_time - start_time
+        else:
+            self.busy_time += end_time - start_time
+        self.slot_count += 1
+        self.end_time = end_time
+        if self.downstream is not None:
+            self.downstream.emit(process_id, start_time, end_time)
+    
+    def add_completion(self, arrival_time: float, burst_time: float, completion_time: float):
+        turnaround_time = completion_time - arrival_time
+        waiting_time = turnaround_time - burst_time
+        self.turnaround_times.add(turnaround_time)
+        self.waiting_times.add(waiting_time)
+        self.turnaround_sketch.add(turnaround_time)
+        self.waiting_sketch.add(waiting_time)
+        if completion_time:
+            self._horizon_counts[bisect.bisect_left(self.horizons, completion_time)] += 1
+    
+    def add_result(self, result):
+        # Çevrimiçi motoru olmayan algoritmalar için: toplu motorun süreç durumundan tamamlanmalar eklenir
+        state = result.state
+        if state is None:
+            return
+        workload = result.workload
+        arrival_times, burst_times = workload.arrival_times, workload.burst_times
+        for index, completion_time in enumerate(state.completion_times):
+            self.add_completion(arrival_times[index], burst_times[index], completion_time)
+    
+    def observe(self, event):
+        # OnlineScheduler olayları (TimeSlot ya da CompletionEvent) doğrudan verilebilir
+        if isinstance(event, TimeSlot):
+            self.emit(event.process_id, event.start_time, event.end_time)
+        else:
+            self.add_completion(event.arrival_time, event.cpu_burst_time, event.completion_time)
+    
+    def merge(self, other: 'MetricsAccumulator'):
+        if other.horizons != self.horizons:
+            raise ValueError("Farklı throughput ufuklarına sahip toplayıcılar birleştirilemez")
+        self._horizon_counts = [a + b for a, b in zip(self._horizon_counts, other._horizon_counts)]
+        self.waiting_times.merge(other.waiting_times)
+        self.turnaround_times.merge(other.turnaround_times)
+        self.waiting_sketch.merge(other.waiting_sketch)
+        self.turnaround_sketch.merge(other.turnaround_sketch)
+        self.busy_time += other.busy_time
+        self.idle_time += other.idle_time
+        self.slot_count += other.slot_count
+        self.end_time = max(self.end_time, other.end_time)
+    
+    def metrics(self, context_switches: int = 0, total_time: Optional[float] = None,
+                cpu_count: int = 1) -> Optional[dict]:
+        if self.completed_count == 0:
+            return None
+        total_time = self.end_time if total_time is None else total_time
+        cpu_efficiency = (self.busy_time / (total_time * cpu_count) * 100) if total_time > 0 else 0
+        
+        metrics = {
+            'avg_waiting_time': self.waiting_times.mean,
+            'max_waiting_time': self.waiting_times.maximum,
+            'avg_turnaround_time': self.turnaround_times.mean,
+            'max_turnaround_time': self.turnaround_times.maximum,
+            'cpu_efficiency': cpu_efficiency,
+            'context_switches': context_switches,
+            'completed': self.completed_count,
+            'busy_time': self.busy_time,
+            'idle_time': self.idle_time
+        }
+        for q in self.percentiles:
+            metrics[f'waiting_time_p{q:g}'] = self.waiting_sketch.percentile(q)
+            metrics[f'turnaround_time_p{q:g}'] = self.turnaround_sketch.percentile(q)
+        
+        curve = []
+        completed = 0
+        for horizon, count in zip(self.horizons, self._horizon_counts):
+            completed += count
+            curve.append((horizon, completed))
+            metrics[f'throughput_{_horizon_label(horizon)}'] = completed
+        metrics['throughput_curve'] = curve
+        return metrics
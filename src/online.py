@@ -0,0 +1,368 @@
+import heapq
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterable, Iterable, Iterator, Optional, Union
+from .process import Process, TimeSlot
+from .metrics_accumulator import MetricsAccumulator
+from .scheduling_algorithms import ALGORITHMS, advance_units
+from .workload import _priority_value
+
+@dataclass
+class CompletionEvent:
+    process_id: str
+    arrival_time: float
+    cpu_burst_time: float
+    priority: int
+    start_time: float
+    completion_time: float
+    turnaround_time: float
+    waiting_time: float
+
+class _ActiveProcess:
+    __slots__ = ('process_id', 'arrival_time', 'burst_time', 'priority', 'remaining_time', 'start_time')
+    
+    def __init__(self, process_id: str, arrival_time: float, burst_time: float, priority: int):
+        self.process_id = process_id
+        self.arrival_time = arrival_time
+        self.burst_time = burst_time
+        self.priority = priority
+        self.remaining_time = burst_time
+        self.start_time = None
+
+# Motor daha fazla girdi beklediğinde bu işaretçiyi üretir
+_WAIT = object()
+
+class OnlineScheduler:
+    def __init__(self, algorithm: str = "FCFS", context_switch_time=0.001, time_quantum: Optional[float] = None,
+                 accumulator: Optional[MetricsAccumulator] = None):
+        entry = next((e for e in ALGORITHMS if algorithm in (e[0], e[1])), None)
+        if entry is None:
+            raise ValueError(f"Bilinmeyen algoritma: {algorithm}")
+        self.algorithm_name, method_name, kwargs = entry
+        self.context_switch_time = context_switch_time
+        self.time_quantum = time_quantum if time_quantum is not None else kwargs.get("time_quantum")
+        # Verilirse her dilim ve tamamlanma anında güncellenir; bellek yalnızca etkin süreçlerle büyür
+        self.accumulator = accumulator
+        
+        self.current_time = 0
+        self.context_switches = 0
+        self.busy_time = 0
+        self.submitted_count = 0
+        self.completed_count = 0
+        
+        self._pending = []
+        self._active = {}
+        self._watermark = -math.inf
+        self._finished = False
+        self._done = False
+        
+        engines = {
+            "schedule_fcfs": lambda: self._non_preemptive(lambda p: p.arrival_time),
+            "schedule_non_preemptive_sjf": lambda: self._non_preemptive(lambda p: (p.burst_time, p.arrival_time)),
+            "schedule_non_preemptive_priority": lambda: self._non_preemptive(lambda p: (-p.priority, p.arrival_time)),
+            "schedule_preemptive_sjf": self._preemptive_sjf,
+            "schedule_round_robin": self._round_robin,
+            "schedule_preemptive_priority": self._preemptive_priority
+        }
+        if method_name not in engines:
+            raise ValueError(f"{self.algorithm_name} çevrimiçi modda desteklenmiyor")
+        self._engine = engines[method_name]()
+    
+    @property
+    def active_count(self) -> int:
+        return len(self._active)
+    
+    def submit(self, process: Union[Process, str], arrival_time: Optional[float] = None,
+               cpu_burst_time: Optional[float] = None, priority=None):
+        if isinstance(process, Process):
+            process_id, arrival_time = process.process_id, process.arrival_time
+            cpu_burst_time, priority = process.cpu_burst_time, process.priority
+        else:
+            process_id = process
+        
+        if self._finished:
+            raise ValueError("Akış kapatıldıktan sonra süreç eklenemez")
+        if arrival_time < self._watermark:
+            raise ValueError(f"{process_id} için geç varış: {arrival_time} < {self._watermark}")
+        
+        seq = self.submitted_count
+        self.submitted_count += 1
+        self._active[seq] = _ActiveProcess(process_id, arrival_time, cpu_burst_time, _priority_value(priority))
+        heapq.heappush(self._pending, (arrival_time, seq))
+    
+    def advance(self, until: float) -> Iterator[Union[TimeSlot, CompletionEvent]]:
+        # until öncesinde varan tüm süreçlerin gönderildiği taahhüt edilir
+        self._watermark = max(self._watermark, until)
+        return self._drain()
+    
+    def finish(self) -> Iterator[Union[TimeSlot, CompletionEvent]]:
+        self._finished = True
+        return self._drain()
+    
+    def stream(self, processes: Iterable[Process]) -> Iterator[Union[TimeSlot, CompletionEvent]]:
+        for process in processes:
+            self.submit(process)
+            yield from self.advance(process.arrival_time)
+        yield from self.finish()
+    
+    async def astream(self, processes: AsyncIterable[Process]):
+        async for process in processes:
+            self.submit(process)
+            for event in self.advance(process.arrival_time):
+                yield event
+        for event in self.finish():
+            yield event
+    
+    def summary(self) -> dict:
+        summary = {
+            'algorithm_name': self.algorithm_name,
+            'completed': self.completed_count,
+            'active': len(self._active),
+            'context_switches': self.context_switches,
+            'total_time': self.current_time,
+            'busy_time': self.busy_time
+        }
+        if self.accumulator is not None:
+            summary['metrics'] = self.accumulator.metrics(self.context_switches, self.current_time)
+        return summary
+    
+    def _drain(self):
+        while not self._done:
+            event = next(self._engine, None)
+            if event is None:
+                self._done = True
+            elif event is _WAIT:
+                return
+            else:
+                yield event
+    
+    def _known(self, time: float) -> bool:
+        return self._finished or time < self._watermark
+    
+    def _admit(self, time: float):
+        pending = self._pending
+        admitted = []
+        while pending and pending[0][0] <= time:
+            admitted.append(heapq.heappop(pending)[1])
+        return admitted
+    
+    def _more_work(self, *queues) -> Optional[bool]:
+        # Başka süreç olup olmadığı ancak yeni gönderim ya da akışın kapanmasıyla kesinleşir
+        if any(queues) or self._pending:
+            return True
+        if self._finished:
+            return False
+        return None
+    
+    def _slot(self, process_id: str, start_time: float, end_time: float) -> TimeSlot:
+        if process_id != "IDLE":
+            self.busy_time += end_time - start_time
+        if self.accumulator is not None:
+            self.accumulator.emit(process_id, start_time, end_time)
+        return TimeSlot(process_id, start_time, end_time)
+    
+    def _complete(self, seq: int) -> CompletionEvent:
+        process = self._active.pop(seq)
+        process.remaining_time = 0
+        self.completed_count += 1
+        turnaround_time = self.current_time - process.arrival_time
+        if self.accumulator is not None:
+            self.accumulator.add_completion(process.arrival_time, process.burst_time, self.current_time)
+        return CompletionEvent(process.process_id, process.arrival_time, process.burst_time, process.priority,
+                               process.start_time, self.current_time, turnaround_time,
+                               turnaround_time - process.burst_time)
+    
+    def _idle(self):
+        next_arrival = self._pending[0][0]
+        slot = self._slot("IDLE", self.current_time, next_arrival)
+        self.current_time = next_arrival
+        return slot
+    
+    def _non_preemptive(self, key):
+        active = self._active
+        ready_heap = []
+        switch_pending = False
+        
+        while True:
+            if switch_pending:
+                while self._more_work(ready_heap) is None:
+                    yield _WAIT
+                if not self._more_work(ready_heap):
+                    return
+                self.current_time += self.context_switch_time
+                self.context_switches += 1
+                switch_pending = False
+            
+            while not self._known(self.current_time):
+                yield _WAIT
+            for seq in self._admit(self.current_time):
+                heapq.heappush(ready_heap, (key(active[seq]), seq))
+            
+            if ready_heap:
+                seq = heapq.heappop(ready_heap)[1]
+                process = active[seq]
+                process.start_time = self.current_time
+                start_time = self.current_time
+                self.current_time = start_time + process.burst_time
+                yield self._slot(process.process_id, start_time, self.current_time)
+                yield self._complete(seq)
+                switch_pending = True
+            else:
+                while self._more_work() is None:
+                    yield _WAIT
+                if not self._pending:
+                    return
+                yield self._idle()
+    
+    def _preemptive_sjf(self):
+        active = self._active
+        ready_heap = []
+        current = None
+        
+        while True:
+            while not self._known(self.current_time):
+                yield _WAIT
+            for seq in self._admit(self.current_time):
+                heapq.heappush(ready_heap, (active[seq].remaining_time, seq))
+            
+            if current is not None:
+                if ready_heap and ready_heap[0] < (active[current].remaining_time, current):
+                    heapq.heappush(ready_heap, (active[current].remaining_time, current))
+                    current = heapq.heappop(ready_heap)[1]
+                    self.context_switches += 1
+                    self.current_time += self.context_switch_time
+            elif ready_heap:
+                current = heapq.heappop(ready_heap)[1]
+            else:
+                while self._more_work() is None:
+                    yield _WAIT
+                if not self._pending:
+                    return
+                yield self._idle()
+                continue
+            
+            process = active[current]
+            if process.start_time is None:
+                process.start_time = self.current_time
+            
+            while True:
+                execution_time = min(1, process.remaining_time)
+                start_time = self.current_time
+                self.current_time += execution_time
+                process.remaining_time -= execution_time
+                yield self._slot(process.process_id, start_time, self.current_time)
+                
+                if process.remaining_time == 0:
+                    yield self._complete(current)
+                    current = None
+                    break
+                
+                while not self._known(self.current_time):
+                    yield _WAIT
+                if self._pending and self._pending[0][0] <= self.current_time:
+                    break
+    
+    def _round_robin(self):
+        active = self._active
+        time_quantum = self.time_quantum
+        ready_queue = deque()
+        
+        while True:
+            while not self._known(self.current_time):
+                yield _WAIT
+            ready_queue.extend(self._admit(self.current_time))
+            
+            if ready_queue:
+                seq = ready_queue.popleft()
+                process = active[seq]
+                if process.start_time is None:
+                    process.start_time = self.current_time
+                
+                execution_time = min(time_quantum, process.remaining_time)
+                start_time = self.current_time
+                self.current_time += execution_time
+                process.remaining_time -= execution_time
+                yield self._slot(process.process_id, start_time, self.current_time)
+                
+                if process.remaining_time == 0:
+                    yield self._complete(seq)
+                else:
+                    while not self._known(self.current_time):
+                        yield _WAIT
+                    ready_queue.extend(self._admit(self.current_time))
+                    ready_queue.append(seq)
+                
+                self.current_time += self.context_switch_time
+                self.context_switches += 1
+            else:
+                while self._more_work() is None:
+                    yield _WAIT
+                if not self._pending:
+                    return
+                yield self._idle()
+    
+    def _preemptive_priority(self):
+        active = self._active
+        ready_heap = []
+        current_key = None
+        
+        def push(seq):
+            process = active[seq]
+            heapq.heappush(ready_heap, (-process.priority, process.arrival_time, seq))
+        
+        while True:
+            while not self._known(self.current_time):
+                yield _WAIT
+            for seq in self._admit(self.current_time):
+                push(seq)
+            
+            if current_key is not None:
+                if ready_heap and ready_heap[0] < current_key:
+                    heapq.heappush(ready_heap, current_key)
+                    current_key = heapq.heappop(ready_heap)
+                    self.context_switches += 1
+                    self.current_time += self.context_switch_time
+            elif ready_heap:
+                current_key = heapq.heappop(ready_heap)
+            else:
+                while self._more_work() is None:
+                    yield _WAIT
+                if not self._pending:
+                    return
+                yield self._idle()
+                continue
+            
+            seq = current_key[2]
+            process = active[seq]
+            if process.start_time is None:
+                process.start_time = self.current_time
+            start_time = self.current_time
+            
+            while True:
+                # Sıçrama bir sonraki varışta, akış açıksa en geç su seviyesinde durur; orada yeniden denetlenir
+                while not self._known(self.current_time):
+                    yield _WAIT
+                limit = self._pending[0][0] if self._pending else math.inf
+                if not self._finished:
+                    limit = min(limit, self._watermark)
+                self.current_time, process.remaining_time = advance_units(
+                    self.current_time, process.remaining_time, limit)
+                if process.remaining_time == 0:
+                    preempted = False
+                    break
+                
+                while not self._known(self.current_time):
+                    yield _WAIT
+                for admitted in self._admit(self.current_time):
+                    push(admitted)
+                
+                if ready_heap and ready_heap[0] < current_key:
+                    preempted = True
+                    break
+            
+            yield self._slot(process.process_id, start_time, self.current_time)
+            
+            if not preempted:
+                yield self._complete(seq)
+                current_key = None
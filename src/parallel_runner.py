@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+from .binary_workload import load_workload, write_workload
+from .process import SchedulingResult
+from .profiling import Profiler
+from .result_cache import ResultCache
+from .result_generator import ResultGenerator
+from .scheduling_algorithms import ALGORITHMS, SchedulingAlgorithm
+from .workload import as_workload
+
+# İşçi süreç başına eşlenmiş iş yükleri; aynı dosya bir kez eşlenir
+_WORKER_WORKLOADS = {}
+
+def _worker_workload(path: str):
+    workload = _WORKER_WORKLOADS.get(path)
+    if workload is None:
+        workload = _WORKER_WORKLOADS[path] = load_workload(path)
+    return workload
+
+def _run_task(task):
+    (case_name, workload_path, algorithm_name, method_name, kwargs,
+     scheduler, result_generator, profile) = task
+    workload = _worker_workload(workload_path)
+    profiler = Profiler(track_memory=True) if profile else None
+    
+    sink = None
+    if result_generator is not None:
+        sink = result_generator.create_timeline_sink(algorithm_name, case_name)
+    
+    start_time = time.perf_counter()
+    result = getattr(scheduler, method_name)(workload, sink=sink, profiler=profiler, **kwargs)
+    execution_time = time.perf_counter() - start_time
+    
+    result_file = None
+    if result_generator is not None:
+        result_file = result_generator.generate_result_file(result, case_name)
+    else:
+        result.calculate_metrics()
+    return case_name, algorithm_name, result, execution_time, result_file
+
+class ParallelRunner:
+    def __init__(self, context_switch_time=0.001, result_generator: Optional[ResultGenerator] = None,
+                 max_workers: Optional[int] = None, result_cache: Optional[ResultCache] = None,
+                 profile: bool = False, scheduler=None):
+        self.context_switch_time = context_switch_time
+        self.result_generator = result_generator
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.result_cache = result_cache
+        self.profile = profile
+        # Çok çekirdekli zamanlayıcı gibi farklı bir zamanlayıcı işçilere olduğu gibi gönderilir
+        self.scheduler = scheduler or SchedulingAlgorithm(context_switch_time)
+    
+    def run(self, cases: Dict[str, object], algorithms: Optional[List[Tuple[str, str, dict]]] = None,
+            progress=None) -> Dict[str, Dict[str, SchedulingResult]]:
+        algorithms = algorithms or ALGORITHMS
+        workloads = {case_name: as_workload(processes) for case_name, processes in cases.items()}
+        collected = {}
+        cache_keys = {}
+        
+        if self.result_cache is not None:
+            for case_name, workload in workloads.items():
+                for algorithm_name, _, kwargs in algorithms:
+                    key = self.result_cache.key(workload, algorithm_name, kwargs, self.context_switch_time,
+                                                getattr(self.scheduler, "time_resolution", None))
+                    result = self.result_cache.get(key, workload)
+                    if result is None:
+                        cache_keys[(case_name, algorithm_name)] = key
+                        continue
+                    collected[(case_name, algorithm_name)] = result
+                    result_file = None
+                    if self.result_generator is not None:
+                        result_file = self.result_generator.generate_result_file(result, case_name)
+                    if progress is not None:
+                        progress(case_name, algorithm_name, None, result_file)
+        
+        temp_dir = tempfile.mkdtemp(prefix="cpu_zamanlama_")
+        try:
+            tasks = []
+            workload_paths = {}
+            for case_name, workload in workloads.items():
+                for algorithm_name, method_name, kwargs in algorithms:
+                    if (case_name, algorithm_name) in collected:
+                        continue
+                    if case_name not in workload_paths:
+                        workload_paths[case_name] = os.path.join(temp_dir, f"{case_name}.cpuw")
+                        write_workload(workload, workload_paths[case_name])
+                    tasks.append((case_name, workload_paths[case_name], algorithm_name, method_name, kwargs,
+                                  self.scheduler, self.result_generator, self.profile))
+            
+            if tasks:
+                with ProcessPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+                    futures = [executor.submit(_run_task, task) for task in tasks]
+                    for future in as_completed(futures):
+                        case_name, algorithm_name, result, execution_time, result_file = future.result()
+                        result.bind_workload(workloads[case_name])
+                        collected[(case_name, algorithm_name)] = result
+                        if (case_name, algorithm_name) in cache_keys:
+                            self.result_cache.put(cache_keys[(case_name, algorithm_name)], result)
+                        if progress is not None:
+                            progress(case_name, algorithm_name, execution_time, result_file)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        
+        return {
+            case_name: {
+                algorithm_name: collected[(case_name, algorithm_name)]
+                for algorithm_name, _, _ in algorithms
+            }
+            for case_name in workloads
+        }
@@ -1,6 +1,15 @@
-from dataclasses import dataclass
-from typing import Optional
+import bisect
+import itertools
+import math
+import operator
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
 from enum import Enum
+from .profiling import profile_phase
+
+DEFAULT_THROUGHPUT_HORIZONS = (50, 100, 150, 200)
+_METRIC_INPUTS = {'time_slots', 'processes', 'context_switches', 'total_time', 'workload', 'state', 'busy_time',
+                  'multicore'}
 
 class Priority(Enum):
     HIGH = 3
@@ -36,6 +45,8 @@ class Process:
 
 @dataclass
 class TimeSlot:
+    __slots__ = ('process_id', 'start_time', 'end_time', 'duration')
+    
     process_id: str
     start_time: float
     end_time: float
@@ -50,52 +61,128 @@ class SchedulingResult:
     processes: list[Process]
     context_switches: int = 0
     total_time: float = 0
+    workload: object = field(default=None, repr=False, compare=False)
+    state: object = field(default=None, repr=False, compare=False)
+    busy_time: Optional[float] = None
+    timeline_file: Optional[str] = None
+    profiler: object = field(default=None, repr=False, compare=False)
+    multicore: object = field(default=None, repr=False, compare=False)
     
-    def calculate_metrics(self):
-        if not self.processes:
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in _METRIC_INPUTS:
+            self.invalidate_metrics()
+    
+    def __getstate__(self):
+        # İş yükü seri hale getirilmez; alıcı taraf bind_workload ile yeniden bağlar
+        state = dict(self.__dict__)
+        state['workload'] = None
+        if not isinstance(self.processes, list):
+            state['processes'] = None
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+    
+    def bind_workload(self, workload):
+        from .workload import ProcessView
+        object.__setattr__(self, 'workload', workload)
+        if self.processes is None:
+            object.__setattr__(self, 'processes', ProcessView(workload, self.state))
+    
+    def invalidate_metrics(self):
+        object.__setattr__(self, '_metrics_cache', None)
+    
+    def calculate_metrics(self, throughput_horizons: Optional[Iterable[float]] = None):
+        cache = self._metrics_cache
+        fingerprint = (len(self.time_slots), len(self.processes))
+        if cache is None or cache[0] != fingerprint:
+            with profile_phase(self.profiler, "metrics"):
+                cache = (fingerprint, self._compute_metrics())
+            object.__setattr__(self, '_metrics_cache', cache)
+        
+        metrics, completion_times = cache[1]
+        if metrics is None:
             return None
         
-        waiting_times = []
-        turnaround_times = []
+        horizons = set(DEFAULT_THROUGHPUT_HORIZONS)
+        if throughput_horizons is not None:
+            horizons.update(throughput_horizons)
+        curve = [(horizon, bisect.bisect_right(completion_times, horizon)) for horizon in sorted(horizons)]
         
-        for process in self.processes:
-            if process.completion_time is not None:
-                process.turnaround_time = process.completion_time - process.arrival_time
-                process.waiting_time = process.turnaround_time - process.cpu_burst_time
-                
-                waiting_times.append(process.waiting_time)
-                turnaround_times.append(process.turnaround_time)
+        metrics = dict(metrics)
+        for horizon, completed in curve:
+            metrics[f'throughput_{_horizon_label(horizon)}'] = completed
+        metrics['throughput_curve'] = curve
+        return metrics
+    
+    def throughput_curve(self, horizons: Iterable[float]) -> list[tuple]:
+        horizons = list(horizons)
+        metrics = self.calculate_metrics(horizons)
+        if metrics is None:
+            return [(horizon, 0) for horizon in horizons]
+        counts = dict(metrics['throughput_curve'])
+        return [(horizon, counts[horizon]) for horizon in horizons]
+    
+    def _compute_metrics(self):
+        if not self.processes:
+            return None, []
         
-        if not waiting_times:
-            return None
-            
-        avg_waiting_time = sum(waiting_times) / len(waiting_times)
-        max_waiting_time = max(waiting_times)
-        avg_turnaround_time = sum(turnaround_times) / len(turnaround_times)
-        max_turnaround_time = max(turnaround_times)
+        arrival_times, burst_times, completion_times = self._completed_columns()
+        if not completion_times:
+            return None, []
         
-        busy_time = sum(slot.duration for slot in self.time_slots 
-                       if slot.process_id != "IDLE")
-        cpu_efficiency = (busy_time / self.total_time * 100) if self.total_time > 0 else 0
+        turnaround_times = list(map(operator.sub, completion_times, arrival_times))
+        waiting_times = list(map(operator.sub, turnaround_times, burst_times))
         
-        throughput_50 = sum(1 for p in self.processes 
-                          if p.completion_time and p.completion_time <= 50)
-        throughput_100 = sum(1 for p in self.processes 
-                           if p.completion_time and p.completion_time <= 100)
-        throughput_150 = sum(1 for p in self.processes 
-                           if p.completion_time and p.completion_time <= 150)
-        throughput_200 = sum(1 for p in self.processes 
-                           if p.completion_time and p.completion_time <= 200)
+        if isinstance(self.processes, list):
+            completed = [p for p in self.processes if p.completion_time is not None]
+            for process, turnaround_time, waiting_time in zip(completed, turnaround_times, waiting_times):
+                process.turnaround_time = turnaround_time
+                process.waiting_time = waiting_time
         
-        return {
-            'avg_waiting_time': avg_waiting_time,
-            'max_waiting_time': max_waiting_time,
-            'avg_turnaround_time': avg_turnaround_time,
-            'max_turnaround_time': max_turnaround_time,
+        busy_time = self.busy_time
+        if busy_time is None and hasattr(self.time_slots, 'busy_time'):
+            busy_time = self.time_slots.busy_time()
+        elif busy_time is None:
+            busy_time = sum(slot.duration for slot in self.time_slots 
+                           if slot.process_id != "IDLE")
+        cpu_count = self.multicore.cpu_count if self.multicore is not None else 1
+        cpu_efficiency = (busy_time / (self.total_time * cpu_count) * 100) if self.total_time > 0 else 0
+        
+        metrics = {
+            'avg_waiting_time': sum(waiting_times) / len(waiting_times),
+            'max_waiting_time': max(waiting_times),
+            'avg_turnaround_time': sum(turnaround_times) / len(turnaround_times),
+            'max_turnaround_time': max(turnaround_times),
             'cpu_efficiency': cpu_efficiency,
-            'context_switches': self.context_switches,
-            'throughput_50': throughput_50,
-            'throughput_100': throughput_100,
-            'throughput_150': throughput_150,
-            'throughput_200': throughput_200
-        }
\ No newline at end of file
+            'context_switches': self.context_switches
+        }
+        if self.multicore is not None:
+            metrics['cpu_count'] = cpu_count
+            metrics['placement'] = self.multicore.placement
+            metrics['cpu_utilization'] = self.multicore.utilization(self.total_time)
+            metrics['migrations'] = self.multicore.migrations
+        return metrics, sorted(t for t in completion_times if t)
+    
+    def _completed_columns(self):
+        if not isinstance(self.processes, list) and self.state is not None:
+            arrival_times = self.workload.arrival_times
+            burst_times = self.workload.burst_times
+            completion_times = self.state.completion_times
+            if not any(map(math.isnan, completion_times)):
+                return arrival_times, burst_times, completion_times
+            completed = [not math.isnan(t) for t in completion_times]
+            return (list(itertools.compress(arrival_times, completed)),
+                    list(itertools.compress(burst_times, completed)),
+                    list(itertools.compress(completion_times, completed)))
+        
+        completed = [p for p in self.processes if p.completion_time is not None]
+        return ([p.arrival_time for p in completed],
+                [p.cpu_burst_time for p in completed],
+                [p.completion_time for p in completed])
+
+def _horizon_label(horizon) -> str:
+    if float(horizon).is_integer():
+        return str(int(horizon))
+    return str(horizon)
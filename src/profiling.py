@@ -0,0 +1,168 @@
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, List, Optional
+
+# Rapor ve profil çıktılarında aşama adlarının karşılıkları
+PHASE_LABELS = {
+    "prepare": "Hazırlık",
+    "schedule": "Zamanlama",
+    "collect": "Sonuç toplama",
+    "metrics": "Metrikler",
+    "report": "Rapor yazımı"
+}
+
+class PhaseStats:
+    __slots__ = ('calls', 'seconds', 'allocated', 'peak')
+    
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.allocated = None
+        self.peak = None
+    
+    def as_dict(self) -> dict:
+        return {'calls': self.calls, 'seconds': self.seconds, 'allocated': self.allocated, 'peak': self.peak}
+
+class _Frame:
+    __slots__ = ('name', 'start', 'base_memory', 'peak_seen')
+    
+    def __init__(self, name: str, start: float, base_memory: int):
+        self.name = name
+        self.start = start
+        self.base_memory = base_memory
+        self.peak_seen = 0
+
+class Profiler:
+    def __init__(self, track_memory: bool = False):
+        self.track_memory = track_memory
+        self.phases: Dict[str, PhaseStats] = {}
+        self.counters: Dict[str, int] = {}
+        self.histograms: Dict[str, Counter] = {}
+        self._listeners: List[Callable] = []
+        self._stack: List[_Frame] = []
+        self._owns_tracing = False
+    
+    def __getstate__(self):
+        # Dinleyiciler işçi süreçlere ya da önbelleğe taşınmaz
+        state = {name: getattr(self, name) for name in ('track_memory', 'phases', 'counters', 'histograms')}
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._listeners = []
+        self._stack = []
+        self._owns_tracing = False
+    
+    def add_listener(self, callback: Callable[[str, str, object], None]):
+        # callback(olay, ad, değer); olaylar: "phase", "count", "histogram"
+        self._listeners.append(callback)
+    
+    def remove_listener(self, callback: Callable[[str, str, object], None]):
+        self._listeners.remove(callback)
+    
+    def _notify(self, event: str, name: str, value):
+        for callback in self._listeners:
+            callback(event, name, value)
+    
+    @contextmanager
+    def phase(self, name: str):
+        tracing = self._begin_tracing()
+        base_memory = 0
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                # İç aşama tepe değerini sıfırlamadan önce dış aşamanınki saklanır
+                parent = self._stack[-1]
+                parent.peak_seen = max(parent.peak_seen, peak)
+            tracemalloc.reset_peak()
+            base_memory = current
+        
+        frame = _Frame(name, time.perf_counter(), base_memory)
+        self._stack.append(frame)
+        try:
+            yield self
+        finally:
+            elapsed = time.perf_counter() - frame.start
+            self._stack.pop()
+            
+            stats = self.phases.get(name)
+            if stats is None:
+                stats = self.phases[name] = PhaseStats()
+            stats.calls += 1
+            stats.seconds += elapsed
+            
+            call = {'seconds': elapsed, 'allocated': None, 'peak': None}
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(frame.peak_seen, peak)
+                if self._stack:
+                    parent = self._stack[-1]
+                    parent.peak_seen = max(parent.peak_seen, peak)
+                call['allocated'] = current - frame.base_memory
+                call['peak'] = peak - frame.base_memory
+                stats.allocated = (stats.allocated or 0) + call['allocated']
+                stats.peak = max(stats.peak or 0, call['peak'])
+            self._end_tracing()
+            self._notify("phase", name, call)
+    
+    def _begin_tracing(self) -> bool:
+        if not self.track_memory:
+            return False
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        return True
+    
+    def _end_tracing(self):
+        if self._owns_tracing and not self._stack:
+            tracemalloc.stop()
+            self._owns_tracing = False
+    
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+        self._notify("count", name, amount)
+    
+    def histogram(self, name: str) -> Counter:
+        # Motorlar sıcak döngüde doğrudan bu sayaca yazar; dinleyiciler flush ile bilgilendirilir
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Counter()
+        return histogram
+    
+    def flush(self):
+        for name, histogram in self.histograms.items():
+            self._notify("histogram", name, histogram)
+    
+    def snapshot(self) -> dict:
+        return {
+            'phases': {name: stats.as_dict() for name, stats in self.phases.items()},
+            'counters': dict(self.counters),
+            'histograms': {name: dict(histogram) for name, histogram in self.histograms.items()}
+        }
+
+def profile_phase(profiler: Optional[Profiler], name: str):
+    return profiler.phase(name) if profiler is not None else nullcontext()
+
+def histogram_buckets(histogram: Dict[int, int]) -> List[tuple]:
+    # 0, 1, 2-3, 4-7, ... şeklinde ikinin kuvveti aralıkları
+    buckets = {}
+    for value, count in histogram.items():
+        bucket = value.bit_length()
+        buckets[bucket] = buckets.get(bucket, 0) + count
+    
+    rows = []
+    for bucket in sorted(buckets):
+        low = 0 if bucket == 0 else 1 << (bucket - 1)
+        high = 0 if bucket == 0 else (1 << bucket) - 1
+        label = str(low) if low == high else f"{low}-{high}"
+        rows.append((label, buckets[bucket]))
+    return rows
+
+def histogram_summary(histogram: Dict[int, int]) -> tuple:
+    total = sum(histogram.values())
+    if total == 0:
+        return 0, 0.0, 0
+    mean = sum(value * count for value, count in histogram.items()) / total
+    return total, mean, max(histogram)
@@ -0,0 +1,236 @@
+import math
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+from .binary_workload import write_workload
+from .metrics_accumulator import RunningMoments, QuantileSketch
+from .parallel_runner import _worker_workload
+from .process import DEFAULT_THROUGHPUT_HORIZONS, _horizon_label
+from .scheduling_algorithms import ALGORITHMS, SchedulingAlgorithm
+from .slot_sinks import NullSlotSink
+from .workload import Workload, as_workload
+from .workload_generator import WorkloadGenerator
+
+# Replikasyonlar arasında dağılımı izlenen metrikler; throughput ufukları sonradan eklenir
+REPLICATION_METRICS = ("avg_waiting_time", "max_waiting_time", "avg_turnaround_time",
+                       "max_turnaround_time", "cpu_efficiency", "context_switches")
+
+# Özet raporda gösterilen yüzdelikler
+REPORT_PERCENTILES = (5, 50, 95, 99)
+
+# Kaynak iş yükü verilmediğinde üretilen iş yüklerinin süreç sayısı
+DEFAULT_REPLICATION_SIZE = 100
+
+class ReplicationStats(RunningMoments):
+    __slots__ = ('sketch',)
+    
+    def __init__(self, relative_accuracy: float = 0.01):
+        super().__init__()
+        # Yüzdelikler sınırlı boyutlu özetten okunur; bellek replikasyon sayısıyla büyümez
+        self.sketch = QuantileSketch(relative_accuracy)
+    
+    def add(self, value: float):
+        super().add(value)
+        self.sketch.add(value)
+    
+    def merge(self, other: 'ReplicationStats'):
+        super().merge(other)
+        self.sketch.merge(other.sketch)
+    
+    def percentile(self, q: float) -> float:
+        return self.sketch.percentile(q)
+    
+    def confidence_interval(self, confidence: float = 0.95) -> Tuple[float, float]:
+        if self.count < 2:
+            return self.mean, self.mean
+        half_width = t_quantile(1 - (1 - confidence) / 2, self.count - 1) * self.stdev / math.sqrt(self.count)
+        return self.mean - half_width, self.mean + half_width
+
+def t_quantile(p: float, degrees_of_freedom: int) -> float:
+    # Student t dağılımının ters CDF'i: 1 ve 2 serbestlik derecesinde kapalı form; üzerinde
+    # Cornish-Fisher açılımından (Hill, 1970) başlayıp tam CDF üzerinde Newton adımlarıyla düzeltilir
+    n = degrees_of_freedom
+    if n == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if n == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    if p < 0.5:
+        return -t_quantile(1 - p, n)
+    if p == 0.5:
+        return 0.0
+    z = statistics.NormalDist().inv_cdf(p)
+    t = (z + (z ** 3 + z) / (4 * n)
+         + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * n ** 2)
+         + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * n ** 3)
+         + (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / (92160 * n ** 4))
+    
+    log_density = math.lgamma((n + 1) / 2) - math.lgamma(n / 2) - 0.5 * math.log(n * math.pi)
+    for _ in range(50):
+        density = math.exp(log_density - (n + 1) / 2 * math.log1p(t * t / n))
+        step = (_t_cdf(t, n) - p) / density
+        # Sağ kuyrukta CDF içbükeydir; sıfırın altına düşen adım yarıya indirilir
+        t = t - step if t - step > 0 else t / 2
+        if abs(step) <= 1e-12 * max(1.0, t):
+            break
+    return t
+
+def _t_cdf(t: float, n: int) -> float:
+    tail = 0.5 * _regularized_beta(n / (n + t * t), n / 2, 0.5)
+    return 1 - tail if t > 0 else tail
+
+def _regularized_beta(x: float, a: float, b: float) -> float:
+    # I_x(a, b); sürekli kesir (Lentz) yakınsamanın hızlı olduğu tarafta hesaplanır
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                     + a * math.log(x) + b * math.log1p(-x))
+    if x < (a + 1) / (a + b + 2):
+        return front * _beta_continued_fraction(x, a, b) / a
+    return 1 - front * _beta_continued_fraction(1 - x, b, a) / b
+
+def _beta_continued_fraction(x: float, a: float, b: float) -> float:
+    tiny = 1e-300
+    c = 1.0
+    d = 1 - (a + b) * x / (a + 1)
+    d = 1 / (d if abs(d) > tiny else tiny)
+    result = d
+    for m in range(1, 300):
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1 + numerator * d
+            d = 1 / (d if abs(d) > tiny else tiny)
+            c = 1 + numerator / c
+            if abs(c) < tiny:
+                c = tiny
+            delta = c * d
+            result *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return result
+
+@dataclass
+class ReplicationSummary:
+    replications: int
+    seed: int
+    process_count: int
+    source: str
+    confidence: float
+    metric_names: List[str]
+    percentiles: Tuple[float, ...] = REPORT_PERCENTILES
+    stats: Dict[str, Dict[str, ReplicationStats]] = field(default_factory=dict)
+    execution_time: float = 0
+
+def resample_workload(workload: Workload, rng: random.Random, count: Optional[int] = None) -> Workload:
+    # Önyükleme (bootstrap): satırlar yerine koyarak seçilir, kimlikler yeniden verilir
+    size = len(workload)
+    count = size if count is None else count
+    rows = [rng.randrange(size) for _ in range(count)]
+    width = len(str(count))
+    return Workload.from_columns(
+        [f"P{i + 1:0{width}d}" for i in range(count)],
+        [workload.arrival_times[row] for row in rows],
+        [workload.burst_times[row] for row in rows],
+        [workload.priorities[row] for row in rows]
+    )
+
+def _run_replication_task(task):
+    (replications, process_count, source_path, generator_options, algorithms,
+     context_switch_time, metric_names, throughput_horizons) = task
+    scheduler = SchedulingAlgorithm(context_switch_time)
+    source = _worker_workload(source_path) if source_path is not None else None
+    
+    rows = []
+    for replication_seed in replications:
+        if source is not None:
+            workload = resample_workload(source, random.Random(replication_seed), process_count)
+        else:
+            workload = WorkloadGenerator(replication_seed, **generator_options).generate(process_count)
+        
+        for algorithm_name, method_name, kwargs in algorithms:
+            # Replikasyonlarda yalnızca metrikler gerekir; dilimler tutulmaz
+            result = getattr(scheduler, method_name)(workload, sink=NullSlotSink(), **kwargs)
+            metrics = result.calculate_metrics(throughput_horizons) or {}
+            rows.append((algorithm_name, [metrics.get(name, math.nan) for name in metric_names]))
+    return rows
+
+class ReplicationRunner:
+    def __init__(self, replications: int, process_count: Optional[int] = None, seed: int = 0,
+                 algorithms: Optional[List[Tuple[str, str, dict]]] = None, context_switch_time: float = 0.001,
+                 max_workers: Optional[int] = None, throughput_horizons: Optional[Iterable[float]] = None,
+                 confidence: float = 0.95, generator_options: Optional[dict] = None, chunk_size: int = 16):
+        if replications < 1:
+            raise ValueError("Replikasyon sayısı en az 1 olmalıdır")
+        if not 0 < confidence < 1:
+            raise ValueError("Güven düzeyi 0 ile 1 arasında olmalıdır")
+        self.replications = replications
+        self.process_count = process_count
+        self.seed = seed
+        self.algorithms = algorithms or ALGORITHMS
+        self.context_switch_time = context_switch_time
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.confidence = confidence
+        self.generator_options = generator_options or {}
+        self.chunk_size = chunk_size
+        
+        horizons = set(DEFAULT_THROUGHPUT_HORIZONS)
+        if throughput_horizons is not None:
+            horizons.update(throughput_horizons)
+        self.throughput_horizons = tuple(sorted(horizons))
+        self.metric_names = list(REPLICATION_METRICS) + [f"throughput_{_horizon_label(h)}"
+                                                         for h in self.throughput_horizons]
+    
+    def replication_seeds(self) -> List[int]:
+        # Her replikasyonun tohumu ana tohumdan türetilir; sonuçlar işçi sayısından bağımsızdır
+        rng = random.Random(self.seed)
+        return [rng.getrandbits(63) for _ in range(self.replications)]
+    
+    def run(self, source=None, progress=None) -> ReplicationSummary:
+        start_time = time.perf_counter()
+        summary = ReplicationSummary(
+            replications=self.replications,
+            seed=self.seed,
+            process_count=self.process_count or (len(source) if source is not None else DEFAULT_REPLICATION_SIZE),
+            source="önyükleme" if source is not None else "sentetik",
+            confidence=self.confidence,
+            metric_names=self.metric_names,
+            stats={algorithm_name: {name: ReplicationStats() for name in self.metric_names}
+                   for algorithm_name, _, _ in self.algorithms}
+        )
+        
+        seeds = self.replication_seeds()
+        temp_dir = tempfile.mkdtemp(prefix="cpu_replikasyon_") if source is not None else None
+        try:
+            source_path = None
+            if source is not None:
+                source_path = os.path.join(temp_dir, "kaynak.cpuw")
+                write_workload(as_workload(source), source_path)
+            
+            tasks = [(seeds[i:i + self.chunk_size], summary.process_count, source_path, self.generator_options,
+                      self.algorithms, self.context_switch_time, self.metric_names, self.throughput_horizons)
+                     for i in range(0, len(seeds), self.chunk_size)]
+            
+            completed = 0
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+                # Parçalar sırayla toplanır; bellekte yalnızca özet istatistikler kalır
+                for task, rows in zip(tasks, executor.map(_run_replication_task, tasks)):
+                    for algorithm_name, values in rows:
+                        algorithm_stats = summary.stats[algorithm_name]
+                        for name, value in zip(self.metric_names, values):
+                            algorithm_stats[name].add(value)
+                    completed += len(task[0])
+                    if progress is not None:
+                        progress(completed, self.replications)
+        finally:
+            if temp_dir is not None:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+        
+        summary.execution_time = time.perf_counter() - start_time
+        return summary
@@ -0,0 +1,98 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Optional
+from .process import SchedulingResult
+from .workload import Workload
+
+# Zamanlama motorları sonuçları değiştirecek şekilde güncellendiğinde artırılır
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = ".cpu_onbellek"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+class ResultCache:
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def key(self, workload: Workload, algorithm_name: str, kwargs: dict, context_switch_time: float,
+            time_resolution: Optional[int] = None) -> str:
+        parameters = ",".join(f"{name}={value!r}" for name, value in sorted(kwargs.items()))
+        text = f"{CACHE_VERSION}|{workload.fingerprint()}|{algorithm_name}|{parameters}|{context_switch_time!r}"
+        if time_resolution is not None:
+            # Tik modundaki sonuçlar kayan noktalı çalıştırmalarınkinden ayrı tutulur
+            text += f"|tik={time_resolution}"
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+    
+    def get(self, key: str, workload: Optional[Workload] = None) -> Optional[SchedulingResult]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                result = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # Bozuk kayıt sessizce atılır ve yeniden hesaplanır
+            self._remove(path)
+            self.misses += 1
+            return None
+        
+        # Erişim zamanı LRU sırası için güncellenir
+        os.utime(path)
+        if workload is not None:
+            result.bind_workload(workload)
+        self.hits += 1
+        return result
+    
+    def put(self, key: str, result: SchedulingResult):
+        if result.timeline_file is not None:
+            # Zaman çizelgesi dosyaya akıtılan sonuçlar eksik olduğundan saklanmaz
+            return
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            if os.path.getsize(temp_path) > self.max_bytes:
+                os.remove(temp_path)
+                return
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            self._remove(temp_path)
+            raise
+        self.evict()
+    
+    def evict(self):
+        entries = []
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".pkl"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                total += stat.st_size
+        
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+    
+    def clear(self):
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith((".pkl", ".tmp")):
+                self._remove(entry.path)
+    
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
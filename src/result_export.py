@@ -0,0 +1,312 @@
+import csv
+import json
+import math
+import operator
+import struct
+import sys
+from array import array
+from json.encoder import encode_basestring
+from typing import Dict, Iterable, List, Tuple
+from .process import SchedulingResult, _horizon_label
+from .slot_sinks import SlotSink
+from .timeline import Timeline
+from .workload import Workload, RunState
+
+EXPORT_FORMATS = ("jsonl", "csv", "columnar")
+EXPORT_EXTENSIONS = {"jsonl": ".jsonl", "csv": ".csv", "columnar": ".cpuc"}
+
+# (sütun adı, tip kodu); 's' metin, diğerleri array tip kodları
+PROCESS_SCHEMA = [
+    ("process_id", 's'),
+    ("arrival_time", 'd'),
+    ("cpu_burst_time", 'd'),
+    ("priority", 'b'),
+    ("start_time", 'd'),
+    ("completion_time", 'd'),
+    ("waiting_time", 'd'),
+    ("turnaround_time", 'd')
+]
+TIMELINE_SCHEMA = [
+    ("process_id", 's'),
+    ("start_time", 'd'),
+    ("end_time", 'd')
+]
+SUMMARY_METRICS = [
+    ("avg_waiting_time", 'd'),
+    ("max_waiting_time", 'd'),
+    ("avg_turnaround_time", 'd'),
+    ("max_turnaround_time", 'd'),
+    ("cpu_efficiency", 'd'),
+    ("context_switches", 'q'),
+    ("total_time", 'd')
+]
+
+_CHUNK_SIZE = 65536
+
+_COLUMNAR_MAGIC = b'CPUC'
+_COLUMNAR_VERSION = 1
+_COLUMNAR_HEADER = struct.Struct('<4sHHI')
+_GROUP_HEADER = struct.Struct('<Q')
+
+def _replace_nan(column, missing):
+    # Tamamlanmamış süreçlerin NaN değerleri yalnızca gerektiğinde dönüştürülür
+    if not any(map(math.isnan, column)):
+        return column
+    return [missing if math.isnan(value) else value for value in column]
+
+class JsonlWriter:
+    def __init__(self, path: str, schema: List[Tuple[str, str]]):
+        self.path = path
+        self._typecodes = [typecode for _, typecode in schema]
+        self._template = "{" + ",".join(f"{json.dumps(name)}:%s" for name, _ in schema) + "}\n"
+        self._file = open(path, 'w', encoding='utf-8')
+    
+    def write_rows(self, columns):
+        tokens = []
+        for typecode, column in zip(self._typecodes, columns):
+            if typecode == 's':
+                column = list(map(encode_basestring, column))
+            elif typecode == 'd':
+                column = _replace_nan(column, 'null')
+            tokens.append(column)
+        template = self._template
+        self._file.write("".join([template % row for row in zip(*tokens)]))
+    
+    def close(self):
+        self._file.close()
+
+class CsvWriter:
+    def __init__(self, path: str, schema: List[Tuple[str, str]]):
+        self.path = path
+        self._float_columns = [index for index, (_, typecode) in enumerate(schema) if typecode == 'd']
+        self._file = open(path, 'w', encoding='utf-8', newline='')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([name for name, _ in schema])
+    
+    def write_rows(self, columns):
+        columns = list(columns)
+        for index in self._float_columns:
+            columns[index] = _replace_nan(columns[index], '')
+        self._writer.writerows(zip(*columns))
+    
+    def close(self):
+        self._file.close()
+
+class ColumnarWriter:
+    def __init__(self, path: str, schema: List[Tuple[str, str]]):
+        self.path = path
+        self.schema = schema
+        self._file = open(path, 'wb')
+        flags = 1 if sys.byteorder == 'big' else 0
+        self._file.write(_COLUMNAR_HEADER.pack(_COLUMNAR_MAGIC, _COLUMNAR_VERSION, flags, len(schema)))
+        for name, typecode in schema:
+            encoded = name.encode('utf-8')
+            self._file.write(struct.pack('<H', len(encoded)) + encoded + typecode.encode('ascii'))
+    
+    def write_rows(self, columns):
+        columns = list(columns)
+        if not columns or not len(columns[0]):
+            return
+        # Her satır grubu sütunları ardışık bloklar halinde taşır
+        self._file.write(_GROUP_HEADER.pack(len(columns[0])))
+        for (_, typecode), column in zip(self.schema, columns):
+            if typecode == 's':
+                blob = '\x00'.join(column).encode('utf-8')
+                self._file.write(_GROUP_HEADER.pack(len(blob)))
+                self._file.write(blob)
+            elif isinstance(column, array) and column.typecode == typecode:
+                column.tofile(self._file)
+            elif isinstance(column, memoryview) and column.format == typecode:
+                self._file.write(column)
+            else:
+                array(typecode, column).tofile(self._file)
+    
+    def close(self):
+        self._file.close()
+
+_WRITERS = {"jsonl": JsonlWriter, "csv": CsvWriter, "columnar": ColumnarWriter}
+
+def open_writer(export_format: str, path: str, schema: List[Tuple[str, str]]):
+    if export_format not in _WRITERS:
+        raise ValueError(f"Geçersiz dışa aktarma biçimi: {export_format}")
+    return _WRITERS[export_format](path, schema)
+
+def read_columnar(path: str) -> Dict[str, object]:
+    with open(path, 'rb') as f:
+        magic, version, flags, column_count = _COLUMNAR_HEADER.unpack(f.read(_COLUMNAR_HEADER.size))
+        if magic != _COLUMNAR_MAGIC or version != _COLUMNAR_VERSION:
+            raise ValueError(f"Geçersiz sütunlu sonuç dosyası: {path}")
+        
+        schema = []
+        for _ in range(column_count):
+            (name_length,) = struct.unpack('<H', f.read(2))
+            name = f.read(name_length).decode('utf-8')
+            schema.append((name, f.read(1).decode('ascii')))
+        
+        columns = {name: [] if typecode == 's' else array(typecode) for name, typecode in schema}
+        while True:
+            header = f.read(_GROUP_HEADER.size)
+            if not header:
+                break
+            (row_count,) = _GROUP_HEADER.unpack(header)
+            for name, typecode in schema:
+                if typecode == 's':
+                    (blob_size,) = _GROUP_HEADER.unpack(f.read(_GROUP_HEADER.size))
+                    columns[name].extend(f.read(blob_size).decode('utf-8').split('\x00'))
+                else:
+                    columns[name].fromfile(f, row_count)
+    
+    if bool(flags & 1) != (sys.byteorder == 'big'):
+        for name, typecode in schema:
+            if typecode != 's':
+                columns[name].byteswap()
+    return columns
+
+def _result_columns(result: SchedulingResult) -> Tuple[Workload, RunState]:
+    if result.workload is not None and result.state is not None:
+        return result.workload, result.state
+    
+    workload = Workload.from_processes(list(result.processes))
+    state = workload.new_state()
+    for index, process in enumerate(result.processes):
+        if process.start_time is not None:
+            state.start_times[index] = process.start_time
+        if process.completion_time is not None:
+            state.completion_times[index] = process.completion_time
+    return workload, state
+
+def iter_process_chunks(result: SchedulingResult, chunk_size: int = _CHUNK_SIZE):
+    workload, state = _result_columns(result)
+    id_table = workload.id_table
+    for low in range(0, len(workload), chunk_size):
+        high = low + chunk_size
+        arrival_times = workload.arrival_times[low:high]
+        burst_times = workload.burst_times[low:high]
+        completion_times = state.completion_times[low:high]
+        turnaround_times = array('d', map(operator.sub, completion_times, arrival_times))
+        yield (
+            [id_table[position] for position in workload.id_index[low:high]],
+            arrival_times,
+            burst_times,
+            workload.priorities[low:high],
+            state.start_times[low:high],
+            completion_times,
+            array('d', map(operator.sub, turnaround_times, burst_times)),
+            turnaround_times
+        )
+
+def iter_timeline_chunks(time_slots, chunk_size: int = _CHUNK_SIZE):
+    if isinstance(time_slots, Timeline):
+        names = time_slots.names
+        for low in range(0, len(time_slots), chunk_size):
+            high = low + chunk_size
+            yield ([names[index] for index in time_slots.process_indices[low:high]],
+                   time_slots.start_times[low:high],
+                   time_slots.end_times[low:high])
+        return
+    
+    time_slots = list(time_slots)
+    for low in range(0, len(time_slots), chunk_size):
+        chunk = time_slots[low:low + chunk_size]
+        yield ([slot.process_id for slot in chunk],
+               [slot.start_time for slot in chunk],
+               [slot.end_time for slot in chunk])
+
+def export_processes(result: SchedulingResult, path: str, export_format: str) -> str:
+    writer = open_writer(export_format, path, PROCESS_SCHEMA)
+    try:
+        for columns in iter_process_chunks(result):
+            writer.write_rows(columns)
+    finally:
+        writer.close()
+    return path
+
+def export_timeline(time_slots, path: str, export_format: str) -> str:
+    writer = open_writer(export_format, path, TIMELINE_SCHEMA)
+    try:
+        for columns in iter_timeline_chunks(time_slots):
+            writer.write_rows(columns)
+    finally:
+        writer.close()
+    return path
+
+def export_summary(results: Dict[str, SchedulingResult], case_name: str, path: str, export_format: str,
+                   throughput_horizons=None) -> str:
+    rows = []
+    horizons = None
+    for algorithm_name, result in results.items():
+        metrics = result.calculate_metrics(throughput_horizons)
+        if not metrics:
+            continue
+        if horizons is None:
+            horizons = [horizon for horizon, _ in metrics['throughput_curve']]
+        row = [case_name, algorithm_name]
+        row.extend(result.total_time if name == "total_time" else metrics[name] for name, _ in SUMMARY_METRICS)
+        row.extend(completed for _, completed in metrics['throughput_curve'])
+        rows.append(row)
+    
+    schema = [("case", 's'), ("algorithm", 's')] + SUMMARY_METRICS
+    schema += [(f"throughput_{_horizon_label(horizon)}", 'q') for horizon in horizons or ()]
+    writer = open_writer(export_format, path, schema)
+    try:
+        writer.write_rows(list(zip(*rows)) if rows else [])
+    finally:
+        writer.close()
+    return path
+
+class TimelineExportSink(SlotSink):
+    def __init__(self, path: str, export_format: str, chunk_size: int = _CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+        self._writer = open_writer(export_format, path, TIMELINE_SCHEMA)
+        self._process_ids = []
+        self._start_times = array('d')
+        self._end_times = array('d')
+    
+    def emit(self, process_id: str, start_time: float, end_time: float):
+        self._process_ids.append(process_id)
+        self._start_times.append(start_time)
+        self._end_times.append(end_time)
+        if len(self._process_ids) >= self.chunk_size:
+            self._flush()
+    
+    def _flush(self):
+        if self._process_ids:
+            self._writer.write_rows([self._process_ids, self._start_times, self._end_times])
+            self._process_ids = []
+            self._start_times = array('d')
+            self._end_times = array('d')
+    
+    def close(self):
+        if self._writer is None:
+            return
+        self._flush()
+        self._writer.close()
+        self._writer = None
+
+def export_sweep(points: Iterable, case_name: str, path: str, export_format: str) -> str:
+    metric_names = [name for name, _ in SUMMARY_METRICS if name != "total_time"]
+    rows = []
+    horizons = None
+    for point in points:
+        if not point.metrics:
+            continue
+        if horizons is None:
+            horizons = [horizon for horizon, _ in point.metrics['throughput_curve']]
+        row = [case_name, point.algorithm_name,
+               math.nan if point.time_quantum is None else point.time_quantum, point.context_switch_time]
+        row.extend(point.metrics[name] for name in metric_names)
+        row.extend(completed for _, completed in point.metrics['throughput_curve'])
+        row.append(point.execution_time)
+        rows.append(row)
+    
+    schema = [("case", 's'), ("algorithm", 's'), ("time_quantum", 'd'), ("context_switch_time", 'd')]
+    schema += [entry for entry in SUMMARY_METRICS if entry[0] != "total_time"]
+    schema += [(f"throughput_{_horizon_label(horizon)}", 'q') for horizon in horizons or ()]
+    schema += [("execution_time", 'd')]
+    writer = open_writer(export_format, path, schema)
+    try:
+        writer.write_rows(list(zip(*rows)) if rows else [])
+    finally:
+        writer.close()
+    return path
@@ -1,125 +1,306 @@
+import itertools
 import os
-from typing import Dict, Any
-from .process import SchedulingResult
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional
+from .process import SchedulingResult, _horizon_label
+from .slot_sinks import SlotSink, FileSlotSink, TeeSlotSink, format_time_slot_line
+from .timeline import format_time_slot_lines
+from .profiling import PHASE_LABELS, profile_phase, histogram_buckets, histogram_summary
+from .result_export import (EXPORT_FORMATS, EXPORT_EXTENSIONS, TimelineExportSink, export_processes,
+                            export_timeline, export_summary, export_sweep)
+
+TIMELINE_MODES = ("full", "truncate", "sample", "skip")
+
+# Replikasyon raporundaki bölüm başlıkları
+REPLICATION_LABELS = {
+    "avg_waiting_time": "ORTALAMA BEKLEME SÜRESİ",
+    "max_waiting_time": "MAKSİMUM BEKLEME SÜRESİ",
+    "avg_turnaround_time": "ORTALAMA TAMAMLANMA SÜRESİ",
+    "max_turnaround_time": "MAKSİMUM TAMAMLANMA SÜRESİ",
+    "cpu_efficiency": "CPU VERİMLİLİĞİ (%)",
+    "context_switches": "BAĞLAM DEĞİŞTİRME SAYISI"
+}
+
+# Zaman çizelgesi bu kadar dilimlik parçalar halinde biçimlendirilip yazılır
+_TIMELINE_CHUNK = 65536
 
 class ResultGenerator:
-    def __init__(self, results_dir: str = "results"):
+    def __init__(self, results_dir: str = "results", throughput_horizons: Optional[Iterable[float]] = None,
+                 stream_timeline: bool = False, timeline_mode: str = "full", timeline_limit: int = 1000,
+                 background: bool = False, export_formats: Iterable[str] = (), time_decimals: int = 0):
+        if timeline_mode not in TIMELINE_MODES:
+            raise ValueError(f"Geçersiz zaman çizelgesi modu: {timeline_mode}")
+        for export_format in export_formats:
+            if export_format not in EXPORT_FORMATS:
+                raise ValueError(f"Geçersiz dışa aktarma biçimi: {export_format}")
         self.results_dir = results_dir
+        self.throughput_horizons = tuple(throughput_horizons) if throughput_horizons else None
+        self.stream_timeline = stream_timeline
+        self.timeline_mode = timeline_mode
+        self.timeline_limit = max(1, timeline_limit)
+        self.background = background
+        self.export_formats = tuple(export_formats)
+        # Tik modunda zaman çizelgesi tam sayıya kesilmeden tik çözünürlüğünde yazılır
+        self.time_decimals = time_decimals
+        self._executor = None
         os.makedirs(results_dir, exist_ok=True)
     
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        return state
+    
+    def _result_basename(self, algorithm_name: str, case_name: str) -> str:
+        return f"{case_name}_{algorithm_name.replace(' ', '_').replace('-', '_').lower()}"
+    
+    def _result_filename(self, algorithm_name: str, case_name: str) -> str:
+        return self._result_basename(algorithm_name, case_name) + "_sonuclari.txt"
+    
+    def _export_path(self, basename: str, kind: str, export_format: str) -> str:
+        return os.path.join(self.results_dir, f"{basename}_{kind}{EXPORT_EXTENSIONS[export_format]}")
+    
+    def create_timeline_sink(self, algorithm_name: str, case_name: str) -> Optional[SlotSink]:
+        if not self.stream_timeline:
+            return None
+        path = os.path.join(self.results_dir, "." + self._result_filename(algorithm_name, case_name) + ".zaman")
+        if not self.export_formats:
+            return FileSlotSink(path, decimals=self.time_decimals)
+        
+        # Dilimler bellekte tutulmadığından dışa aktarılan zaman çizelgeleri de akış sırasında yazılır
+        basename = self._result_basename(algorithm_name, case_name)
+        export_sinks = [TimelineExportSink(self._export_path(basename, "zaman", export_format), export_format)
+                        for export_format in self.export_formats]
+        return TeeSlotSink(FileSlotSink(path, decimals=self.time_decimals), *export_sinks)
+    
     def generate_result_file(self, result: SchedulingResult, case_name: str) -> str:
-        filename = f"{case_name}_{result.algorithm_name.replace(' ', '_').replace('-', '_').lower()}_sonuclari.txt"
+        with profile_phase(result.profiler, "report"):
+            return self._generate_result_file(result, case_name)
+    
+    def _generate_result_file(self, result: SchedulingResult, case_name: str) -> str:
+        filename = self._result_filename(result.algorithm_name, case_name)
         filepath = os.path.join(self.results_dir, filename)
+        metrics = result.calculate_metrics(self.throughput_horizons)
+        if self.export_formats:
+            self.export_result(result, case_name)
+        
+        out = [
+            "=" * 80 + "\n",
+            f"CPU Zamanlama Algoritması: {result.algorithm_name}\n",
+            f"Senaryo: {case_name}\n",
+            "=" * 80 + "\n\n"
+        ]
+        if metrics:
+            self._write_performance_metrics(out, metrics)
+            if result.multicore is not None:
+                self._write_multicore_metrics(out, result, metrics)
+            self._write_throughput_metrics(out, metrics)
         
         with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("=" * 80 + "\n")
-            f.write(f"CPU Zamanlama Algoritması: {result.algorithm_name}\n")
-            f.write(f"Senaryo: {case_name}\n")
-            f.write("=" * 80 + "\n\n")
-            
-            metrics = result.calculate_metrics()
+            f.write("".join(out))
+            self._write_time_table(f, result)
             
             if metrics:
-                self._write_performance_metrics(f, metrics)
-                self._write_throughput_metrics(f, metrics)
-            
-            self._write_time_table(f, result.time_slots)
-            
-            if metrics:
-                self._write_summary_statistics(f, metrics)
+                out = []
+                self._write_summary_statistics(out, metrics)
+                f.write("".join(out))
         
         return filepath
     
-    def _write_performance_metrics(self, f, metrics: Dict[str, Any]):
-        f.write("PERFORMANS METRİKLERİ\n")
-        f.write("-" * 40 + "\n")
-        f.write(f"Maksimum Bekleme Süresi: {metrics['max_waiting_time']:.3f} birim\n")
-        f.write(f"Ortalama Bekleme Süresi: {metrics['avg_waiting_time']:.3f} birim\n")
-        f.write(f"Maksimum Tamamlanma Süresi: {metrics['max_turnaround_time']:.3f} birim\n")
-        f.write(f"Ortalama Tamamlanma Süresi: {metrics['avg_turnaround_time']:.3f} birim\n")
-        f.write(f"Ortalama CPU Verimliliği: {metrics['cpu_efficiency']:.2f}%\n")
-        f.write(f"Toplam Bağlam Değiştirme: {metrics['context_switches']}\n")
-        f.write("\n")
+    def export_result(self, result: SchedulingResult, case_name: str) -> List[str]:
+        basename = self._result_basename(result.algorithm_name, case_name)
+        exported = []
+        for export_format in self.export_formats:
+            exported.append(export_processes(result, self._export_path(basename, "surecler", export_format),
+                                             export_format))
+            if result.timeline_file is None:
+                exported.append(export_timeline(result.time_slots, self._export_path(basename, "zaman", export_format),
+                                                export_format))
+        return exported
     
-    def _write_throughput_metrics(self, f, metrics: Dict[str, Any]):
-        f.write("THROUGHPUT METRİKLERİ\n")
-        f.write("-" * 40 + "\n")
-        f.write(f"T=50'de tamamlanan süreçler: {metrics['throughput_50']}\n")
-        f.write(f"T=100'de tamamlanan süreçler: {metrics['throughput_100']}\n")
-        f.write(f"T=150'de tamamlanan süreçler: {metrics['throughput_150']}\n")
-        f.write(f"T=200'de tamamlanan süreçler: {metrics['throughput_200']}\n")
-        f.write("\n")
+    def submit_result_file(self, result: SchedulingResult, case_name: str) -> Future:
+        # Profil ölçümü tracemalloc'u paylaştığı için raporlar bu durumda ön planda yazılır
+        if not self.background or result.profiler is not None:
+            future = Future()
+            future.set_result(self.generate_result_file(result, case_name))
+            return future
+        if self._executor is None:
+            # Tek yazıcı iş parçacığı raporları sırayla yazar; simülasyon bu sırada devam eder
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rapor")
+        return self._executor.submit(self.generate_result_file, result, case_name)
     
-    def _write_time_table(self, f, time_slots):
-        f.write("ZAMAN ÇİZELGESİ\n")
-        f.write("-" * 80 + "\n")
-        f.write("Süreç yürütme zaman çizelgesini gösteren zaman aralıkları:\n")
-        f.write("\n")
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def _write_performance_metrics(self, out: List[str], metrics: Dict[str, Any]):
+        out.append("PERFORMANS METRİKLERİ\n")
+        out.append("-" * 40 + "\n")
+        out.append(f"Maksimum Bekleme Süresi: {metrics['max_waiting_time']:.3f} birim\n")
+        out.append(f"Ortalama Bekleme Süresi: {metrics['avg_waiting_time']:.3f} birim\n")
+        out.append(f"Maksimum Tamamlanma Süresi: {metrics['max_turnaround_time']:.3f} birim\n")
+        out.append(f"Ortalama Tamamlanma Süresi: {metrics['avg_turnaround_time']:.3f} birim\n")
+        out.append(f"Ortalama CPU Verimliliği: {metrics['cpu_efficiency']:.2f}%\n")
+        out.append(f"Toplam Bağlam Değiştirme: {metrics['context_switches']}\n")
+        out.append("\n")
+    
+    def _write_multicore_metrics(self, out: List[str], result: SchedulingResult, metrics: Dict[str, Any]):
+        stats = result.multicore
+        out.append("ÇOK ÇEKİRDEKLİ ÇALIŞMA\n")
+        out.append("-" * 40 + "\n")
+        out.append(f"CPU Sayısı: {stats.cpu_count}\n")
+        out.append(f"Yerleştirme: {stats.placement}\n")
+        out.append(f"Toplam Göç: {stats.migrations}\n\n")
+        out.append(f"{'CPU':<8} {'Kullanım%':<12} {'Dağıtım':<10} {'Bğm Dğş':<8}\n")
+        for cpu, utilization in enumerate(metrics['cpu_utilization']):
+            out.append(f"{f'CPU {cpu}':<8} {utilization:<12.2f} {stats.dispatches[cpu]:<10} "
+                       f"{stats.context_switches[cpu]:<8}\n")
+        out.append("\n")
+    
+    def _write_throughput_metrics(self, out: List[str], metrics: Dict[str, Any]):
+        out.append("THROUGHPUT METRİKLERİ\n")
+        out.append("-" * 40 + "\n")
+        for horizon, completed in metrics['throughput_curve']:
+            out.append(f"T={_horizon_label(horizon)}'de tamamlanan süreçler: {completed}\n")
+        out.append("\n")
+    
+    def _write_time_table(self, f, result: SchedulingResult):
+        f.write("ZAMAN ÇİZELGESİ\n" + "-" * 80 + "\n"
+                + "Süreç yürütme zaman çizelgesini gösteren zaman aralıkları:\n\n")
         
-        for slot in time_slots:
-            if slot.process_id == "IDLE":
-                f.write(f"[ {int(slot.start_time):4d} ] - - BOŞTA - - [ {int(slot.end_time):4d} ]\n")
-            else:
-                f.write(f"[ {int(slot.start_time):4d} ] - - {slot.process_id} - - [ {int(slot.end_time):4d} ]\n")
+        if result.timeline_file and os.path.exists(result.timeline_file):
+            with open(result.timeline_file, 'r', encoding='utf-8') as timeline:
+                self._write_timeline_file(f, timeline)
+            os.remove(result.timeline_file)
+        elif result.multicore is not None and result.multicore.slot_cpus is not None:
+            self._write_multicore_slots(f, result.time_slots, result.multicore.slot_cpus)
+        else:
+            self._write_timeline_slots(f, result.time_slots)
         
         f.write("\n")
     
-    def _write_summary_statistics(self, f, metrics: Dict[str, Any]):
-        f.write("ÖZET İSTATİSTİKLER\n")
-        f.write("-" * 40 + "\n")
-        f.write(f"Bağlam Değiştirme Gecikmesi: {metrics['context_switches'] * 0.001:.6f} zaman birimi\n")
-        f.write(f"CPU Kullanımı: {metrics['cpu_efficiency']:.2f}%\n")
-        f.write("Genel Performans: ")
+    def _timeline_selection(self, slot_count: int):
+        if self.timeline_mode == "skip":
+            return 0, 1
+        if self.timeline_mode == "full" or slot_count <= self.timeline_limit:
+            return slot_count, 1
+        if self.timeline_mode == "truncate":
+            return self.timeline_limit, 1
+        return slot_count, -(-slot_count // self.timeline_limit)
+    
+    def _write_timeline_slots(self, f, time_slots):
+        slot_count = len(time_slots)
+        stop, step = self._timeline_selection(slot_count)
+        chunk = _TIMELINE_CHUNK * step
+        for chunk_start in range(0, stop, chunk):
+            f.write(format_time_slot_lines(time_slots, chunk_start, min(chunk_start + chunk, stop), step,
+                                           self.time_decimals))
+        self._write_timeline_note(f, slot_count, len(range(0, stop, step)), step)
+    
+    def _write_multicore_slots(self, f, time_slots, slot_cpus):
+        # Dilimler bitiş sırasıyla toplanır; rapor başlangıç zamanına göre sıralar
+        slot_count = len(time_slots)
+        stop, step = self._timeline_selection(slot_count)
+        start_times = time_slots.start_times
+        end_times = time_slots.end_times
+        names = ["BOŞTA" if name == "IDLE" else name for name in time_slots.names]
+        order = sorted(range(slot_count), key=lambda i: (start_times[i], slot_cpus[i]))
+        selected = order[0:stop:step]
+        process_indices = time_slots.process_indices
+        decimals = self.time_decimals
+        for chunk_start in range(0, len(selected), _TIMELINE_CHUNK):
+            f.write("".join(format_time_slot_line(f"CPU {slot_cpus[i]}: {names[process_indices[i]]}",
+                                                  start_times[i], end_times[i], decimals)
+                            for i in selected[chunk_start:chunk_start + _TIMELINE_CHUNK]))
+        self._write_timeline_note(f, slot_count, len(selected), step)
+    
+    def _write_timeline_file(self, f, timeline):
+        # Akışla yazılmış zaman çizelgesi rapora olduğu gibi eklenir
+        if self.timeline_mode == "full":
+            shutil.copyfileobj(timeline, f)
+            return
+        slot_count = sum(1 for _ in timeline)
+        timeline.seek(0)
+        stop, step = self._timeline_selection(slot_count)
+        f.writelines(itertools.islice(timeline, 0, stop, step))
+        self._write_timeline_note(f, slot_count, len(range(0, stop, step)), step)
+    
+    def _write_timeline_note(self, f, slot_count: int, shown: int, step: int):
+        if self.timeline_mode == "skip":
+            f.write(f"Zaman çizelgesi atlandı ({slot_count} dilim)\n")
+        elif step > 1:
+            f.write(f"... her {step}. dilim gösterildi ({shown}/{slot_count} dilim)\n")
+        elif shown < slot_count:
+            f.write(f"... {slot_count - shown} dilim daha gösterilmedi (toplam {slot_count} dilim)\n")
+    
+    def _write_summary_statistics(self, out: List[str], metrics: Dict[str, Any]):
+        out.append("ÖZET İSTATİSTİKLER\n")
+        out.append("-" * 40 + "\n")
+        out.append(f"Bağlam Değiştirme Gecikmesi: {metrics['context_switches'] * 0.001:.6f} zaman birimi\n")
+        out.append(f"CPU Kullanımı: {metrics['cpu_efficiency']:.2f}%\n")
+        out.append("Genel Performans: ")
         
         if metrics['avg_waiting_time'] < 5:
-            f.write("MÜKEMMEL (Düşük bekleme süreleri)\n")
+            out.append("MÜKEMMEL (Düşük bekleme süreleri)\n")
         elif metrics['avg_waiting_time'] < 15:
-            f.write("İYİ (Orta bekleme süreleri)\n")
+            out.append("İYİ (Orta bekleme süreleri)\n")
         elif metrics['avg_waiting_time'] < 30:
-            f.write("ORTA (Yüksek bekleme süreleri)\n")
+            out.append("ORTA (Yüksek bekleme süreleri)\n")
         else:
-            f.write("ZAYIF (Çok yüksek bekleme süreleri)\n")
+            out.append("ZAYIF (Çok yüksek bekleme süreleri)\n")
         
-        f.write("\n")
+        out.append("\n")
     
     def generate_comparison_report(self, results: Dict[str, SchedulingResult], case_name: str) -> str:
         filename = f"{case_name}_karsilastirma_raporu.txt"
         filepath = os.path.join(self.results_dir, filename)
         
+        out = [
+            "=" * 100 + "\n",
+            f"CPU ZAMANLAMA ALGORİTMALARI KARŞILAŞTIRMA RAPORU\n",
+            f"Senaryo: {case_name}\n",
+            "=" * 100 + "\n\n"
+        ]
+        self._write_comparison_table(out, results)
+        if any(result.multicore is not None for result in results.values()):
+            self._write_multicore_comparison(out, results)
+        self._write_algorithm_rankings(out, results)
+        if any(result.profiler is not None for result in results.values()):
+            self._write_profile(out, results)
+        
         with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("=" * 100 + "\n")
-            f.write(f"CPU ZAMANLAMA ALGORİTMALARI KARŞILAŞTIRMA RAPORU\n")
-            f.write(f"Senaryo: {case_name}\n")
-            f.write("=" * 100 + "\n\n")
-            
-            self._write_comparison_table(f, results)
-            self._write_algorithm_rankings(f, results)
+            f.write("".join(out))
+        
+        for export_format in self.export_formats:
+            export_summary(results, case_name, self._export_path(case_name, "ozet", export_format), export_format,
+                           self.throughput_horizons)
         
         return filepath
     
-    def _write_comparison_table(self, f, results: Dict[str, SchedulingResult]):
-        f.write("KARŞILAŞTIRMA TABLOSU\n")
-        f.write("-" * 140 + "\n")
-        f.write(f"{'Algoritma':<25} {'Ort Bek':<12} {'Max Bek':<12} {'Ort Tam':<12} {'Max Tam':<12} {'CPU Ver%':<10} {'Bğm Dğş':<8} {'Thr@100':<8}\n")
-        f.write("-" * 140 + "\n")
+    def _write_comparison_table(self, out: List[str], results: Dict[str, SchedulingResult]):
+        out.append("KARŞILAŞTIRMA TABLOSU\n")
+        out.append("-" * 140 + "\n")
+        out.append(f"{'Algoritma':<25} {'Ort Bek':<12} {'Max Bek':<12} {'Ort Tam':<12} {'Max Tam':<12} {'CPU Ver%':<10} {'Bğm Dğş':<8} {'Thr@100':<8}\n")
+        out.append("-" * 140 + "\n")
         
         for algorithm_name, result in results.items():
             metrics = result.calculate_metrics()
             if metrics:
-                f.write(f"{algorithm_name:<25} ")
-                f.write(f"{metrics['avg_waiting_time']:<12.3f} ")
-                f.write(f"{metrics['max_waiting_time']:<12.3f} ")
-                f.write(f"{metrics['avg_turnaround_time']:<12.3f} ")
-                f.write(f"{metrics['max_turnaround_time']:<12.3f} ")
-                f.write(f"{metrics['cpu_efficiency']:<10.2f} ")
-                f.write(f"{metrics['context_switches']:<8} ")
-                f.write(f"{metrics['throughput_100']:<8}\n")
+                out.append(f"{algorithm_name:<25} ")
+                out.append(f"{metrics['avg_waiting_time']:<12.3f} ")
+                out.append(f"{metrics['max_waiting_time']:<12.3f} ")
+                out.append(f"{metrics['avg_turnaround_time']:<12.3f} ")
+                out.append(f"{metrics['max_turnaround_time']:<12.3f} ")
+                out.append(f"{metrics['cpu_efficiency']:<10.2f} ")
+                out.append(f"{metrics['context_switches']:<8} ")
+                out.append(f"{metrics['throughput_100']:<8}\n")
         
-        f.write("\n")
+        out.append("\n")
     
-    def _write_algorithm_rankings(self, f, results: Dict[str, SchedulingResult]):
-        f.write("METRİKLERE GÖRE ALGORİTMA SIRALAMALARI\n")
-        f.write("=" * 40 + "\n\n")
+    def _write_algorithm_rankings(self, out: List[str], results: Dict[str, SchedulingResult]):
+        out.append("METRİKLERE GÖRE ALGORİTMA SIRALAMALARI\n")
+        out.append("=" * 40 + "\n\n")
         
         metrics_data = {}
         for algorithm_name, result in results.items():
@@ -128,26 +309,217 @@ class ResultGenerator:
                 metrics_data[algorithm_name] = metrics
         
         if metrics_data:
-            f.write("1. Ortalama Bekleme Süresine Göre (düşük daha iyi):\n")
+            out.append("1. Ortalama Bekleme Süresine Göre (düşük daha iyi):\n")
             sorted_by_wait = sorted(metrics_data.items(), key=lambda x: x[1]['avg_waiting_time'])
             for i, (alg, metrics) in enumerate(sorted_by_wait, 1):
-                f.write(f"   {i}. {alg}: {metrics['avg_waiting_time']:.3f}\n")
-            f.write("\n")
+                out.append(f"   {i}. {alg}: {metrics['avg_waiting_time']:.3f}\n")
+            out.append("\n")
             
-            f.write("2. Ortalama Tamamlanma Süresine Göre (düşük daha iyi):\n")
+            out.append("2. Ortalama Tamamlanma Süresine Göre (düşük daha iyi):\n")
             sorted_by_turnaround = sorted(metrics_data.items(), key=lambda x: x[1]['avg_turnaround_time'])
             for i, (alg, metrics) in enumerate(sorted_by_turnaround, 1):
-                f.write(f"   {i}. {alg}: {metrics['avg_turnaround_time']:.3f}\n")
-            f.write("\n")
+                out.append(f"   {i}. {alg}: {metrics['avg_turnaround_time']:.3f}\n")
+            out.append("\n")
             
-            f.write("3. CPU Verimliliğine Göre (yüksek daha iyi):\n")
+            out.append("3. CPU Verimliliğine Göre (yüksek daha iyi):\n")
             sorted_by_efficiency = sorted(metrics_data.items(), key=lambda x: x[1]['cpu_efficiency'], reverse=True)
             for i, (alg, metrics) in enumerate(sorted_by_efficiency, 1):
-                f.write(f"   {i}. {alg}: {metrics['cpu_efficiency']:.2f}%\n")
-            f.write("\n")
+                out.append(f"   {i}. {alg}: {metrics['cpu_efficiency']:.2f}%\n")
+            out.append("\n")
             
-            f.write("4. T=100'de Throughput'a Göre (yüksek daha iyi):\n")
+            out.append("4. T=100'de Throughput'a Göre (yüksek daha iyi):\n")
             sorted_by_throughput = sorted(metrics_data.items(), key=lambda x: x[1]['throughput_100'], reverse=True)
             for i, (alg, metrics) in enumerate(sorted_by_throughput, 1):
-                f.write(f"   {i}. {alg}: {metrics['throughput_100']}\n")
-            f.write("\n")
\ No newline at end of file
+                out.append(f"   {i}. {alg}: {metrics['throughput_100']}\n")
+            out.append("\n")
+    
+    def _write_multicore_comparison(self, out: List[str], results: Dict[str, SchedulingResult]):
+        out.append("ÇOK ÇEKİRDEKLİ ÇALIŞMA\n")
+        out.append("-" * 100 + "\n")
+        out.append(f"{'Algoritma':<25} {'CPU':<5} {'Yerleştirme':<15} {'Göç':<10} {'Ort Kul%':<10} {'Min Kul%':<10} {'Max Kul%':<10}\n")
+        out.append("-" * 100 + "\n")
+        for algorithm_name, result in results.items():
+            metrics = result.calculate_metrics(self.throughput_horizons)
+            if not metrics or result.multicore is None:
+                continue
+            utilization = metrics['cpu_utilization']
+            out.append(f"{algorithm_name:<25} {metrics['cpu_count']:<5} {metrics['placement']:<15} "
+                       f"{metrics['migrations']:<10} {sum(utilization) / len(utilization):<10.2f} "
+                       f"{min(utilization):<10.2f} {max(utilization):<10.2f}\n")
+        out.append("\n")
+    
+    def _write_profile(self, out: List[str], results: Dict[str, SchedulingResult]):
+        out.append("PROFİL BİLGİLERİ\n")
+        out.append("=" * 40 + "\n\n")
+        
+        for algorithm_name, result in results.items():
+            profiler = result.profiler
+            if profiler is None:
+                continue
+            out.append(f"{algorithm_name}\n")
+            out.append("-" * 80 + "\n")
+            out.append(f"  {'Aşama':<16} {'Çağrı':<8} {'Süre (s)':<12} {'Net Bellek (MB)':<16} Tepe Bellek (MB)\n")
+            for name, stats in profiler.phases.items():
+                allocated = "-" if stats.allocated is None else f"{stats.allocated / 1e6:.3f}"
+                peak = "-" if stats.peak is None else f"{stats.peak / 1e6:.3f}"
+                out.append(f"  {PHASE_LABELS.get(name, name):<16} {stats.calls:<8} {stats.seconds:<12.6f} "
+                           f"{allocated:<16} {peak}\n")
+            
+            queue_lengths = profiler.histograms.get("ready_queue", {})
+            dispatches, mean_length, max_length = histogram_summary(queue_lengths)
+            # Her dağıtım ya tamamlanmayla ya da kesintiyle biter
+            out.append(f"  Dağıtım kararı: {dispatches}, kesinti: {max(0, dispatches - len(result.processes))}, "
+                       f"bağlam değiştirme: {result.context_switches}\n")
+            for name, value in sorted(profiler.counters.items()):
+                out.append(f"  {name}: {value}\n")
+            if dispatches:
+                out.append(f"  Hazır kuyruk uzunluğu (dağıtım anında): ortalama {mean_length:.2f}, "
+                           f"en fazla {max_length}\n")
+                for label, count in histogram_buckets(queue_lengths):
+                    out.append(f"    {label:<12} {count:>10} ({count / dispatches * 100:5.1f}%)\n")
+            out.append("\n")
+    
+    def generate_sweep_report(self, points: List, case_name: str) -> str:
+        filename = f"{case_name}_tarama_raporu.txt"
+        filepath = os.path.join(self.results_dir, filename)
+        points = [point for point in points if point.metrics]
+        
+        out = [
+            "=" * 100 + "\n",
+            "CPU ZAMANLAMA PARAMETRE TARAMASI RAPORU\n",
+            f"Senaryo: {case_name}\n",
+            f"Yapılandırma sayısı: {len(points)}\n",
+            "=" * 100 + "\n\n",
+            "TARAMA TABLOSU\n",
+            "-" * 140 + "\n",
+            f"{'Algoritma':<25} {'Kuantum':<8} {'Bğm Süre':<10} {'Ort Bek':<12} {'Max Bek':<12} {'Ort Tam':<12} {'Max Tam':<12} {'CPU Ver%':<10} {'Bğm Dğş':<8} {'Thr@100':<8}\n",
+            "-" * 140 + "\n"
+        ]
+        
+        ordered = sorted(points, key=lambda p: (p.algorithm_name, p.time_quantum or 0, p.context_switch_time))
+        for point in ordered:
+            metrics = point.metrics
+            quantum = "-" if point.time_quantum is None else f"{point.time_quantum:g}"
+            out.append(f"{point.algorithm_name:<25} {quantum:<8} {point.context_switch_time:<10g} "
+                       f"{metrics['avg_waiting_time']:<12.3f} {metrics['max_waiting_time']:<12.3f} "
+                       f"{metrics['avg_turnaround_time']:<12.3f} {metrics['max_turnaround_time']:<12.3f} "
+                       f"{metrics['cpu_efficiency']:<10.2f} {metrics['context_switches']:<8} "
+                       f"{metrics['throughput_100']:<8}\n")
+        out.append("\n")
+        
+        out.append("ALGORİTMA BAŞINA EN İYİ YAPILANDIRMA (ortalama bekleme süresine göre)\n")
+        out.append("=" * 40 + "\n")
+        best = {}
+        for point in ordered:
+            current = best.get(point.algorithm_name)
+            if current is None or point.metrics['avg_waiting_time'] < current.metrics['avg_waiting_time']:
+                best[point.algorithm_name] = point
+        for algorithm_name, point in sorted(best.items(), key=lambda x: x[1].metrics['avg_waiting_time']):
+            quantum = "" if point.time_quantum is None else f"kuantum={point.time_quantum:g}, "
+            out.append(f"   {algorithm_name}: {quantum}bağlam değiştirme={point.context_switch_time:g} "
+                       f"-> {point.metrics['avg_waiting_time']:.3f}\n")
+        out.append("\n")
+        
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write("".join(out))
+        
+        for export_format in self.export_formats:
+            export_sweep(points, case_name, self._export_path(case_name, "tarama", export_format), export_format)
+        
+        return filepath
+    
+    def generate_streaming_report(self, entries: List[tuple], case_name: str, batch_algorithms=()) -> str:
+        filename = f"{case_name}_akisli_metrikler.txt"
+        filepath = os.path.join(self.results_dir, filename)
+        entries = [(algorithm_name, metrics) for algorithm_name, metrics in entries if metrics]
+        percentiles = [key[len('waiting_time_'):] for key in (entries[0][1] if entries else {})
+                       if key.startswith('waiting_time_p')]
+        
+        out = [
+            "=" * 100 + "\n",
+            "CPU ZAMANLAMA AKIŞLI METRİK RAPORU\n",
+            f"Senaryo: {case_name}\n",
+            "Metrikler süreçler tamamlandıkça sabit bellekte toplanmıştır; yüzdelikler yaklaşık değerlerdir (%1 bağıl hata)\n"
+        ]
+        if batch_algorithms:
+            out.append(f"Not: {', '.join(batch_algorithms)} çevrimiçi modda desteklenmediğinden toplu motorla "
+                       "çalıştırılmıştır; bellek bu algoritmalarda süreç sayısıyla orantılıdır\n")
+        out += [
+            "=" * 100 + "\n\n",
+            "BEKLEME VE TAMAMLANMA SÜRELERİ\n",
+            "-" * 140 + "\n"
+        ]
+        header = f"{'Algoritma':<25} {'Tamamlanan':<12} {'Ort Bek':<12} {'Max Bek':<12} "
+        header += "".join(f"{'Bek ' + label:<12}" for label in percentiles)
+        out.append(header + f"{'Ort Tam':<12} {'Max Tam':<12}\n")
+        out.append("-" * 140 + "\n")
+        for algorithm_name, metrics in entries:
+            line = (f"{algorithm_name:<25} {metrics['completed']:<12} {metrics['avg_waiting_time']:<12.3f} "
+                    f"{metrics['max_waiting_time']:<12.3f} ")
+            line += "".join(f"{metrics['waiting_time_' + label]:<12.3f}" for label in percentiles)
+            out.append(line + f"{metrics['avg_turnaround_time']:<12.3f} {metrics['max_turnaround_time']:<12.3f}\n")
+        out.append("\n")
+        
+        out.append("CPU KULLANIMI VE THROUGHPUT\n")
+        out.append("-" * 140 + "\n")
+        horizons = [horizon for horizon, _ in entries[0][1]['throughput_curve']] if entries else []
+        header = f"{'Algoritma':<25} {'Meşgul':<14} {'Boşta':<14} {'CPU Ver%':<10} {'Bğm Dğş':<10} "
+        out.append(header + "".join(f"{'T=' + _horizon_label(horizon):<10}" for horizon in horizons) + "\n")
+        out.append("-" * 140 + "\n")
+        for algorithm_name, metrics in entries:
+            line = (f"{algorithm_name:<25} {metrics['busy_time']:<14.3f} {metrics['idle_time']:<14.3f} "
+                    f"{metrics['cpu_efficiency']:<10.2f} {metrics['context_switches']:<10} ")
+            out.append(line + "".join(f"{completed:<10}" for _, completed in metrics['throughput_curve']) + "\n")
+        out.append("\n")
+        
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write("".join(out))
+        return filepath
+    
+    def generate_replication_report(self, summary, name: str = "replikasyon") -> str:
+        filename = f"{name}_raporu.txt"
+        filepath = os.path.join(self.results_dir, filename)
+        confidence = f"%{summary.confidence * 100:g} GA"
+        percentile_labels = [f"p{q:g}" for q in summary.percentiles]
+        
+        out = [
+            "=" * 100 + "\n",
+            "CPU ZAMANLAMA MONTE CARLO REPLİKASYON RAPORU\n",
+            f"Replikasyon sayısı: {summary.replications}\n",
+            f"İş yükü kaynağı: {summary.source}, {summary.process_count} süreç, tohum {summary.seed}\n",
+            f"Toplam süre: {summary.execution_time:.2f}s\n",
+            "=" * 100 + "\n\n"
+        ]
+        
+        for metric_name in summary.metric_names:
+            if metric_name.startswith("throughput_"):
+                label = f"T={metric_name[len('throughput_'):]}'DE THROUGHPUT"
+            else:
+                label = REPLICATION_LABELS.get(metric_name, metric_name)
+            out.append(f"{label}\n")
+            out.append("-" * 140 + "\n")
+            header = f"{'Algoritma':<25} {'Ortalama':<12} {'Std Sapma':<12} {confidence:<25} "
+            header += "".join(f"{percentile_label:<12}" for percentile_label in percentile_labels)
+            out.append(header + f"{'En Düşük':<12} {'En Yüksek':<12}\n")
+            out.append("-" * 140 + "\n")
+            for algorithm_name, algorithm_stats in summary.stats.items():
+                stats = algorithm_stats[metric_name]
+                low, high = stats.confidence_interval(summary.confidence)
+                interval = f"[{low:.3f}, {high:.3f}]"
+                line = f"{algorithm_name:<25} {stats.mean:<12.3f} {stats.stdev:<12.3f} {interval:<25} "
+                line += "".join(f"{stats.percentile(q):<12.3f}" for q in summary.percentiles)
+                out.append(line + f"{stats.minimum:<12.3f} {stats.maximum:<12.3f}\n")
+            out.append("\n")
+        
+        out.append("ORTALAMA BEKLEME SÜRESİNE GÖRE SIRALAMA (düşük daha iyi)\n")
+        out.append("=" * 40 + "\n")
+        ranking = sorted(summary.stats.items(), key=lambda item: item[1]['avg_waiting_time'].mean)
+        for rank, (algorithm_name, algorithm_stats) in enumerate(ranking, 1):
+            stats = algorithm_stats['avg_waiting_time']
+            low, high = stats.confidence_interval(summary.confidence)
+            out.append(f"   {rank}. {algorithm_name}: {stats.mean:.3f} ({confidence}: {low:.3f} - {high:.3f})\n")
+        out.append("\n")
+        
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write("".join(out))
+        return filepath
@@ -1,406 +1,597 @@
-from typing import List
-from .process import Process, TimeSlot, SchedulingResult
+import heapq
+import math
+import operator
+from array import array
+from collections import deque
+from typing import List, Optional, Union
+from .process import Process, Priority, SchedulingResult
+from .dispatcher import NonPreemptiveDispatcher
+from .profiling import Profiler
+from .slot_sinks import SlotSink
+from .vectorized_fcfs import HAS_NUMPY, VECTORIZE_THRESHOLD, VectorizedFCFS
+from .workload import Workload, RunState, run_engine
+
+# (rapor adı, metot adı, ek parametreler)
+ALGORITHMS = [
+    ("FCFS", "schedule_fcfs", {}),
+    ("Preemptive SJF", "schedule_preemptive_sjf", {}),
+    ("Non-Preemptive SJF", "schedule_non_preemptive_sjf", {}),
+    ("Round Robin", "schedule_round_robin", {"time_quantum": 2}),
+    ("Preemptive Priority", "schedule_preemptive_priority", {}),
+    ("Non-Preemptive Priority", "schedule_non_preemptive_priority", {}),
+    ("CFS", "schedule_cfs", {}),
+    ("MLFQ", "schedule_mlfq", {"time_quantum": 2, "levels": 3, "boost_interval": 50})
+]
+
+# CFS ağırlıkları Linux'taki nice -5, 0 ve +5 değerlerine karşılık gelir
+NICE_0_WEIGHT = 1024
+CFS_WEIGHTS = {Priority.HIGH: 3121, Priority.NORMAL: 1024, Priority.LOW: 335}
+
+def advance_units(current_time, remaining_time, limit_time, time_unit=1):
+    # Süreci birim birim çalıştırır (her adımda min(time_unit, kalan)); en az bir adım atılır ve süreç
+    # bittiğinde ya da zaman limit_time'a ulaştığında durulur. Sonuç, adımları tek tek toplamakla bit
+    # düzeyinde aynıdır: ara toplamların hepsi tam temsil edildiğinde adımlar tek seferde atılır,
+    # edilmediğinde kayan noktanın üs aralığı sınırına kadar atlanır ve sınır tek adımla geçilir
+    while True:
+        if remaining_time <= time_unit:
+            return current_time + remaining_time, 0
+        units = math.ceil(remaining_time / time_unit) - 1
+        if limit_time - current_time < units * time_unit:
+            units = max(1, math.ceil((limit_time - current_time) / time_unit))
+            if units > 1 and current_time + (units - 1) * time_unit >= limit_time:
+                units -= 1
+        if units > 1 and isinstance(current_time, float):
+            ulp = math.ulp(current_time + units * time_unit)
+            if ulp > 1 or current_time % ulp:
+                boundary = 2.0 ** math.frexp(current_time)[1]
+                units = min(units, max(1, int((boundary - current_time) / time_unit) - 1))
+        current_time += units * time_unit
+        remaining_time -= units * time_unit
+        if current_time >= limit_time:
+            return current_time, remaining_time
 
 class SchedulingAlgorithm:
-    def __init__(self, context_switch_time=0.001):
+    def __init__(self, context_switch_time=0.001, time_unit: Optional[int] = None):
         self.context_switch_time = context_switch_time
+        # time_unit verildiğinde tüm zamanlar tam sayı tiktir ve bir zaman birimi time_unit tiktir;
+        # kesintili algoritmalar kararlarını birim sınırlarında verir
+        self.time_unit = time_unit
+    
+    def schedule_fcfs(self, processes: Union[List[Process], Workload],
+                      sink: Optional[SlotSink] = None,
+                      profiler: Optional[Profiler] = None) -> SchedulingResult:
+        if HAS_NUMPY and len(processes) >= VECTORIZE_THRESHOLD:
+            # Büyük iş yüklerinde tamamlanma zamanları kapalı formdan, aynı sonuçlarla hesaplanır
+            return VectorizedFCFS(self.context_switch_time).run(processes, sink, profiler)
+        dispatcher = NonPreemptiveDispatcher(
+            "FCFS",
+            key=lambda w, i: w.arrival_times[i],
+            context_switch_time=self.context_switch_time
+        )
+        return dispatcher.run(processes, sink, profiler)
+    
+    def schedule_preemptive_sjf(self, processes: Union[List[Process], Workload],
+                                sink: Optional[SlotSink] = None,
+                                profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return run_engine("Preemptive SJF", processes, self._preemptive_sjf, sink, profiler)
     
-    def schedule_fcfs(self, processes: List[Process]) -> SchedulingResult:
-        if not processes:
-            return SchedulingResult("FCFS", [], processes, 0, 0)
+    def _preemptive_sjf(self, workload: Workload, state: RunState, sink: SlotSink,
+                        profiler: Optional[Profiler] = None):
+        arrival_times = workload.arrival_times
+        remaining_times = state.remaining_times
+        start_times = state.start_times
+        completion_times = state.completion_times
+        arrival_order = workload.arrival_order()
+        process_count = len(workload)
         
-        time_slots = []
+        emit = sink.emit
         current_time = 0
         context_switches = 0
-        completed_processes = []
+        completed_count = 0
+        arrival_index = 0
+        ready_heap = []
+        current_index = None
+        queue_lengths = profiler.histogram("ready_queue") if profiler is not None else None
+        time_unit = self.time_unit or 1
         
-        ready_queue = []
-        process_index = 0
-        
-        while len(completed_processes) < len(processes):
-            arrived_processes = [p for p in processes[process_index:] 
-                               if p.arrival_time <= current_time]
-            ready_queue.extend(arrived_processes)
-            process_index += len(arrived_processes)
+        while completed_count < process_count:
+            while (arrival_index < process_count
+                   and arrival_times[arrival_order[arrival_index]] <= current_time):
+                index = arrival_order[arrival_index]
+                heapq.heappush(ready_heap, (remaining_times[index], index))
+                arrival_index += 1
             
-            if ready_queue:
-                current_process = ready_queue.pop(0)
-                
-                if current_process.start_time is None:
-                    current_process.start_time = current_time
+            if current_index is not None:
+                if ready_heap and ready_heap[0] < (remaining_times[current_index], current_index):
+                    heapq.heappush(ready_heap, (remaining_times[current_index], current_index))
+                    if queue_lengths is not None:
+                        queue_lengths[len(ready_heap)] += 1
+                    current_index = heapq.heappop(ready_heap)[1]
+                    context_switches += 1
+                    current_time += self.context_switch_time
+            elif ready_heap:
+                if queue_lengths is not None:
+                    queue_lengths[len(ready_heap)] += 1
+                current_index = heapq.heappop(ready_heap)[1]
+            else:
+                next_arrival = arrival_times[arrival_order[arrival_index]]
                 
+                emit("IDLE", current_time, next_arrival)
+                current_time = next_arrival
+                continue
+            
+            if math.isnan(start_times[current_index]):
+                start_times[current_index] = current_time
+            
+            process_id = workload.process_id(current_index)
+            next_arrival = (arrival_times[arrival_order[arrival_index]]
+                            if arrival_index < process_count else math.inf)
+            
+            # Bir sonraki varış görünür olana ya da süreç bitene kadar karar değişmez. Kararlar yalnızca
+            # varış ve tamamlanmalarda verilir, ancak zaman çizelgesi ilk sürümle aynı kalsın diye her birim
+            # ayrı bir dilimdir; bu yüzden süre ve dilim sayısı toplam patlama süresiyle orantılıdır
+            while True:
+                execution_time = min(time_unit, remaining_times[current_index])
                 start_time = current_time
-                end_time = current_time + current_process.cpu_burst_time
-                
-                time_slot = TimeSlot(
-                    process_id=current_process.process_id,
-                    start_time=start_time,
-                    end_time=end_time
-                )
-                time_slots.append(time_slot)
+                current_time += execution_time
+                remaining_times[current_index] -= execution_time
                 
-                current_time = end_time
-                current_process.completion_time = current_time
-                current_process.remaining_time = 0
-                completed_processes.append(current_process)
+                emit(process_id, start_time, current_time)
                 
-                if len(completed_processes) < len(processes):
-                    current_time += self.context_switch_time
-                    context_switches += 1
-            else:
-                next_process = next((p for p in processes[process_index:] 
-                                   if p.arrival_time > current_time), None)
+                if remaining_times[current_index] == 0:
+                    completion_times[current_index] = current_time
+                    completed_count += 1
+                    current_index = None
+                    break
                 
-                if next_process:
-                    idle_slot = TimeSlot(
-                        process_id="IDLE",
-                        start_time=current_time,
-                        end_time=next_process.arrival_time
-                    )
-                    time_slots.append(idle_slot)
-                    current_time = next_process.arrival_time
-                else:
+                if next_arrival <= current_time:
                     break
         
-        return SchedulingResult(
-            algorithm_name="FCFS",
-            time_slots=time_slots,
-            processes=processes,
-            context_switches=context_switches,
-            total_time=current_time
+        return context_switches, current_time
+    
+    def schedule_non_preemptive_sjf(self, processes: Union[List[Process], Workload],
+                                    sink: Optional[SlotSink] = None,
+                                    profiler: Optional[Profiler] = None) -> SchedulingResult:
+        dispatcher = NonPreemptiveDispatcher(
+            "Non-Preemptive SJF",
+            key=lambda w, i: (w.burst_times[i], w.arrival_times[i]),
+            context_switch_time=self.context_switch_time
         )
+        return dispatcher.run(processes, sink, profiler)
     
-    def schedule_preemptive_sjf(self, processes: List[Process]) -> SchedulingResult:
-        if not processes:
-            return SchedulingResult("Preemptive SJF", [], processes, 0, 0)
-        
-        for process in processes:
-            process.reset()
+    def schedule_round_robin(self, processes: Union[List[Process], Workload], time_quantum: int = 2,
+                             sink: Optional[SlotSink] = None,
+                             profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return run_engine("Round Robin", processes,
+                          lambda w, s, k, p: self._round_robin(w, s, k, time_quantum, p), sink, profiler)
+    
+    def _round_robin(self, workload: Workload, state: RunState, sink: SlotSink, time_quantum,
+                     profiler: Optional[Profiler] = None):
+        arrival_times = workload.arrival_times
+        remaining_times = state.remaining_times
+        start_times = state.start_times
+        completion_times = state.completion_times
+        arrival_order = workload.arrival_order()
+        process_count = len(workload)
         
-        time_slots = []
+        emit = sink.emit
         current_time = 0
         context_switches = 0
-        completed_processes = []
-        current_process = None
+        completed_count = 0
+        ready_queue = deque()
+        arrival_index = 0
+        queue_lengths = profiler.histogram("ready_queue") if profiler is not None else None
         
-        while len(completed_processes) < len(processes):
-            ready_processes = [p for p in processes 
-                             if p.arrival_time <= current_time and p not in completed_processes 
-                             and p.remaining_time > 0]
+        while completed_count < process_count:
+            while (arrival_index < process_count
+                   and arrival_times[arrival_order[arrival_index]] <= current_time):
+                ready_queue.append(arrival_order[arrival_index])
+                arrival_index += 1
             
-            if ready_processes:
-                ready_processes.sort(key=lambda p: p.remaining_time)
-                next_process = ready_processes[0]
+            if ready_queue:
+                if queue_lengths is not None:
+                    queue_lengths[len(ready_queue)] += 1
+                index = ready_queue.popleft()
                 
-                if current_process != next_process:
-                    if current_process is not None and current_process.remaining_time > 0:
-                        context_switches += 1
-                        current_time += self.context_switch_time
-                    
-                    if next_process.start_time is None:
-                        next_process.start_time = current_time
-                    
-                    current_process = next_process
+                if math.isnan(start_times[index]):
+                    start_times[index] = current_time
                 
-                execution_time = min(1, current_process.remaining_time)
+                execution_time = min(time_quantum, remaining_times[index])
                 start_time = current_time
                 current_time += execution_time
-                current_process.remaining_time -= execution_time
+                remaining_times[index] -= execution_time
                 
-                time_slot = TimeSlot(
-                    process_id=current_process.process_id,
-                    start_time=start_time,
-                    end_time=current_time
-                )
-                time_slots.append(time_slot)
+                emit(workload.process_id(index), start_time, current_time)
                 
-                if current_process.remaining_time == 0:
-                    current_process.completion_time = current_time
-                    completed_processes.append(current_process)
-                    current_process = None
-            else:
-                next_arrival = min([p.arrival_time for p in processes 
-                                  if p not in completed_processes])
+                if remaining_times[index] == 0:
+                    completion_times[index] = current_time
+                    completed_count += 1
+                else:
+                    while (arrival_index < process_count
+                           and arrival_times[arrival_order[arrival_index]] <= current_time):
+                        ready_queue.append(arrival_order[arrival_index])
+                        arrival_index += 1
+                    ready_queue.append(index)
                 
-                idle_slot = TimeSlot(
-                    process_id="IDLE",
-                    start_time=current_time,
-                    end_time=next_arrival
-                )
-                time_slots.append(idle_slot)
-                current_time = next_arrival
+                current_time += self.context_switch_time
+                context_switches += 1
+            else:
+                if arrival_index < process_count:
+                    next_arrival = arrival_times[arrival_order[arrival_index]]
+                    
+                    emit("IDLE", current_time, next_arrival)
+                    current_time = next_arrival
+                else:
+                    break
         
-        return SchedulingResult(
-            algorithm_name="Preemptive SJF",
-            time_slots=time_slots,
-            processes=processes,
-            context_switches=context_switches,
-            total_time=current_time
-        )
+        return context_switches, current_time
     
-    def schedule_non_preemptive_sjf(self, processes: List[Process]) -> SchedulingResult:
-        if not processes:
-            return SchedulingResult("Non-Preemptive SJF", [], processes, 0, 0)
-        
-        for process in processes:
-            process.reset()
+    def schedule_preemptive_priority(self, processes: Union[List[Process], Workload],
+                                     sink: Optional[SlotSink] = None,
+                                     profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return run_engine("Preemptive Priority", processes, self._preemptive_priority, sink, profiler)
+    
+    def _preemptive_priority(self, workload: Workload, state: RunState, sink: SlotSink,
+                             profiler: Optional[Profiler] = None):
+        arrival_times = workload.arrival_times
+        priorities = workload.priorities
+        remaining_times = state.remaining_times
+        start_times = state.start_times
+        completion_times = state.completion_times
+        arrival_order = workload.arrival_order()
+        process_count = len(workload)
         
-        time_slots = []
+        emit = sink.emit
         current_time = 0
         context_switches = 0
-        completed_processes = []
+        completed_count = 0
+        arrival_index = 0
+        ready_heap = []
+        current_key = None
+        queue_lengths = profiler.histogram("ready_queue") if profiler is not None else None
+        time_unit = self.time_unit or 1
         
-        while len(completed_processes) < len(processes):
-            ready_processes = [p for p in processes 
-                             if p.arrival_time <= current_time and p not in completed_processes 
-                             and p.remaining_time > 0]
+        while completed_count < process_count:
+            while (arrival_index < process_count
+                   and arrival_times[arrival_order[arrival_index]] <= current_time):
+                index = arrival_order[arrival_index]
+                heapq.heappush(ready_heap, (-priorities[index], arrival_times[index], index))
+                arrival_index += 1
             
-            if ready_processes:
-                ready_processes.sort(key=lambda p: (p.cpu_burst_time, p.arrival_time))
-                current_process = ready_processes[0]
-                
-                if current_process.start_time is None:
-                    current_process.start_time = current_time
-                
-                start_time = current_time
-                end_time = current_time + current_process.cpu_burst_time
-                
-                time_slot = TimeSlot(
-                    process_id=current_process.process_id,
-                    start_time=start_time,
-                    end_time=end_time
-                )
-                time_slots.append(time_slot)
-                
-                current_time = end_time
-                current_process.completion_time = current_time
-                current_process.remaining_time = 0
-                completed_processes.append(current_process)
-                
-                if len(completed_processes) < len(processes):
-                    current_time += self.context_switch_time
+            if current_key is not None:
+                if ready_heap and ready_heap[0] < current_key:
+                    heapq.heappush(ready_heap, current_key)
+                    if queue_lengths is not None:
+                        queue_lengths[len(ready_heap)] += 1
+                    current_key = heapq.heappop(ready_heap)
                     context_switches += 1
+                    current_time += self.context_switch_time
+            elif ready_heap:
+                if queue_lengths is not None:
+                    queue_lengths[len(ready_heap)] += 1
+                current_key = heapq.heappop(ready_heap)
             else:
-                next_arrival = min([p.arrival_time for p in processes 
-                                  if p not in completed_processes])
+                next_arrival = arrival_times[arrival_order[arrival_index]]
                 
-                idle_slot = TimeSlot(
-                    process_id="IDLE",
-                    start_time=current_time,
-                    end_time=next_arrival
-                )
-                time_slots.append(idle_slot)
+                emit("IDLE", current_time, next_arrival)
                 current_time = next_arrival
-        
-        return SchedulingResult(
-            algorithm_name="Non-Preemptive SJF",
-            time_slots=time_slots,
-            processes=processes,
-            context_switches=context_switches,
-            total_time=current_time
-        )
-    
-    def schedule_round_robin(self, processes: List[Process], time_quantum: int = 2) -> SchedulingResult:
-        if not processes:
-            return SchedulingResult("Round Robin", [], processes, 0, 0)
-        
-        for process in processes:
-            process.reset()
-        
-        time_slots = []
-        current_time = 0
-        context_switches = 0
-        completed_processes = []
-        ready_queue = []
-        process_index = 0
-        
-        while len(completed_processes) < len(processes):
-            arrived_processes = [p for p in processes[process_index:] 
-                               if p.arrival_time <= current_time and p not in ready_queue 
-                               and p not in completed_processes]
-            ready_queue.extend(arrived_processes)
-            process_index += len(arrived_processes)
+                continue
             
-            if ready_queue:
-                current_process = ready_queue.pop(0)
-                
-                if current_process.start_time is None:
-                    current_process.start_time = current_time
-                
-                execution_time = min(time_quantum, current_process.remaining_time)
-                start_time = current_time
-                current_time += execution_time
-                current_process.remaining_time -= execution_time
-                
-                time_slot = TimeSlot(
-                    process_id=current_process.process_id,
-                    start_time=start_time,
-                    end_time=current_time
-                )
-                time_slots.append(time_slot)
-                
-                if current_process.remaining_time == 0:
-                    current_process.completion_time = current_time
-                    completed_processes.append(current_process)
-                else:
-                    newly_arrived = [p for p in processes[process_index:] 
-                                   if p.arrival_time <= current_time and p not in ready_queue 
-                                   and p not in completed_processes]
-                    ready_queue.extend(newly_arrived)
-                    process_index += len(newly_arrived)
-                    ready_queue.append(current_process)
+            current_index = current_key[2]
+            if math.isnan(start_times[current_index]):
+                start_times[current_index] = current_time
+            
+            start_time = current_time
+            
+            # Kesintisiz çalışma tek bir dilim olur; kararlar yalnızca birim sınırlarında,
+            # daha yüksek öncelikli bir süreç görünür olduğunda yeniden verilir
+            while True:
+                next_arrival = (arrival_times[arrival_order[arrival_index]]
+                                if arrival_index < process_count else math.inf)
+                current_time, remaining_times[current_index] = advance_units(
+                    current_time, remaining_times[current_index], next_arrival, time_unit)
+                
+                if remaining_times[current_index] == 0:
+                    completion_times[current_index] = current_time
+                    completed_count += 1
+                    preempted = False
+                    break
                 
-                current_time += self.context_switch_time
-                context_switches += 1
-            else:
-                next_process = next((p for p in processes[process_index:] 
-                                   if p.arrival_time > current_time), None)
+                while (arrival_index < process_count
+                       and arrival_times[arrival_order[arrival_index]] <= current_time):
+                    index = arrival_order[arrival_index]
+                    heapq.heappush(ready_heap, (-priorities[index], arrival_times[index], index))
+                    arrival_index += 1
                 
-                if next_process:
-                    idle_slot = TimeSlot(
-                        process_id="IDLE",
-                        start_time=current_time,
-                        end_time=next_process.arrival_time
-                    )
-                    time_slots.append(idle_slot)
-                    current_time = next_process.arrival_time
-                else:
+                if ready_heap[0] < current_key:
+                    preempted = True
                     break
+            
+            emit(workload.process_id(current_index), start_time, current_time)
+            
+            if not preempted:
+                current_key = None
         
-        return SchedulingResult(
-            algorithm_name="Round Robin",
-            time_slots=time_slots,
-            processes=processes,
-            context_switches=context_switches,
-            total_time=current_time
+        return context_switches, current_time
+    
+    def schedule_non_preemptive_priority(self, processes: Union[List[Process], Workload],
+                                         sink: Optional[SlotSink] = None,
+                                         profiler: Optional[Profiler] = None) -> SchedulingResult:
+        dispatcher = NonPreemptiveDispatcher(
+            "Non-Preemptive Priority",
+            key=lambda w, i: (-w.priorities[i], w.arrival_times[i]),
+            context_switch_time=self.context_switch_time
         )
+        return dispatcher.run(processes, sink, profiler)
     
-    def schedule_preemptive_priority(self, processes: List[Process]) -> SchedulingResult:
-        if not processes:
-            return SchedulingResult("Preemptive Priority", [], processes, 0, 0)
-        
-        for process in processes:
-            process.reset()
+    def schedule_cfs(self, processes: Union[List[Process], Workload], target_latency: float = 6,
+                     min_granularity: float = 1, wakeup_granularity: float = 1,
+                     sink: Optional[SlotSink] = None,
+                     profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return run_engine("CFS", processes,
+                          lambda w, s, k, p: self._cfs(w, s, k, p, target_latency, min_granularity,
+                                                       wakeup_granularity), sink, profiler)
+    
+    def _cfs(self, workload: Workload, state: RunState, sink: SlotSink, profiler: Optional[Profiler],
+             target_latency: float, min_granularity: float, wakeup_granularity: float):
+        arrival_times = workload.arrival_times
+        priorities = workload.priorities
+        remaining_times = state.remaining_times
+        start_times = state.start_times
+        completion_times = state.completion_times
+        arrival_order = workload.arrival_order()
+        process_count = len(workload)
+        weight_table = {priority.value: weight for priority, weight in CFS_WEIGHTS.items()}
+        vruntimes = array('d', bytes(8 * process_count))
+        # Tik modunda dilim uzunlukları da tam tik sayısına yuvarlanır
+        divide = operator.floordiv if self.time_unit is not None else operator.truediv
         
-        time_slots = []
+        emit = sink.emit
+        queue_lengths = profiler.histogram("ready_queue") if profiler is not None else None
         current_time = 0
         context_switches = 0
-        completed_processes = []
-        current_process = None
+        completed_count = 0
+        arrival_index = 0
+        # Sanal çalışma süresine göre sıralı hazır kümesi; en soldaki O(log n) ile seçilir
+        ready_heap = []
+        total_weight = 0
+        min_vruntime = 0.0
+        current_index = None
+        last_index = None
         
-        while len(completed_processes) < len(processes):
-            ready_processes = [p for p in processes 
-                             if p.arrival_time <= current_time and p not in completed_processes 
-                             and p.remaining_time > 0]
+        while completed_count < process_count:
+            admitted = False
+            while (arrival_index < process_count
+                   and arrival_times[arrival_order[arrival_index]] <= current_time):
+                index = arrival_order[arrival_index]
+                vruntimes[index] = min_vruntime
+                heapq.heappush(ready_heap, (min_vruntime, index))
+                total_weight += weight_table[priorities[index]]
+                arrival_index += 1
+                admitted = True
             
-            if ready_processes:
-                ready_processes.sort(key=lambda p: (-p.priority.value, p.arrival_time))
-                next_process = ready_processes[0]
-                
-                if current_process != next_process:
-                    if current_process is not None and current_process.remaining_time > 0:
-                        context_switches += 1
-                        current_time += self.context_switch_time
-                    
-                    if next_process.start_time is None:
-                        next_process.start_time = current_time
+            if current_index is not None:
+                vruntime = vruntimes[current_index]
+                if current_time >= slice_end:
+                    preempt = bool(ready_heap) and ready_heap[0] < (vruntime, current_index)
+                else:
+                    # Uyanan süreç, çalışanın sanal süresi yeterince gerideyse onu hemen keser
+                    preempt = admitted and vruntime - ready_heap[0][0] > wakeup_granularity
+                if preempt:
+                    emit(workload.process_id(current_index), slot_start, current_time)
+                    heapq.heappush(ready_heap, (vruntime, current_index))
+                    last_index = current_index
+                    current_index = None
+                elif current_time >= slice_end:
+                    slice_end = current_time + max(min_granularity, divide(target_latency * weight, total_weight))
+            
+            if current_index is None:
+                if not ready_heap:
+                    next_arrival = arrival_times[arrival_order[arrival_index]]
                     
-                    current_process = next_process
-                
-                execution_time = min(1, current_process.remaining_time)
-                start_time = current_time
-                current_time += execution_time
-                current_process.remaining_time -= execution_time
-                
-                time_slot = TimeSlot(
-                    process_id=current_process.process_id,
-                    start_time=start_time,
-                    end_time=current_time
-                )
-                time_slots.append(time_slot)
-                
-                if current_process.remaining_time == 0:
-                    current_process.completion_time = current_time
-                    completed_processes.append(current_process)
-                    current_process = None
+                    emit("IDLE", current_time, next_arrival)
+                    current_time = next_arrival
+                    last_index = None
+                    continue
+                
+                if queue_lengths is not None:
+                    queue_lengths[len(ready_heap)] += 1
+                current_index = heapq.heappop(ready_heap)[1]
+                if last_index is not None and last_index != current_index:
+                    context_switches += 1
+                    current_time += self.context_switch_time
+                if math.isnan(start_times[current_index]):
+                    start_times[current_index] = current_time
+                weight = weight_table[priorities[current_index]]
+                slot_start = current_time
+                slice_end = current_time + max(min_granularity, divide(target_latency * weight, total_weight))
+            
+            # Bir sonraki karar noktası: tamamlanma, dilim sonu ya da yeni varış
+            run_time = remaining_times[current_index]
+            stop_time = None
+            if ready_heap and slice_end - current_time < run_time:
+                run_time = slice_end - current_time
+                stop_time = slice_end
+            if arrival_index < process_count:
+                next_arrival = arrival_times[arrival_order[arrival_index]]
+                if next_arrival - current_time < run_time:
+                    run_time = next_arrival - current_time
+                    stop_time = next_arrival
+            
+            vruntimes[current_index] += run_time * NICE_0_WEIGHT / weight
+            if stop_time is None:
+                current_time += run_time
+                remaining_times[current_index] = 0
+                completion_times[current_index] = current_time
+                completed_count += 1
+                total_weight -= weight
+                emit(workload.process_id(current_index), slot_start, current_time)
+                last_index = current_index
+                current_index = None
             else:
-                next_arrival = min([p.arrival_time for p in processes 
-                                  if p not in completed_processes])
-                
-                idle_slot = TimeSlot(
-                    process_id="IDLE",
-                    start_time=current_time,
-                    end_time=next_arrival
-                )
-                time_slots.append(idle_slot)
-                current_time = next_arrival
+                current_time = stop_time
+                remaining_times[current_index] -= run_time
+            
+            leftmost = ready_heap[0][0] if ready_heap else math.inf
+            if current_index is not None:
+                leftmost = min(leftmost, vruntimes[current_index])
+            if leftmost != math.inf and leftmost > min_vruntime:
+                min_vruntime = leftmost
         
-        return SchedulingResult(
-            algorithm_name="Preemptive Priority",
-            time_slots=time_slots,
-            processes=processes,
-            context_switches=context_switches,
-            total_time=current_time
-        )
+        return context_switches, current_time
+    
+    def schedule_mlfq(self, processes: Union[List[Process], Workload], time_quantum: float = 2, levels: int = 3,
+                      boost_interval: float = 50, sink: Optional[SlotSink] = None,
+                      profiler: Optional[Profiler] = None) -> SchedulingResult:
+        if levels < 1:
+            raise ValueError("MLFQ için en az bir seviye gereklidir")
+        return run_engine("MLFQ", processes,
+                          lambda w, s, k, p: self._mlfq(w, s, k, p, time_quantum, levels, boost_interval),
+                          sink, profiler)
     
-    def schedule_non_preemptive_priority(self, processes: List[Process]) -> SchedulingResult:
-        if not processes:
-            return SchedulingResult("Non-Preemptive Priority", [], processes, 0, 0)
+    def _mlfq(self, workload: Workload, state: RunState, sink: SlotSink, profiler: Optional[Profiler],
+              time_quantum: float, levels: int, boost_interval: float):
+        arrival_times = workload.arrival_times
+        remaining_times = state.remaining_times
+        start_times = state.start_times
+        completion_times = state.completion_times
+        arrival_order = workload.arrival_order()
+        process_count = len(workload)
+        # Her alt seviyenin kuantumu bir üsttekinin iki katıdır
+        quanta = [time_quantum * 2 ** level for level in range(levels)]
+        
+        # Her seviye kuyruk parçalarından oluşan bir zincirdir; yükseltme parçaları
+        # kopyalamadan üst seviyeye ekler. Süreçlerin kullandığı kuantum, son
+        # yükseltmeden eskiyse seçildiklerinde sıfırlanır
+        chains = [deque([deque()]) for _ in range(levels)]
+        queued = [0] * levels
+        used_times = array(remaining_times.typecode, bytes(8 * process_count))
+        epochs = array('q', bytes(8 * process_count))
+        epoch = 0
+        next_boost = boost_interval
+        
+        def push(level, index):
+            chains[level][-1].append(index)
+            queued[level] += 1
         
-        for process in processes:
-            process.reset()
+        def pop(level):
+            chain = chains[level]
+            while not chain[0]:
+                chain.popleft()
+            queued[level] -= 1
+            return chain[0].popleft()
         
-        time_slots = []
+        emit = sink.emit
+        queue_lengths = profiler.histogram("ready_queue") if profiler is not None else None
         current_time = 0
         context_switches = 0
-        completed_processes = []
+        completed_count = 0
+        arrival_index = 0
+        current_index = None
+        current_level = 0
+        last_index = None
+        pending_slot = None
         
-        while len(completed_processes) < len(processes):
-            ready_processes = [p for p in processes 
-                             if p.arrival_time <= current_time and p not in completed_processes 
-                             and p.remaining_time > 0]
+        while completed_count < process_count:
+            admitted = False
+            while (arrival_index < process_count
+                   and arrival_times[arrival_order[arrival_index]] <= current_time):
+                index = arrival_order[arrival_index]
+                epochs[index] = epoch
+                push(0, index)
+                arrival_index += 1
+                admitted = True
             
-            if ready_processes:
-                ready_processes.sort(key=lambda p: (-p.priority.value, p.arrival_time))
-                current_process = ready_processes[0]
-                
-                if current_process.start_time is None:
-                    current_process.start_time = current_time
-                
-                start_time = current_time
-                end_time = current_time + current_process.cpu_burst_time
-                
-                time_slot = TimeSlot(
-                    process_id=current_process.process_id,
-                    start_time=start_time,
-                    end_time=end_time
-                )
-                time_slots.append(time_slot)
-                
-                current_time = end_time
-                current_process.completion_time = current_time
-                current_process.remaining_time = 0
-                completed_processes.append(current_process)
-                
-                if len(completed_processes) < len(processes):
-                    current_time += self.context_switch_time
+            if current_time >= next_boost:
+                epoch += 1
+                for level in range(1, levels):
+                    chains[0].extend(chains[level])
+                    chains[level] = deque([deque()])
+                    queued[0] += queued[level]
+                    queued[level] = 0
+                if current_index is not None:
+                    current_level = 0
+                    used_times[current_index] = 0
+                    epochs[current_index] = epoch
+                next_boost = (math.floor(current_time / boost_interval) + 1) * boost_interval
+            
+            if current_index is not None and admitted and current_level > 0:
+                # Üst seviyeye gelen süreç alt seviyede çalışanı keser
+                push(current_level, current_index)
+                last_index = current_index
+                current_index = None
+            
+            if current_index is None:
+                level = next((level for level in range(levels) if queued[level]), None)
+                if level is None:
+                    if pending_slot is not None:
+                        emit(*pending_slot)
+                        pending_slot = None
+                    next_arrival = arrival_times[arrival_order[arrival_index]]
+                    
+                    emit("IDLE", current_time, next_arrival)
+                    current_time = next_arrival
+                    last_index = None
+                    continue
+                
+                if queue_lengths is not None:
+                    queue_lengths[sum(queued)] += 1
+                current_index = pop(level)
+                current_level = level
+                if epochs[current_index] != epoch:
+                    used_times[current_index] = 0
+                    epochs[current_index] = epoch
+                if last_index is not None and last_index != current_index:
                     context_switches += 1
-            else:
-                next_arrival = min([p.arrival_time for p in processes 
-                                  if p not in completed_processes])
-                
-                idle_slot = TimeSlot(
-                    process_id="IDLE",
-                    start_time=current_time,
-                    end_time=next_arrival
-                )
-                time_slots.append(idle_slot)
-                current_time = next_arrival
+                    current_time += self.context_switch_time
+                if math.isnan(start_times[current_index]):
+                    start_times[current_index] = current_time
+                process_id = workload.process_id(current_index)
+                if pending_slot is not None and (pending_slot[0] != process_id or pending_slot[2] != current_time):
+                    emit(*pending_slot)
+                    pending_slot = None
+                if pending_slot is None:
+                    pending_slot = [process_id, current_time, current_time]
+            
+            # Bir sonraki karar noktası: tamamlanma, kuantum sonu, yeni varış ya da yükseltme
+            run_time = remaining_times[current_index]
+            stop_time = None
+            quantum_left = quanta[current_level] - used_times[current_index]
+            if quantum_left < run_time:
+                run_time = quantum_left
+                stop_time = current_time + quantum_left
+            if arrival_index < process_count:
+                next_arrival = arrival_times[arrival_order[arrival_index]]
+                if next_arrival - current_time < run_time:
+                    run_time = next_arrival - current_time
+                    stop_time = next_arrival
+            if next_boost - current_time < run_time:
+                run_time = next_boost - current_time
+                stop_time = next_boost
+            
+            if stop_time is None:
+                current_time += run_time
+                remaining_times[current_index] = 0
+                completion_times[current_index] = current_time
+                completed_count += 1
+                pending_slot[2] = current_time
+                emit(*pending_slot)
+                pending_slot = None
+                last_index = current_index
+                current_index = None
+                continue
+            
+            current_time = stop_time
+            remaining_times[current_index] -= run_time
+            used_times[current_index] += run_time
+            pending_slot[2] = current_time
+            if used_times[current_index] >= quanta[current_level]:
+                # Kuantumunu dolduran süreç bir alt seviyeye iner
+                used_times[current_index] = 0
+                push(min(current_level + 1, levels - 1), current_index)
+                last_index = current_index
+                current_index = None
         
-        return SchedulingResult(
-            algorithm_name="Non-Preemptive Priority",
-            time_slots=time_slots,
-            processes=processes,
-            context_switches=context_switches,
-            total_time=current_time
-        )
\ No newline at end of file
+        if pending_slot is not None:
+            emit(*pending_slot)
+        return context_switches, current_time
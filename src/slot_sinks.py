@@ -0,0 +1,124 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from .process import TimeSlot
+
+def format_time_slot_line(process_id: str, start_time: float, end_time: float, decimals: int = 0) -> str:
+    if decimals:
+        width = decimals + 5
+        label = "BOŞTA" if process_id == "IDLE" else process_id
+        return f"[ {start_time:{width}.{decimals}f} ] - - {label} - - [ {end_time:{width}.{decimals}f} ]\n"
+    if process_id == "IDLE":
+        return f"[ {int(start_time):4d} ] - - BOŞTA - - [ {int(end_time):4d} ]\n"
+    return f"[ {int(start_time):4d} ] - - {process_id} - - [ {int(end_time):4d} ]\n"
+
+class SlotSink(ABC):
+    downstream: Optional['SlotSink'] = None
+    
+    @abstractmethod
+    def emit(self, process_id: str, start_time: float, end_time: float):
+        pass
+    
+    def close(self):
+        if self.downstream is not None:
+            self.downstream.close()
+    
+    def result(self):
+        if self.downstream is not None:
+            return self.downstream.result()
+        return []
+    
+    @property
+    def timeline_file(self) -> Optional[str]:
+        if self.downstream is not None:
+            return self.downstream.timeline_file
+        return None
+
+class ListSlotSink(SlotSink):
+    def __init__(self):
+        self.time_slots = []
+    
+    def emit(self, process_id: str, start_time: float, end_time: float):
+        self.time_slots.append(TimeSlot(process_id, start_time, end_time))
+    
+    def result(self):
+        return self.time_slots
+
+class NullSlotSink(SlotSink):
+    def emit(self, process_id: str, start_time: float, end_time: float):
+        pass
+
+class CoalescingSlotSink(SlotSink):
+    def __init__(self, downstream: SlotSink):
+        self.downstream = downstream
+        self._pending = None
+    
+    def emit(self, process_id: str, start_time: float, end_time: float):
+        pending = self._pending
+        if pending is not None:
+            if pending[0] == process_id and pending[2] == start_time:
+                pending[2] = end_time
+                return
+            self.downstream.emit(*pending)
+        self._pending = [process_id, start_time, end_time]
+    
+    def close(self):
+        if self._pending is not None:
+            self.downstream.emit(*self._pending)
+            self._pending = None
+        self.downstream.close()
+
+class TeeSlotSink(SlotSink):
+    def __init__(self, *sinks: SlotSink):
+        self.sinks = sinks
+        self.downstream = sinks[0]
+    
+    def emit(self, process_id: str, start_time: float, end_time: float):
+        for sink in self.sinks:
+            sink.emit(process_id, start_time, end_time)
+    
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+class MetricsSlotSink(SlotSink):
+    def __init__(self, downstream: Optional[SlotSink] = None):
+        self.downstream = downstream
+        self.busy_time = 0
+        self.idle_time = 0
+        self.slot_count = 0
+        self.end_time = 0
+    
+    def emit(self, process_id: str, start_time: float, end_time: float):
+        if process_id == "IDLE":
+            self.idle_time += end_time - start_time
+        else:
+            self.busy_time += end_time - start_time
+        self.slot_count += 1
+        self.end_time = end_time
+        if self.downstream is not None:
+            self.downstream.emit(process_id, start_time, end_time)
+
+class FileSlotSink(SlotSink):
+    def __init__(self, path: str, buffer_lines: int = 8192, decimals: int = 0):
+        self.path = path
+        self.buffer_lines = buffer_lines
+        self.decimals = decimals
+        self._buffer = []
+        self._file = open(path, 'w', encoding='utf-8')
+    
+    def emit(self, process_id: str, start_time: float, end_time: float):
+        self._buffer.append(format_time_slot_line(process_id, start_time, end_time, self.decimals))
+        if len(self._buffer) >= self.buffer_lines:
+            self._file.writelines(self._buffer)
+            self._buffer.clear()
+    
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.writelines(self._buffer)
+        self._buffer.clear()
+        self._file.close()
+    
+    @property
+    def timeline_file(self) -> Optional[str]:
+        return self.path
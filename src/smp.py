@@ -0,0 +1,385 @@
+import heapq
+import math
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Optional, Union
+from .process import Process, SchedulingResult
+from .profiling import Profiler
+from .scheduling_algorithms import advance_units
+from .slot_sinks import SlotSink
+from .timeline import Timeline
+from .workload import Workload, RunState, run_engine
+
+PLACEMENTS = ("global", "per_cpu", "work_stealing")
+
+_FCFS, _SJF, _PRIORITY, _SRTF, _PREEMPTIVE_PRIORITY, _ROUND_ROBIN = range(6)
+
+# Aynı anda gerçekleşen olaylar bu sırayla işlenir
+_COMPLETE, _SLICE, _CHECK, _BALANCE, _DISPATCH = range(5)
+
+@dataclass
+class MulticoreStats:
+    cpu_count: int
+    placement: str
+    busy_times: List[float]
+    dispatches: List[int]
+    context_switches: List[int]
+    migrations: int = 0
+    slot_cpus: object = field(default=None, repr=False)
+    
+    def utilization(self, total_time: float) -> List[float]:
+        return [busy / total_time * 100 if total_time > 0 else 0 for busy in self.busy_times]
+
+class MulticoreScheduler:
+    def __init__(self, cpu_count: int = 4, placement: str = "global", context_switch_time=0.001,
+                 balance_interval: float = 4):
+        if cpu_count < 1:
+            raise ValueError("CPU sayısı en az 1 olmalıdır")
+        if placement not in PLACEMENTS:
+            raise ValueError(f"Geçersiz yerleştirme: {placement}")
+        if balance_interval <= 0:
+            raise ValueError("Dengeleme aralığı pozitif olmalıdır")
+        self.cpu_count = cpu_count
+        self.placement = placement
+        self.context_switch_time = context_switch_time
+        self.balance_interval = balance_interval
+    
+    def schedule_fcfs(self, processes: Union[List[Process], Workload],
+                      sink: Optional[SlotSink] = None,
+                      profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return self._run("FCFS", processes, _FCFS, None, sink, profiler)
+    
+    def schedule_preemptive_sjf(self, processes: Union[List[Process], Workload],
+                                sink: Optional[SlotSink] = None,
+                                profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return self._run("Preemptive SJF", processes, _SRTF, None, sink, profiler)
+    
+    def schedule_non_preemptive_sjf(self, processes: Union[List[Process], Workload],
+                                    sink: Optional[SlotSink] = None,
+                                    profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return self._run("Non-Preemptive SJF", processes, _SJF, None, sink, profiler)
+    
+    def schedule_round_robin(self, processes: Union[List[Process], Workload], time_quantum: int = 2,
+                             sink: Optional[SlotSink] = None,
+                             profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return self._run("Round Robin", processes, _ROUND_ROBIN, time_quantum, sink, profiler)
+    
+    def schedule_preemptive_priority(self, processes: Union[List[Process], Workload],
+                                     sink: Optional[SlotSink] = None,
+                                     profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return self._run("Preemptive Priority", processes, _PREEMPTIVE_PRIORITY, None, sink, profiler)
+    
+    def schedule_non_preemptive_priority(self, processes: Union[List[Process], Workload],
+                                         sink: Optional[SlotSink] = None,
+                                         profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return self._run("Non-Preemptive Priority", processes, _PRIORITY, None, sink, profiler)
+    
+    def _run(self, algorithm_name: str, processes, policy: int, time_quantum, sink: Optional[SlotSink],
+             profiler: Optional[Profiler]) -> SchedulingResult:
+        stats = MulticoreStats(self.cpu_count, self.placement, [0.0] * self.cpu_count,
+                               [0] * self.cpu_count, [0] * self.cpu_count)
+        
+        def engine(workload: Workload, state: RunState, engine_sink: SlotSink, engine_profiler):
+            return self._simulate(workload, state, engine_sink, engine_profiler, policy, time_quantum, stats)
+        
+        result = run_engine(algorithm_name, processes, engine, sink, profiler)
+        result.multicore = stats
+        return result
+    
+    def _simulate(self, workload: Workload, state: RunState, sink: SlotSink, profiler: Optional[Profiler],
+                  policy: int, time_quantum, stats: MulticoreStats):
+        arrival_times = workload.arrival_times
+        burst_times = workload.burst_times
+        priorities = workload.priorities
+        remaining_times = state.remaining_times
+        start_times = state.start_times
+        completion_times = state.completion_times
+        arrival_order = workload.arrival_order()
+        process_count = len(workload)
+        
+        cpu_count = self.cpu_count
+        context_switch_time = self.context_switch_time
+        balance_interval = self.balance_interval
+        shared = self.placement == "global"
+        balancing = self.placement == "per_cpu"
+        stealing = self.placement == "work_stealing"
+        round_robin = policy == _ROUND_ROBIN
+        preemptive = policy in (_SRTF, _PREEMPTIVE_PRIORITY)
+        
+        if policy == _FCFS:
+            key = lambda i: (arrival_times[i], i)
+        elif policy == _SJF:
+            key = lambda i: (burst_times[i], arrival_times[i], i)
+        elif policy == _SRTF:
+            key = lambda i: (remaining_times[i], i)
+        else:
+            key = lambda i: (-priorities[i], arrival_times[i], i)
+        
+        queues = [deque() if round_robin else [] for _ in range(1 if shared else cpu_count)]
+        
+        def push(queue, index):
+            if round_robin:
+                queue.append(index)
+            else:
+                heapq.heappush(queue, key(index))
+        
+        def pop(queue):
+            if round_robin:
+                return queue.popleft()
+            return heapq.heappop(queue)[-1]
+        
+        emit = sink.emit
+        slot_cpus = array('H') if isinstance(sink, Timeline) else None
+        queue_lengths = profiler.histogram("ready_queue") if profiler is not None else None
+        busy_times = stats.busy_times
+        dispatches = stats.dispatches
+        cpu_switches = stats.context_switches
+        
+        running = [-1] * cpu_count
+        run_start = [0.0] * cpu_count
+        run_remaining = [0.0] * cpu_count
+        # Kesintili algoritmalarda çalışan sürecin zamandan bağımsız sıralama anahtarı
+        running_keys = [None] * cpu_count
+        # Bekleyen kesme denetiminin birim sınırı ve o sınırda kalan süre
+        check_times = [None] * cpu_count
+        check_remaining = [0] * cpu_count
+        generation = [0] * cpu_count
+        idle = [True] * cpu_count
+        # Boştaki CPU'nun boşta kalmaya başladığı an; CPU yeniden çalıştığında BOŞTA dilimi üretilir
+        idle_since = [0] * cpu_count
+        idle_heap = list(range(cpu_count))
+        last_cpu = array('h', [-1]) * process_count if shared else None
+        
+        events = []
+        end_time = 0
+        migrations = 0
+        completed_count = 0
+        arrival_index = 0
+        balance_pending = False
+        
+        def schedule_dispatch(cpu, time):
+            idle[cpu] = False
+            generation[cpu] += 1
+            heapq.heappush(events, (time, _DISPATCH, cpu, generation[cpu]))
+        
+        def wake_idle(time) -> bool:
+            while idle_heap:
+                cpu = heapq.heappop(idle_heap)
+                if idle[cpu]:
+                    schedule_dispatch(cpu, time)
+                    return True
+            return False
+        
+        def start(cpu, index, time):
+            nonlocal migrations
+            if idle_since[cpu] is not None:
+                if time > idle_since[cpu]:
+                    emit("IDLE", idle_since[cpu], time)
+                    if slot_cpus is not None:
+                        slot_cpus.append(cpu)
+                idle_since[cpu] = None
+            if math.isnan(start_times[index]):
+                start_times[index] = time
+            if last_cpu is not None:
+                if last_cpu[index] >= 0 and last_cpu[index] != cpu:
+                    migrations += 1
+                last_cpu[index] = cpu
+            
+            generation[cpu] += 1
+            running[cpu] = index
+            run_start[cpu] = time
+            run_remaining[cpu] = remaining = remaining_times[index]
+            dispatches[cpu] += 1
+            if round_robin:
+                heapq.heappush(events, (time + min(time_quantum, remaining), _SLICE, cpu, generation[cpu]))
+            elif not preemptive:
+                heapq.heappush(events, (time + remaining, _COMPLETE, cpu, generation[cpu]))
+            else:
+                # Kesintili algoritmalarda zaman tek çekirdekli motordaki gibi birim birim toplanır
+                heapq.heappush(events, (advance_units(time, remaining, math.inf)[0], _COMPLETE, cpu, generation[cpu]))
+                check_times[cpu] = None
+                running_keys[cpu] = ((remaining + time, index) if policy == _SRTF else key(index))
+        
+        def dispatch(cpu, time):
+            nonlocal migrations
+            queue = queues[0] if shared else queues[cpu]
+            if not queue and stealing:
+                # Boştaki CPU en uzun kuyruktan bir süreç çalar
+                victim = max(range(cpu_count), key=lambda c: len(queues[c]))
+                if queues[victim]:
+                    queue = queues[victim]
+                    migrations += 1
+            if not queue:
+                running[cpu] = -1
+                running_keys[cpu] = None
+                idle[cpu] = True
+                if idle_since[cpu] is None:
+                    idle_since[cpu] = time
+                heapq.heappush(idle_heap, cpu)
+                return
+            if queue_lengths is not None:
+                queue_lengths[len(queue)] += 1
+            start(cpu, pop(queue), time)
+        
+        def request_check(cpu, entry, time):
+            # Yeni süreç, çalışanı yalnızca varışından sonraki ilk birim sınırında kesebilir
+            index = running[cpu]
+            if index < 0:
+                return
+            # Kalan süre yalnızca azalabilir; sınırı hesaplamadan elenebilecek istekler önce elenir
+            if entry[0] > run_remaining[cpu] if policy == _SRTF else entry >= running_keys[cpu]:
+                return
+            boundary, remaining = advance_units(run_start[cpu], run_remaining[cpu], time)
+            if remaining == 0 or (policy == _SRTF and entry >= (remaining, index)):
+                return
+            if check_times[cpu] is not None and check_times[cpu] <= boundary:
+                return
+            check_times[cpu] = boundary
+            check_remaining[cpu] = remaining
+            heapq.heappush(events, (boundary, _CHECK, cpu, generation[cpu]))
+        
+        def notify(queue_index, entry, time):
+            nonlocal balance_pending
+            if shared:
+                if wake_idle(time):
+                    return
+                if entry is not None:
+                    candidates = [(running_keys[cpu], cpu) for cpu in range(cpu_count)
+                                  if running_keys[cpu] is not None and check_times[cpu] is None]
+                    if candidates:
+                        request_check(max(candidates)[1], entry, time)
+                return
+            if idle[queue_index]:
+                schedule_dispatch(queue_index, time)
+                return
+            if stealing and wake_idle(time):
+                return
+            if entry is not None:
+                request_check(queue_index, entry, time)
+            if balancing and not balance_pending:
+                balance_pending = True
+                heapq.heappush(events, ((math.floor(time / balance_interval) + 1) * balance_interval,
+                                        _BALANCE, -1, 0))
+        
+        def balance(time):
+            nonlocal migrations, balance_pending
+            loads = [len(queues[cpu]) + (running[cpu] >= 0 or not idle[cpu]) for cpu in range(cpu_count)]
+            total_load = sum(loads)
+            # Yük ortalamanın üstündeki kuyruklardan altındakilere taşınır
+            high = -(-total_load // cpu_count)
+            targets = iter([cpu for cpu in range(cpu_count) if loads[cpu] < high])
+            target = next(targets, None)
+            for source in range(cpu_count):
+                while target is not None and loads[source] > high and queues[source]:
+                    index = pop(queues[source])
+                    push(queues[target], index)
+                    loads[source] -= 1
+                    loads[target] += 1
+                    migrations += 1
+                    if idle[target]:
+                        schedule_dispatch(target, time)
+                    elif preemptive:
+                        request_check(target, key(index), time)
+                    if loads[target] >= high:
+                        target = next(targets, None)
+            
+            balance_pending = any(queues)
+            if balance_pending:
+                heapq.heappush(events, (time + balance_interval, _BALANCE, -1, 0))
+        
+        while completed_count < process_count:
+            event_time = events[0][0] if events else math.inf
+            # Olayla aynı anda ya da daha önce varan süreçler önce kuyruğa girer
+            if arrival_index < process_count and arrival_times[arrival_order[arrival_index]] <= event_time:
+                index = arrival_order[arrival_index]
+                queue_index = 0 if shared else arrival_index % cpu_count
+                arrival_index += 1
+                push(queues[queue_index], index)
+                notify(queue_index, key(index) if preemptive else None, arrival_times[index])
+                continue
+            if not events:
+                raise RuntimeError("Çok çekirdekli benzetim ilerleyemiyor")
+            
+            time, kind, cpu, event_generation = heapq.heappop(events)
+            if kind == _BALANCE:
+                balance(time)
+                continue
+            if event_generation != generation[cpu]:
+                continue
+            
+            if kind == _DISPATCH:
+                dispatch(cpu, time)
+                continue
+            
+            index = running[cpu]
+            if kind == _CHECK:
+                if check_times[cpu] != time:
+                    continue
+                check_times[cpu] = None
+                queue = queues[0] if shared else queues[cpu]
+                remaining = check_remaining[cpu]
+                current_key = (remaining, index) if policy == _SRTF else running_keys[cpu]
+                if not queue or queue[0] >= current_key:
+                    continue
+                
+                emit(workload.process_id(index), run_start[cpu], time)
+                if slot_cpus is not None:
+                    slot_cpus.append(cpu)
+                busy_times[cpu] += time - run_start[cpu]
+                remaining_times[index] = remaining
+                heapq.heappush(queue, key(index))
+                if queue_lengths is not None:
+                    queue_lengths[len(queue)] += 1
+                next_index = heapq.heappop(queue)[-1]
+                cpu_switches[cpu] += 1
+                time += context_switch_time
+                if time > end_time:
+                    end_time = time
+                start(cpu, next_index, time)
+                if shared and idle_heap:
+                    wake_idle(time)
+                continue
+            
+            emit(workload.process_id(index), run_start[cpu], time)
+            if slot_cpus is not None:
+                slot_cpus.append(cpu)
+            busy_times[cpu] += time - run_start[cpu]
+            if time > end_time:
+                end_time = time
+            
+            if kind == _SLICE:
+                remaining_times[index] = run_remaining[cpu] - min(time_quantum, run_remaining[cpu])
+                if remaining_times[index] == 0:
+                    completion_times[index] = time
+                    completed_count += 1
+                else:
+                    queue_index = 0 if shared else cpu
+                    push(queues[queue_index], index)
+                    notify(queue_index, None, time)
+                running[cpu] = -1
+                cpu_switches[cpu] += 1
+                time += context_switch_time
+                if time > end_time:
+                    end_time = time
+                schedule_dispatch(cpu, time)
+                continue
+            
+            remaining_times[index] = 0
+            completion_times[index] = time
+            completed_count += 1
+            running[cpu] = -1
+            running_keys[cpu] = None
+            if not preemptive:
+                if completed_count < process_count:
+                    cpu_switches[cpu] += 1
+                    time += context_switch_time
+                    if time > end_time:
+                        end_time = time
+                schedule_dispatch(cpu, time)
+            else:
+                dispatch(cpu, time)
+        
+        stats.migrations = migrations
+        stats.slot_cpus = slot_cpus
+        return sum(cpu_switches), end_time
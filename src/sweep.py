@@ -0,0 +1,116 @@
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .binary_workload import write_workload
+from .parallel_runner import _worker_workload
+from .scheduling_algorithms import ALGORITHMS, SchedulingAlgorithm
+from .slot_sinks import NullSlotSink
+from .workload import as_workload
+
+@dataclass
+class SweepPoint:
+    algorithm_name: str
+    time_quantum: Optional[float]
+    context_switch_time: float
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    execution_time: float = 0
+
+def parse_values(spec: str) -> List[float]:
+    # "1,2,4" liste, "1:8" ya da "0.5:4:0.5" başlangıç:bitiş[:adım] (bitiş dahil)
+    values = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if ':' in part:
+            bounds = [float(x) for x in part.split(':')]
+            if len(bounds) not in (2, 3):
+                raise ValueError(f"Geçersiz aralık: {part}")
+            start, stop = bounds[0], bounds[1]
+            step = bounds[2] if len(bounds) == 3 else 1
+            if step <= 0:
+                raise ValueError(f"Aralık adımı pozitif olmalıdır: {part}")
+            count = int((stop - start) / step + 1e-9) + 1
+            values.extend(round(start + i * step, 10) for i in range(count))
+        else:
+            values.append(float(part))
+    return [int(v) if float(v).is_integer() else v for v in values]
+
+def select_algorithms(names: Optional[Iterable[str]] = None) -> List[Tuple[str, str, dict]]:
+    if not names:
+        return list(ALGORITHMS)
+    selected = []
+    known = {entry[0].lower(): entry for entry in ALGORITHMS}
+    for name in names:
+        entry = known.get(name.strip().lower())
+        if entry is None:
+            raise ValueError(f"Bilinmeyen algoritma: {name} (bilinenler: {', '.join(e[0] for e in ALGORITHMS)})")
+        if entry not in selected:
+            selected.append(entry)
+    return selected
+
+def _run_sweep_task(task):
+    workload_path, algorithm_name, method_name, kwargs, context_switch_time, throughput_horizons = task
+    workload = _worker_workload(workload_path)
+    scheduler = SchedulingAlgorithm(context_switch_time)
+    
+    start_time = time.perf_counter()
+    # Taramada yalnızca metrikler gerekir; dilimler tutulmaz
+    result = getattr(scheduler, method_name)(workload, sink=NullSlotSink(), **kwargs)
+    execution_time = time.perf_counter() - start_time
+    
+    return SweepPoint(
+        algorithm_name=algorithm_name,
+        time_quantum=kwargs.get("time_quantum"),
+        context_switch_time=context_switch_time,
+        metrics=result.calculate_metrics(throughput_horizons) or {},
+        execution_time=execution_time
+    )
+
+class SweepRunner:
+    def __init__(self, quanta: Iterable[float] = (2,), context_switch_times: Iterable[float] = (0.001,),
+                 algorithms: Optional[List[Tuple[str, str, dict]]] = None, max_workers: Optional[int] = None,
+                 throughput_horizons: Optional[Iterable[float]] = None):
+        self.quanta = list(quanta)
+        self.context_switch_times = list(context_switch_times)
+        self.algorithms = algorithms or ALGORITHMS
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.throughput_horizons = tuple(throughput_horizons) if throughput_horizons else None
+    
+    def grid(self) -> List[Tuple[str, str, dict, float]]:
+        points = []
+        for algorithm_name, method_name, kwargs in self.algorithms:
+            # Kuantum yalnızca onu kullanan algoritmalar için taranır
+            variants = ([dict(kwargs, time_quantum=q) for q in self.quanta]
+                        if "time_quantum" in kwargs else [kwargs])
+            for variant in variants:
+                for context_switch_time in self.context_switch_times:
+                    points.append((algorithm_name, method_name, variant, context_switch_time))
+        return points
+    
+    def run(self, processes, progress=None) -> List[SweepPoint]:
+        workload = as_workload(processes)
+        grid = self.grid()
+        temp_dir = tempfile.mkdtemp(prefix="cpu_tarama_")
+        
+        try:
+            workload_path = os.path.join(temp_dir, "tarama.cpuw")
+            write_workload(workload, workload_path)
+            tasks = [(workload_path, algorithm_name, method_name, kwargs, context_switch_time,
+                      self.throughput_horizons)
+                     for algorithm_name, method_name, kwargs, context_switch_time in grid]
+            
+            points = []
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+                for point in executor.map(_run_sweep_task, tasks, chunksize=max(1, len(tasks) // (4 * self.max_workers))):
+                    points.append(point)
+                    if progress is not None:
+                        progress(point)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        
+        return points
@@ -0,0 +1,140 @@
+from array import array
+from typing import List, Optional, Union
+from .process import Process, SchedulingResult
+from .profiling import Profiler
+from .scheduling_algorithms import SchedulingAlgorithm
+from .slot_sinks import SlotSink
+from .timeline import Timeline
+from .workload import Workload, ProcessView, as_workload
+
+# Zaman birimi cinsinden verilen ve tik modunda tike çevrilen algoritma parametreleri
+TICK_PARAMETERS = ("time_quantum", "target_latency", "min_granularity", "wakeup_granularity", "boost_interval")
+
+class TickScale:
+    def __init__(self, resolution: int):
+        if not isinstance(resolution, int) or resolution < 1:
+            raise ValueError("Tik çözünürlüğü pozitif bir tam sayı olmalıdır")
+        self.resolution = resolution
+    
+    def to_ticks(self, value: float, name: str = "değer") -> int:
+        scaled = value * self.resolution
+        ticks = round(scaled)
+        # Kayan nokta birikiminden gelen küçük sapmalar en yakın tike yuvarlanır; tik ızgarasına
+        # düşmeyen değerler (örn. 1000 tikte 0.0005) reddedilir
+        if abs(scaled - ticks) > 1e-6:
+            raise ValueError(f"{name} {value!r}, {self.resolution} tik çözünürlüğünde tam olarak temsil edilemiyor")
+        return ticks
+    
+    def to_units(self, ticks: float) -> float:
+        return ticks / self.resolution
+    
+    @property
+    def decimals(self) -> int:
+        # 1/çözünürlük sonlu bir ondalık ise basamak sayısı, değilse çözünürlüğü ayırt edecek kadar basamak
+        remainder = self.resolution
+        twos = fives = 0
+        while remainder % 2 == 0:
+            remainder //= 2
+            twos += 1
+        while remainder % 5 == 0:
+            remainder //= 5
+            fives += 1
+        return max(twos, fives) if remainder == 1 else len(str(self.resolution))
+    
+    def workload(self, workload: Workload) -> Workload:
+        to_ticks = self.to_ticks
+        return Workload(
+            workload.id_table,
+            workload.id_index,
+            array('q', [to_ticks(value, "varış zamanı") for value in workload.arrival_times]),
+            array('q', [to_ticks(value, "patlama süresi") for value in workload.burst_times]),
+            workload.priorities
+        )
+
+class TickSlotSink(SlotSink):
+    def __init__(self, downstream: SlotSink, resolution: int):
+        self.downstream = downstream
+        self.resolution = resolution
+    
+    def emit(self, process_id: str, start_time: float, end_time: float):
+        # Her sınır tik sayısından bir kez çevrilir; dilimler boyunca yuvarlama hatası birikmez
+        self.downstream.emit(process_id, start_time / self.resolution, end_time / self.resolution)
+
+class TickScheduler:
+    def __init__(self, time_resolution: int, context_switch_time=0.001):
+        self.scale = TickScale(time_resolution)
+        self.time_resolution = time_resolution
+        self.context_switch_time = context_switch_time
+        self.engine = SchedulingAlgorithm(self.scale.to_ticks(context_switch_time, "bağlam değiştirme süresi"),
+                                          time_unit=time_resolution)
+    
+    def schedule_fcfs(self, processes: Union[List[Process], Workload],
+                      sink: Optional[SlotSink] = None,
+                      profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return self._run("schedule_fcfs", processes, sink, profiler)
+    
+    def schedule_preemptive_sjf(self, processes: Union[List[Process], Workload],
+                                sink: Optional[SlotSink] = None,
+                                profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return self._run("schedule_preemptive_sjf", processes, sink, profiler)
+    
+    def schedule_non_preemptive_sjf(self, processes: Union[List[Process], Workload],
+                                    sink: Optional[SlotSink] = None,
+                                    profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return self._run("schedule_non_preemptive_sjf", processes, sink, profiler)
+    
+    def schedule_round_robin(self, processes: Union[List[Process], Workload], time_quantum: float = 2,
+                             sink: Optional[SlotSink] = None,
+                             profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return self._run("schedule_round_robin", processes, sink, profiler, time_quantum=time_quantum)
+    
+    def schedule_preemptive_priority(self, processes: Union[List[Process], Workload],
+                                     sink: Optional[SlotSink] = None,
+                                     profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return self._run("schedule_preemptive_priority", processes, sink, profiler)
+    
+    def schedule_non_preemptive_priority(self, processes: Union[List[Process], Workload],
+                                         sink: Optional[SlotSink] = None,
+                                         profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return self._run("schedule_non_preemptive_priority", processes, sink, profiler)
+    
+    def schedule_cfs(self, processes: Union[List[Process], Workload], target_latency: float = 6,
+                     min_granularity: float = 1, wakeup_granularity: float = 1,
+                     sink: Optional[SlotSink] = None,
+                     profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return self._run("schedule_cfs", processes, sink, profiler, target_latency=target_latency,
+                         min_granularity=min_granularity, wakeup_granularity=wakeup_granularity)
+    
+    def schedule_mlfq(self, processes: Union[List[Process], Workload], time_quantum: float = 2, levels: int = 3,
+                      boost_interval: float = 50, sink: Optional[SlotSink] = None,
+                      profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return self._run("schedule_mlfq", processes, sink, profiler, time_quantum=time_quantum, levels=levels,
+                         boost_interval=boost_interval)
+    
+    def _run(self, method_name: str, processes, sink: Optional[SlotSink], profiler: Optional[Profiler],
+             **kwargs) -> SchedulingResult:
+        scale = self.scale
+        workload = as_workload(processes)
+        parameters = {name: scale.to_ticks(value, name) if name in TICK_PARAMETERS else value
+                      for name, value in kwargs.items()}
+        
+        # Motor tam sayı tikler üzerinde çalışır; sonuçlar zaman birimine yalnızca sınırda çevrilir
+        engine_sink = TickSlotSink(sink if sink is not None else Timeline(), scale.resolution)
+        result = getattr(self.engine, method_name)(scale.workload(workload), sink=engine_sink, profiler=profiler,
+                                                   **parameters)
+        
+        state = result.state
+        if state is not None:
+            state.remaining_times = array('d', map(scale.to_units, state.remaining_times))
+            state.start_times = array('d', map(scale.to_units, state.start_times))
+            state.completion_times = array('d', map(scale.to_units, state.completion_times))
+            if processes is workload:
+                result.processes = ProcessView(workload, state)
+            else:
+                state.apply_to(processes)
+                result.processes = processes
+        result.workload = workload
+        result.total_time = scale.to_units(result.total_time)
+        if result.busy_time is not None:
+            result.busy_time = scale.to_units(result.busy_time)
+        return result
@@ -0,0 +1,138 @@
+import itertools
+import operator
+import struct
+import sys
+from array import array
+from typing import Iterable, Iterator, List, Optional
+from .process import TimeSlot
+from .slot_sinks import SlotSink, format_time_slot_line
+
+IDLE_INDEX = 0
+
+_MAGIC = b'CPUT'
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct('<4sHHQQQ')
+
+class Timeline(SlotSink):
+    def __init__(self):
+        self.names: List[str] = ["IDLE"]
+        self._name_index = {"IDLE": IDLE_INDEX}
+        self.start_times = array('d')
+        self.end_times = array('d')
+        self.process_indices = array('i')
+    
+    def emit(self, process_id: str, start_time: float, end_time: float):
+        index = self._name_index.get(process_id)
+        if index is None:
+            index = self._name_index[process_id] = len(self.names)
+            self.names.append(sys.intern(process_id))
+        self.start_times.append(start_time)
+        self.end_times.append(end_time)
+        self.process_indices.append(index)
+    
+    def index_of(self, process_id: str) -> int:
+        index = self._name_index.get(process_id)
+        if index is None:
+            index = self._name_index[process_id] = len(self.names)
+            self.names.append(sys.intern(process_id))
+        return index
+    
+    def extend_columns(self, process_indices, start_times, end_times):
+        # Sütunlar tampon protokolünü destekleyen 'i' ve 'd' dizileri olarak topluca eklenir
+        self.start_times.frombytes(memoryview(start_times).cast('B'))
+        self.end_times.frombytes(memoryview(end_times).cast('B'))
+        self.process_indices.frombytes(memoryview(process_indices).cast('B'))
+    
+    def append(self, time_slot: TimeSlot):
+        self.emit(time_slot.process_id, time_slot.start_time, time_slot.end_time)
+    
+    def result(self):
+        return self
+    
+    def __len__(self):
+        return len(self.start_times)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        return TimeSlot(self.names[self.process_indices[index]], self.start_times[index], self.end_times[index])
+    
+    def __iter__(self) -> Iterator[TimeSlot]:
+        names = self.names
+        for process_index, start_time, end_time in zip(self.process_indices, self.start_times, self.end_times):
+            yield TimeSlot(names[process_index], start_time, end_time)
+    
+    def __eq__(self, other):
+        if isinstance(other, Timeline):
+            return (self.start_times == other.start_times and self.end_times == other.end_times
+                    and [self.names[i] for i in self.process_indices] == [other.names[i] for i in other.process_indices])
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+    
+    def format_lines(self, start: int = 0, stop: Optional[int] = None, step: int = 1, decimals: int = 0) -> str:
+        labels = [" ] - - %s - - [ " % ("BOŞTA" if index == IDLE_INDEX else name)
+                  for index, name in enumerate(self.names)]
+        window = slice(start, stop, step)
+        time_format = "%%%d.%df" % (decimals + 5, decimals) if decimals else "%4d"
+        line_format = "[ " + time_format + "%s" + time_format + " ]\n"
+        return "".join([line_format % (start_time, labels[process_index], end_time)
+                        for process_index, start_time, end_time in zip(self.process_indices[window],
+                                                                       self.start_times[window],
+                                                                       self.end_times[window])])
+    
+    def busy_mask(self):
+        return map(bool, self.process_indices)
+    
+    def durations(self):
+        return map(operator.sub, self.end_times, self.start_times)
+    
+    def busy_time(self) -> float:
+        return sum(itertools.compress(self.durations(), self.busy_mask()))
+    
+    def idle_time(self) -> float:
+        return sum(itertools.compress(self.durations(), map(operator.not_, self.process_indices)))
+    
+    def save(self, path: str):
+        blob = '\x00'.join(self.names).encode('utf-8')
+        flags = 1 if sys.byteorder == 'big' else 0
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, flags, len(self), len(self.names), len(blob)))
+            f.write(blob)
+            self.start_times.tofile(f)
+            self.end_times.tofile(f)
+            self.process_indices.tofile(f)
+    
+    @classmethod
+    def load(cls, path: str) -> 'Timeline':
+        with open(path, 'rb') as f:
+            magic, version, flags, slot_count, name_count, blob_size = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC or version != _FORMAT_VERSION:
+                raise ValueError(f"Geçersiz zaman çizelgesi dosyası: {path}")
+            
+            timeline = cls()
+            timeline.names = [sys.intern(name) for name in f.read(blob_size).decode('utf-8').split('\x00')][:name_count]
+            timeline._name_index = {name: index for index, name in enumerate(timeline.names)}
+            timeline.start_times.fromfile(f, slot_count)
+            timeline.end_times.fromfile(f, slot_count)
+            timeline.process_indices.fromfile(f, slot_count)
+        
+        if bool(flags & 1) != (sys.byteorder == 'big'):
+            timeline.start_times.byteswap()
+            timeline.end_times.byteswap()
+            timeline.process_indices.byteswap()
+        return timeline
+    
+    @classmethod
+    def from_slots(cls, time_slots: Iterable[TimeSlot]) -> 'Timeline':
+        timeline = cls()
+        for time_slot in time_slots:
+            timeline.append(time_slot)
+        return timeline
+
+def format_time_slot_lines(time_slots, start: int = 0, stop: Optional[int] = None, step: int = 1,
+                           decimals: int = 0) -> str:
+    if isinstance(time_slots, Timeline):
+        return time_slots.format_lines(start, stop, step, decimals)
+    return "".join([format_time_slot_line(slot.process_id, slot.start_time, slot.end_time, decimals)
+                    for slot in time_slots[start:stop:step]])
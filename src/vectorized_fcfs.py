@@ -0,0 +1,243 @@
+from typing import Iterable, List, Optional
+from .process import SchedulingResult, _horizon_label, DEFAULT_THROUGHPUT_HORIZONS
+from .profiling import Profiler
+from .slot_sinks import SlotSink
+from .timeline import Timeline, IDLE_INDEX
+from .workload import Workload, RunState, as_workload, run_engine
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Bu boyutun altındaki iş yüklerinde dizi hazırlama maliyeti kazancı aşar
+VECTORIZE_THRESHOLD = 4096
+
+def _segmented_accumulate(ufunc, values, starts, lengths, fill):
+    # Her parça kendi içinde baştan sona biriktirilir; ufunc.accumulate satır boyunca sıralı
+    # işlediği için sonuçlar Python döngüsündeki toplamlarla bit düzeyinde aynıdır. Parçalar
+    # ikinin kuvveti genişliklerde gruplanır, böylece dolgu toplam boyutu en fazla iki katına çıkarır
+    result = np.empty_like(values)
+    padded = np.append(values, fill)
+    widths = np.ceil(np.log2(np.maximum(lengths, 1))).astype(np.int64)
+    for width in np.unique(widths):
+        rows = widths == width
+        columns = np.arange(1 << int(width))
+        mask = columns < lengths[rows][:, None]
+        index = np.where(mask, starts[rows][:, None] + columns, len(values))
+        result[index[mask]] = ufunc.accumulate(padded[index], axis=1)[mask]
+    return result
+
+def _fcfs_columns(arrival_times, burst_times, first, context_switch_time):
+    # Girdiler varış sırasındadır; first her iş yükünün ilk sürecini işaretler.
+    # Yakın başlangıç tahmini kapalı formdan (birikimli toplam ve birikimli en büyük) alınır,
+    # ardından boşta kalma sınırları kesin zamanlarla tutarlı hale gelene kadar düzeltilir
+    count = len(arrival_times)
+    workload_starts = np.flatnonzero(first)
+    workload_lengths = np.diff(np.append(workload_starts, count))
+    first_starts = np.maximum(arrival_times[first], 0.0)
+    
+    steps = burst_times + context_switch_time
+    offsets = _segmented_accumulate(np.add, steps, workload_starts, workload_lengths, 0.0) - steps
+    lower_bounds = arrival_times - offsets
+    lower_bounds[first] = first_starts
+    latest = _segmented_accumulate(np.maximum, lower_bounds, workload_starts, workload_lengths, -np.inf)
+    segment_start = first.copy()
+    segment_start[1:] |= lower_bounds[1:] > latest[:-1]
+    
+    while True:
+        segment_starts = np.flatnonzero(segment_start)
+        segment_lengths = np.diff(np.append(segment_starts, count))
+        
+        # Süreç başına iki adım: (başlangıç ya da bağlam değiştirme), patlama süresi
+        values = np.empty(2 * count)
+        values[0::2] = context_switch_time
+        values[1::2] = burst_times
+        dispatch_values = values[0::2]
+        dispatch_values[segment_start] = arrival_times[segment_start]
+        dispatch_values[first] = first_starts
+        times = _segmented_accumulate(np.add, values, 2 * segment_starts, 2 * segment_lengths, 0.0)
+        start_times = times[0::2]
+        completion_times = times[1::2]
+        
+        ready_times = np.empty(count)
+        ready_times[0] = 0.0
+        ready_times[1:] = completion_times[:-1] + context_switch_time
+        ready_times[first] = 0.0
+        expected = first.copy()
+        expected[1:] |= arrival_times[1:] > ready_times[1:]
+        if np.array_equal(expected, segment_start):
+            return start_times, completion_times, ready_times, segment_start
+        segment_start = expected
+
+def _emit_slots(workload: Workload, order, sorted_arrivals, start_times, completion_times, ready_times,
+                segment_start, sink: SlotSink):
+    count = len(order)
+    idle = segment_start & (sorted_arrivals > ready_times)
+    positions = np.arange(count) + np.cumsum(idle)
+    slot_count = count + int(np.count_nonzero(idle))
+    slot_starts = np.empty(slot_count)
+    slot_ends = np.empty(slot_count)
+    slot_names = np.empty(slot_count, dtype=np.int64)
+    slot_starts[positions] = start_times
+    slot_ends[positions] = completion_times
+    slot_names[positions] = np.frombuffer(workload.id_index, dtype=np.int64)[order]
+    idle_positions = positions[idle] - 1
+    slot_starts[idle_positions] = ready_times[idle]
+    slot_ends[idle_positions] = sorted_arrivals[idle]
+    slot_names[idle_positions] = -1
+    
+    if type(sink) is Timeline:
+        # Son eleman boşta dilimlerini (-1) karşılar
+        lookup = np.array([sink.index_of(name) for name in workload.id_table] + [IDLE_INDEX], dtype=np.int32)
+        sink.extend_columns(lookup[slot_names], slot_starts, slot_ends)
+    else:
+        id_table = workload.id_table
+        emit = sink.emit
+        for name, start_time, end_time in zip(slot_names.tolist(), slot_starts.tolist(), slot_ends.tolist()):
+            emit("IDLE" if name < 0 else id_table[name], start_time, end_time)
+
+class VectorizedFCFS:
+    def __init__(self, context_switch_time=0.001):
+        if not HAS_NUMPY:
+            raise ImportError("Vektörleştirilmiş FCFS için numpy gereklidir")
+        self.context_switch_time = context_switch_time
+    
+    def run(self, processes, sink: Optional[SlotSink] = None,
+            profiler: Optional[Profiler] = None) -> SchedulingResult:
+        return run_engine("FCFS", processes, self.dispatch, sink, profiler)
+    
+    def dispatch(self, workload: Workload, state: RunState, sink: SlotSink, profiler: Optional[Profiler] = None):
+        count = len(workload)
+        # Tik modunda sütunlar tam sayıdır; toplamlar tam sayı değerli kaldığından kesindir
+        arrival_times = np.asarray(workload.arrival_times)
+        burst_times = np.asarray(workload.burst_times)
+        order = np.argsort(arrival_times, kind='stable')
+        sorted_arrivals = arrival_times[order]
+        first = np.zeros(count, dtype=bool)
+        first[0] = True
+        
+        start_times, completion_times, ready_times, segment_start = _fcfs_columns(
+            sorted_arrivals, burst_times[order], first, self.context_switch_time)
+        
+        np.frombuffer(state.start_times, dtype=np.float64)[order] = start_times
+        np.frombuffer(state.completion_times, dtype=np.float64)[order] = completion_times
+        np.frombuffer(state.remaining_times, dtype=state.remaining_times.typecode)[:] = 0
+        
+        if profiler is not None:
+            # Dağıtım anında kuyrukta bekleyenler: o ana kadar varanlardan henüz dağıtılmamış olanlar
+            arrived = np.searchsorted(sorted_arrivals, start_times, side='right')
+            lengths, counts = np.unique(arrived - np.arange(count), return_counts=True)
+            histogram = profiler.histogram("ready_queue")
+            for length, length_count in zip(lengths.tolist(), counts.tolist()):
+                histogram[length] += length_count
+        
+        _emit_slots(workload, order, sorted_arrivals, start_times, completion_times, ready_times, segment_start, sink)
+        return count - 1, float(completion_times[-1])
+
+class FCFSBatch:
+    def __init__(self, workloads: List[Workload], context_switch_time: float, offsets, orders, sorted_arrivals,
+                 start_times, completion_times, ready_times, segment_start):
+        self.workloads = workloads
+        self.context_switch_time = context_switch_time
+        self.offsets = offsets
+        self.orders = orders
+        self.sorted_arrivals = sorted_arrivals
+        self.start_times = start_times
+        self.completion_times = completion_times
+        self.ready_times = ready_times
+        self.segment_start = segment_start
+        idle = segment_start & (sorted_arrivals > ready_times)
+        self.idle_times = np.add.reduceat(np.where(idle, sorted_arrivals - ready_times, 0.0), offsets[:-1])
+        self.total_times = completion_times[offsets[1:] - 1]
+    
+    def __len__(self):
+        return len(self.workloads)
+    
+    def completion_columns(self, index: int):
+        # Başlangıç ve tamamlanma zamanları iş yükünün girdi sırasında döndürülür
+        begin, end = self.offsets[index], self.offsets[index + 1]
+        order = self.orders[begin:end]
+        start_times = np.empty(end - begin)
+        completion_times = np.empty(end - begin)
+        start_times[order] = self.start_times[begin:end]
+        completion_times[order] = self.completion_times[begin:end]
+        return start_times, completion_times
+    
+    def result(self, index: int, sink: Optional[SlotSink] = None) -> SchedulingResult:
+        begin, end = self.offsets[index], self.offsets[index + 1]
+        window = slice(begin, end)
+        
+        def engine(workload, state, engine_sink, profiler):
+            start_times, completion_times = self.completion_columns(index)
+            np.frombuffer(state.start_times, dtype=np.float64)[:] = start_times
+            np.frombuffer(state.completion_times, dtype=np.float64)[:] = completion_times
+            np.frombuffer(state.remaining_times, dtype=np.float64)[:] = 0
+            _emit_slots(workload, self.orders[window], self.sorted_arrivals[window], self.start_times[window],
+                        self.completion_times[window], self.ready_times[window], self.segment_start[window],
+                        engine_sink)
+            return end - begin - 1, float(self.total_times[index])
+        
+        return run_engine("FCFS", self.workloads[index], engine, sink)
+    
+    def metrics(self, throughput_horizons: Optional[Iterable[float]] = None) -> List[dict]:
+        horizons = set(DEFAULT_THROUGHPUT_HORIZONS)
+        if throughput_horizons is not None:
+            horizons.update(throughput_horizons)
+        horizons = sorted(horizons)
+        
+        durations = self.completion_times - self.start_times
+        all_metrics = []
+        for index, workload in enumerate(self.workloads):
+            begin, end = self.offsets[index], self.offsets[index + 1]
+            _, completion_times = self.completion_columns(index)
+            turnaround_times = completion_times - np.frombuffer(workload.arrival_times, dtype=np.float64)
+            waiting_times = (turnaround_times - np.frombuffer(workload.burst_times, dtype=np.float64)).tolist()
+            turnaround_times = turnaround_times.tolist()
+            
+            # Toplamlar calculate_metrics ile aynı sırada alınır; sonuçlar bit düzeyinde eşleşir
+            total_time = float(self.total_times[index])
+            busy_time = sum(durations[begin:end].tolist())
+            metrics = {
+                'avg_waiting_time': sum(waiting_times) / len(waiting_times),
+                'max_waiting_time': max(waiting_times),
+                'avg_turnaround_time': sum(turnaround_times) / len(turnaround_times),
+                'max_turnaround_time': max(turnaround_times),
+                'cpu_efficiency': (busy_time / total_time * 100) if total_time > 0 else 0,
+                'context_switches': int(end - begin - 1)
+            }
+            finished = np.sort(completion_times[completion_times != 0])
+            curve = list(zip(horizons, np.searchsorted(finished, horizons, side='right').tolist()))
+            for horizon, completed in curve:
+                metrics[f'throughput_{_horizon_label(horizon)}'] = completed
+            metrics['throughput_curve'] = curve
+            all_metrics.append(metrics)
+        return all_metrics
+
+def schedule_fcfs_batch(workloads: Iterable, context_switch_time=0.001) -> FCFSBatch:
+    if not HAS_NUMPY:
+        raise ImportError("Vektörleştirilmiş FCFS için numpy gereklidir")
+    workloads = [as_workload(w) for w in workloads]
+    if not workloads or any(len(w) == 0 for w in workloads):
+        raise ValueError("Toplu FCFS en az bir boş olmayan iş yükü gerektirir")
+    
+    lengths = np.array([len(w) for w in workloads], dtype=np.int64)
+    offsets = np.zeros(len(workloads) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    
+    # Tüm iş yükleri uç uca eklenip tek çağrıda zamanlanır; her iş yükü kendi sırasında kalır
+    orders = np.concatenate([np.argsort(np.frombuffer(w.arrival_times, dtype=np.float64), kind='stable')
+                             for w in workloads])
+    arrival_times = np.concatenate([np.frombuffer(w.arrival_times, dtype=np.float64) for w in workloads])
+    burst_times = np.concatenate([np.frombuffer(w.burst_times, dtype=np.float64) for w in workloads])
+    global_order = orders + np.repeat(offsets[:-1], lengths)
+    sorted_arrivals = arrival_times[global_order]
+    first = np.zeros(len(arrival_times), dtype=bool)
+    first[offsets[:-1]] = True
+    
+    start_times, completion_times, ready_times, segment_start = _fcfs_columns(
+        sorted_arrivals, burst_times[global_order], first, context_switch_time)
+    return FCFSBatch(workloads, context_switch_time, offsets, orders, sorted_arrivals, start_times,
+                     completion_times, ready_times, segment_start)
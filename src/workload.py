@@ -0,0 +1,194 @@
+import hashlib
+import math
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Iterable, List, Optional
+from .process import Process, Priority, SchedulingResult
+from .profiling import Profiler, profile_phase
+from .slot_sinks import SlotSink, MetricsSlotSink
+from .timeline import Timeline
+
+class Workload:
+    def __init__(self, id_table: List[str], id_index, arrival_times, burst_times, priorities):
+        self.id_table = id_table
+        self.id_index = memoryview(id_index).toreadonly()
+        self.arrival_times = memoryview(arrival_times).toreadonly()
+        self.burst_times = memoryview(burst_times).toreadonly()
+        self.priorities = memoryview(priorities).toreadonly()
+        self._arrival_order = None
+        self._fingerprint = None
+    
+    @classmethod
+    def from_columns(cls, process_ids: Iterable[str], arrival_times: Iterable[float],
+                     burst_times: Iterable[float], priorities: Iterable) -> 'Workload':
+        id_table = []
+        id_lookup = {}
+        id_index = array('q')
+        for process_id in process_ids:
+            position = id_lookup.get(process_id)
+            if position is None:
+                position = id_lookup[process_id] = len(id_table)
+                id_table.append(sys.intern(process_id))
+            id_index.append(position)
+        
+        priority_values = array('b', (_priority_value(p) for p in priorities))
+        return cls(id_table, id_index, array('d', arrival_times), array('d', burst_times), priority_values)
+    
+    @classmethod
+    def from_processes(cls, processes: List[Process]) -> 'Workload':
+        return cls.from_columns(
+            [p.process_id for p in processes],
+            [p.arrival_time for p in processes],
+            [p.cpu_burst_time for p in processes],
+            [p.priority for p in processes]
+        )
+    
+    def __len__(self):
+        return len(self.arrival_times)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                raise ValueError("Workload dilimleri yalnızca adım 1 ile alınabilir")
+            return Workload(
+                self.id_table,
+                self.id_index[index],
+                self.arrival_times[index],
+                self.burst_times[index],
+                self.priorities[index]
+            )
+        return self.process(index)
+    
+    def process_id(self, index: int) -> str:
+        return self.id_table[self.id_index[index]]
+    
+    def process(self, index: int, state: Optional['RunState'] = None) -> Process:
+        if index < 0:
+            index += len(self)
+        process = Process(
+            process_id=self.process_id(index),
+            arrival_time=self.arrival_times[index],
+            cpu_burst_time=self.burst_times[index],
+            priority=Priority(self.priorities[index])
+        )
+        if state is not None:
+            state.apply(index, process)
+        return process
+    
+    def to_processes(self, state: Optional['RunState'] = None) -> List[Process]:
+        return [self.process(i, state) for i in range(len(self))]
+    
+    def arrival_order(self):
+        if self._arrival_order is None:
+            arrivals = self.arrival_times
+            if all(a <= b for a, b in zip(arrivals, arrivals[1:])):
+                self._arrival_order = range(len(arrivals))
+            else:
+                self._arrival_order = sorted(range(len(arrivals)), key=arrivals.__getitem__)
+        return self._arrival_order
+    
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            digest.update('\x00'.join(self.process_id(i) for i in range(len(self))).encode('utf-8'))
+            for column in (self.arrival_times, self.burst_times, self.priorities):
+                digest.update(b'\xff')
+                digest.update(column.cast('B'))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+    
+    def new_state(self) -> 'RunState':
+        return RunState(self.burst_times)
+
+class RunState:
+    __slots__ = ('remaining_times', 'start_times', 'completion_times')
+    
+    def __init__(self, burst_times):
+        # Tik modunda iş yükü sütunları tam sayıdır ('q'); kalan süreler aynı türde tutulur
+        self.remaining_times = array(burst_times.format)
+        self.remaining_times.frombytes(burst_times.cast('B'))
+        self.start_times = array('d', [math.nan]) * len(burst_times)
+        self.completion_times = array('d', [math.nan]) * len(burst_times)
+    
+    def apply(self, index: int, process: Process):
+        process.reset()
+        process.remaining_time = self.remaining_times[index]
+        start_time = self.start_times[index]
+        completion_time = self.completion_times[index]
+        process.start_time = None if math.isnan(start_time) else start_time
+        process.completion_time = None if math.isnan(completion_time) else completion_time
+    
+    def apply_to(self, processes: List[Process]):
+        for index, process in enumerate(processes):
+            self.apply(index, process)
+
+class ProcessView(Sequence):
+    def __init__(self, workload: Workload, state: Optional[RunState] = None):
+        self.workload = workload
+        self.state = state
+    
+    def __len__(self):
+        return len(self.workload)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.workload.process(i, self.state) for i in range(len(self))[index]]
+        return self.workload.process(index, self.state)
+
+def as_workload(processes) -> Workload:
+    if isinstance(processes, Workload):
+        return processes
+    return Workload.from_processes(processes)
+
+def run_engine(algorithm_name: str, processes, engine, sink: Optional[SlotSink] = None,
+               profiler: Optional[Profiler] = None) -> SchedulingResult:
+    with profile_phase(profiler, "prepare"):
+        workload = as_workload(processes)
+        if len(workload) == 0:
+            if sink is not None:
+                sink.close()
+            return SchedulingResult(algorithm_name, Timeline(), [] if processes is workload else processes, 0, 0,
+                                    profiler=profiler)
+        
+        state = workload.new_state()
+        if sink is None:
+            sink = Timeline()
+            metrics_sink = None
+        else:
+            # Dilimler bellekte tutulmayabileceği için meşgul süre akış sırasında toplanır
+            sink = metrics_sink = MetricsSlotSink(sink)
+    
+    with profile_phase(profiler, "schedule"):
+        context_switches, total_time = engine(workload, state, sink, profiler)
+        sink.close()
+    if profiler is not None:
+        profiler.flush()
+    
+    with profile_phase(profiler, "collect"):
+        if processes is workload:
+            process_list = ProcessView(workload, state)
+        else:
+            # Süreç listesi verildiğinde sonuçlar eskisi gibi girdi nesnelerine yazılır
+            state.apply_to(processes)
+            process_list = processes
+    
+    return SchedulingResult(
+        algorithm_name=algorithm_name,
+        time_slots=sink.result(),
+        processes=process_list,
+        context_switches=context_switches,
+        total_time=total_time,
+        workload=workload,
+        state=state,
+        busy_time=metrics_sink.busy_time if metrics_sink is not None else None,
+        timeline_file=sink.timeline_file,
+        profiler=profiler
+    )
+
+def _priority_value(priority) -> int:
+    if isinstance(priority, Priority):
+        return priority.value
+    if isinstance(priority, str):
+        return Priority[priority.strip().upper()].value
+    return Priority(priority).value
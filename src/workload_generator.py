@@ -0,0 +1,128 @@
+import csv
+import math
+import random
+from array import array
+from typing import Optional, Sequence
+from .process import Priority
+from .workload import Workload
+
+BURST_DISTRIBUTIONS = ("exponential", "pareto", "bimodal", "uniform")
+
+# (HIGH, NORMAL, LOW) ağırlıkları
+PRIORITY_MIXES = {
+    "uniform": (1, 1, 1),
+    "skewed_low": (0.1, 0.3, 0.6),
+    "skewed_high": (0.6, 0.3, 0.1),
+    "mostly_normal": (0.1, 0.8, 0.1)
+}
+
+class WorkloadGenerator:
+    def __init__(self, seed: Optional[int] = None, arrival_rate: float = 0.2,
+                 burst_distribution: str = "exponential", mean_burst: float = 5.0,
+                 pareto_alpha: float = 1.5, bimodal_short: float = 2.0, bimodal_long: float = 20.0,
+                 bimodal_long_fraction: float = 0.2, priority_mix="uniform", integer_times: bool = True):
+        if burst_distribution not in BURST_DISTRIBUTIONS:
+            raise ValueError(f"Geçersiz patlama dağılımı: {burst_distribution}")
+        if arrival_rate <= 0 or mean_burst <= 0:
+            raise ValueError("Varış hızı ve ortalama patlama süresi pozitif olmalıdır")
+        if burst_distribution == "pareto" and pareto_alpha <= 1:
+            raise ValueError("Pareto dağılımı için alpha 1'den büyük olmalıdır")
+        
+        self.seed = seed
+        self.arrival_rate = arrival_rate
+        self.burst_distribution = burst_distribution
+        self.mean_burst = mean_burst
+        self.pareto_alpha = pareto_alpha
+        self.bimodal_short = bimodal_short
+        self.bimodal_long = bimodal_long
+        self.bimodal_long_fraction = bimodal_long_fraction
+        self.priority_weights = _priority_weights(priority_mix)
+        self.integer_times = integer_times
+    
+    def describe(self) -> dict:
+        return {
+            "seed": self.seed,
+            "arrival_rate": self.arrival_rate,
+            "burst_distribution": self.burst_distribution,
+            "mean_burst": self.mean_burst,
+            "pareto_alpha": self.pareto_alpha,
+            "bimodal_short": self.bimodal_short,
+            "bimodal_long": self.bimodal_long,
+            "bimodal_long_fraction": self.bimodal_long_fraction,
+            "priority_weights": list(self.priority_weights),
+            "integer_times": self.integer_times
+        }
+    
+    def generate(self, count: int) -> Workload:
+        rng = random.Random(self.seed)
+        arrival_times = self._arrival_times(rng, count)
+        burst_times = self._burst_times(rng, count)
+        priorities = array('b', (priority.value for priority in rng.choices(
+            (Priority.HIGH, Priority.NORMAL, Priority.LOW), weights=self.priority_weights, k=count)))
+        
+        width = len(str(count))
+        id_table = [f"P{i + 1:0{width}d}" for i in range(count)]
+        return Workload(id_table, array('q', range(count)), arrival_times, burst_times, priorities)
+    
+    def _arrival_times(self, rng: random.Random, count: int) -> array:
+        # Poisson süreci: ardışık varışlar arası süreler üsteldir
+        expovariate = rng.expovariate
+        rate = self.arrival_rate
+        arrival_times = array('d', bytes(8 * count))
+        current_time = 0.0
+        for i in range(1, count):
+            current_time += expovariate(rate)
+            arrival_times[i] = current_time
+        if self.integer_times:
+            arrival_times = array('d', map(math.floor, arrival_times))
+        return arrival_times
+    
+    def _burst_times(self, rng: random.Random, count: int) -> array:
+        if self.burst_distribution == "exponential":
+            rate = 1 / self.mean_burst
+            samples = [rng.expovariate(rate) for _ in range(count)]
+        elif self.burst_distribution == "pareto":
+            # Ortalaması mean_burst olacak şekilde ölçeklenmiş ağır kuyruklu dağılım
+            alpha = self.pareto_alpha
+            scale = self.mean_burst * (alpha - 1) / alpha
+            samples = [scale * rng.paretovariate(alpha) for _ in range(count)]
+        elif self.burst_distribution == "bimodal":
+            short_rate = 1 / self.bimodal_short
+            long_rate = 1 / self.bimodal_long
+            long_fraction = self.bimodal_long_fraction
+            samples = [rng.expovariate(long_rate if rng.random() < long_fraction else short_rate)
+                       for _ in range(count)]
+        else:
+            samples = [rng.uniform(0, 2 * self.mean_burst) for _ in range(count)]
+        
+        if self.integer_times:
+            return array('d', (max(1, math.ceil(sample)) for sample in samples))
+        return array('d', (max(sample, 1e-3) for sample in samples))
+
+def generate_workload(count: int, seed: Optional[int] = None, **options) -> Workload:
+    return WorkloadGenerator(seed, **options).generate(count)
+
+def save_workload_csv(workload: Workload, path: str):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Process_ID', 'Arrival_Time', 'CPU_Burst_Time', 'Priority'])
+        for i in range(len(workload)):
+            writer.writerow([
+                workload.process_id(i),
+                _format_time(workload.arrival_times[i]),
+                _format_time(workload.burst_times[i]),
+                Priority(workload.priorities[i]).name.lower()
+            ])
+
+def _format_time(value: float):
+    return int(value) if value.is_integer() else value
+
+def _priority_weights(priority_mix) -> Sequence[float]:
+    if isinstance(priority_mix, str):
+        if priority_mix not in PRIORITY_MIXES:
+            raise ValueError(f"Geçersiz öncelik karışımı: {priority_mix}")
+        return PRIORITY_MIXES[priority_mix]
+    weights = tuple(priority_mix)
+    if len(weights) != 3 or sum(weights) <= 0:
+        raise ValueError("Öncelik ağırlıkları (HIGH, NORMAL, LOW) şeklinde üç değer olmalıdır")
+    return weights